@@ -1,5 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from apps.core.views import metrics_view
 from . import views
 
 # DRF Router 설정
@@ -11,6 +12,9 @@ urlpatterns = [
     path("", include(router.urls)),
     # 커스텀 API 엔드포인트들
     path("health/", views.health_check, name="health_check"),
+    path("health/ready/", views.readiness_check, name="readiness_check"),
+    # 성능 메트릭 (Prometheus)
+    path("metrics/", metrics_view, name="metrics"),
     # 인증 관련 (필요시 추가)
     # path('auth/', include('rest_framework.urls')),
 ]
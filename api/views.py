@@ -1,22 +1,26 @@
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny
-from rest_framework.response import Response
-from rest_framework import status
 from rest_framework import viewsets
 from django.http import JsonResponse
+from django.views.decorators.http import require_safe
+
+from apps.core.health import liveness, readiness
 
 
 # 헬스 체크용 뷰 (서버가 잘 돌아가는지 확인)
-@api_view(["GET"])
-@permission_classes([AllowAny])
+# 평소에는 HealthCheckMiddleware가 먼저 응답하며, 미들웨어가 빠진 경우에만 호출됨
+@require_safe
 def health_check(request):
     """
-    API 서버 상태 확인용 엔드포인트
+    API 서버 상태 확인용 엔드포인트 (liveness)
+    """
+    return liveness(request)
+
+
+@require_safe
+def readiness_check(request):
+    """
+    DB/캐시/메일 의존성 확인용 엔드포인트 (readiness)
     """
-    return Response(
-        {"status": "ok", "message": "Django API server is running!"},
-        status=status.HTTP_200_OK,
-    )
+    return readiness(request)
 
 
 # 예시용 ViewSet (나중에 실제 모델로 교체)
@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.core"
+    verbose_name = "공통 인프라"
+
+    def ready(self):
+        from django.conf import settings
+
+        # 시리얼라이저 시간 계측 (PerformanceMetricsMiddleware와 함께 사용)
+        if settings.PERF_METRICS_ENABLED:
+            from .perf import install_serializer_timing
+
+            install_serializer_timing()
@@ -0,0 +1,328 @@
+"""
+2단 캐시 백엔드
+
+TieredCache는 프로세스 내 LRU(L1, 짧은 TTL) 뒤에 공유 캐시(L2, Redis 등 다른 CACHES 항목)를 둔다.
+- 조회: L1 → L2 → 미스. L2 히트는 L1_TIMEOUT 동안 L1에 보관
+- 쓰기/삭제: L2와 현재 프로세스의 L1에 반영 (다른 프로세스의 L1은 최대 L1_TIMEOUT 동안 이전 값)
+- get_or_compute: 확률적 조기 만료(XFetch)와 single-flight 재계산으로 캐시 스탬피드 방지
+- 계층별 조회 결과는 /api/metrics/ 의 taskflow_cache_lookups_total로 집계
+
+LocalSharedCache는 테스트/로컬 개발용 L2 대체 구현이다 (같은 LOCATION을 쓰는 인스턴스끼리 공유).
+"""
+
+import math
+import pickle
+import random
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from .perf import record_cache_lookup
+
+_MISSING = object()
+
+# LOCATION별 L1 저장소 (caches[]는 스레드마다 백엔드 인스턴스를 만들므로 모듈 수준에서 공유)
+_l1_stores = {}
+_l1_stores_lock = threading.Lock()
+
+# 프로세스 내 single-flight: key -> 진행 중인 계산
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+class LRUStore:
+    """
+    크기 제한이 있는 LRU + TTL 저장소 (값은 pickle로 복사해서 보관)
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=_MISSING):
+        with self.lock:
+            item = self.data.get(key)
+            if item is None:
+                return default
+            expires_at, blob = item
+            if expires_at <= time.monotonic():
+                del self.data[key]
+                return default
+            self.data.move_to_end(key)
+        return pickle.loads(blob)
+
+    def set(self, key, value, timeout):
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.data[key] = (time.monotonic() + timeout, blob)
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_entries:
+                self.data.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.data.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+    def __len__(self):
+        return len(self.data)
+
+
+class Flight:
+    """single-flight 진행 중인 계산"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = _MISSING
+
+
+class TieredCache(BaseCache):
+    """
+    CACHES 설정 예:
+
+        "default": {
+            "BACKEND": "apps.core.cache.TieredCache",
+            "LOCATION": "default",
+            "OPTIONS": {"L2": "shared", "L1_MAX_ENTRIES": 1000, "L1_TIMEOUT": 5},
+        }
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self.l2_alias = options.get("L2", "shared")
+        self.l1_timeout = options.get("L1_TIMEOUT", 5)
+        self.lock_timeout = options.get("LOCK_TIMEOUT", 10)
+        with _l1_stores_lock:
+            self.l1 = _l1_stores.setdefault(
+                location or "default", LRUStore(options.get("L1_MAX_ENTRIES", 1000))
+            )
+
+    @property
+    def l2(self):
+        return caches[self.l2_alias]
+
+    def l1_timeout_for(self, timeout):
+        """L1 보관 시간 (L2 TTL보다 길지 않게)"""
+        timeout = self.get_backend_timeout(timeout)
+        if timeout is None:
+            return self.l1_timeout
+        return min(self.l1_timeout, max(timeout - time.time(), 0))
+
+    def get(self, key, default=None, version=None):
+        l1_key = self.make_and_validate_key(key, version=version)
+        value = self.l1.get(l1_key)
+        if value is not _MISSING:
+            record_cache_lookup("l1")
+            return value
+
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            record_cache_lookup("miss")
+            return default
+        record_cache_lookup("l2")
+        self.l1.set(l1_key, value, self.l1_timeout)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remaining = []
+        for key in keys:
+            value = self.l1.get(self.make_and_validate_key(key, version=version))
+            if value is _MISSING:
+                remaining.append(key)
+            else:
+                record_cache_lookup("l1")
+                found[key] = value
+
+        if remaining:
+            fetched = self.l2.get_many(remaining, version=version)
+            for key in remaining:
+                if key in fetched:
+                    record_cache_lookup("l2")
+                    self.l1.set(
+                        self.make_key(key, version=version),
+                        fetched[key],
+                        self.l1_timeout,
+                    )
+                else:
+                    record_cache_lookup("miss")
+            found.update(fetched)
+        return found
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l1_key = self.make_and_validate_key(key, version=version)
+        self.l2.set(key, value, timeout, version=version)
+        self.set_l1(l1_key, value, timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l1_key = self.make_and_validate_key(key, version=version)
+        if not self.l2.add(key, value, timeout, version=version):
+            return False
+        self.set_l1(l1_key, value, timeout)
+        return True
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.l2.set_many(data, timeout, version=version)
+        for key, value in data.items():
+            if key not in failed:
+                self.set_l1(self.make_key(key, version=version), value, timeout)
+        return failed
+
+    def set_l1(self, l1_key, value, timeout):
+        l1_timeout = self.l1_timeout_for(timeout)
+        if l1_timeout > 0:
+            self.l1.set(l1_key, value, l1_timeout)
+        else:
+            self.l1.delete(l1_key)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.l2.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self.l1.delete(self.make_and_validate_key(key, version=version))
+        return self.l2.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        for key in keys:
+            self.l1.delete(self.make_and_validate_key(key, version=version))
+        self.l2.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        l1_key = self.make_and_validate_key(key, version=version)
+        if self.l1.get(l1_key) is not _MISSING:
+            return True
+        return self.l2.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        # 카운터는 L1에 두지 않는다 (프로세스마다 다른 값이 보이지 않도록)
+        self.l1.delete(self.make_and_validate_key(key, version=version))
+        return self.l2.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def clear(self):
+        self.l1.clear()
+        self.l2.clear()
+
+    def clear_local(self):
+        """현재 프로세스의 L1만 비움 (테스트/설정 변경 시)"""
+        self.l1.clear()
+
+    def get_or_compute(
+        self, key, compute, timeout=DEFAULT_TIMEOUT, beta=1.0, version=None
+    ):
+        """
+        캐시된 값을 반환하고, 없거나 곧 만료될 값이면 compute()로 다시 계산해 저장
+
+        만료 직전에는 계산 시간(delta)에 비례하는 확률로 미리 재계산하고(XFetch),
+        재계산은 프로세스 내 single-flight + L2 잠금으로 한 곳에서만 실행한다.
+        다른 곳에서 재계산 중이면 이전 값을 그대로 반환한다.
+        """
+        envelope = self.get(key, version=version)
+        if envelope is not None:
+            value, expires_at, delta = envelope
+            if time.time() - delta * beta * math.log(random.random()) < expires_at:
+                return value
+
+        l1_key = self.make_and_validate_key(key, version=version)
+        with _inflight_lock:
+            flight = _inflight.get(l1_key)
+            leader = flight is None
+            if leader:
+                flight = _inflight[l1_key] = Flight()
+
+        if not leader:
+            if envelope is not None:
+                return envelope[0]
+            flight.event.wait(self.lock_timeout)
+            if flight.value is not _MISSING:
+                return flight.value
+            return compute()
+
+        try:
+            flight.value = self.compute_once(
+                key, l1_key, compute, timeout, envelope, version
+            )
+            return flight.value
+        finally:
+            with _inflight_lock:
+                _inflight.pop(l1_key, None)
+            flight.event.set()
+
+    def compute_once(self, key, l1_key, compute, timeout, envelope, version):
+        """L2 잠금을 잡은 프로세스만 재계산 (잠금을 못 잡으면 이전 값 또는 대기)"""
+        lock_key = f"{key}:lock"
+        locked = self.l2.add(lock_key, 1, self.lock_timeout, version=version)
+        if not locked:
+            if envelope is not None:
+                return envelope[0]
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                current = self.l2.get(key, version=version)
+                if current is not None:
+                    self.l1.set(l1_key, current, self.l1_timeout)
+                    return current[0]
+
+        try:
+            started = time.monotonic()
+            value = compute()
+            delta = time.monotonic() - started
+            backend_timeout = self.get_backend_timeout(timeout)
+            expires_at = math.inf if backend_timeout is None else backend_timeout
+            self.set(key, (value, expires_at, delta), timeout, version=version)
+            return value
+        finally:
+            if locked:
+                self.l2.delete(lock_key, version=version)
+
+
+class LocalSharedCache(LocMemCache):
+    """
+    L2 대체 구현 (테스트/로컬 개발)
+    OPTIONS["LATENCY_MS"]로 네트워크 왕복 시간을 흉내낼 수 있다
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self.latency = params.get("OPTIONS", {}).get("LATENCY_MS", 0) / 1000
+
+    def _round_trip(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get(self, *args, **kwargs):
+        self._round_trip()
+        return super().get(*args, **kwargs)
+
+    def set(self, *args, **kwargs):
+        self._round_trip()
+        return super().set(*args, **kwargs)
+
+    def add(self, *args, **kwargs):
+        self._round_trip()
+        return super().add(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        self._round_trip()
+        return super().delete(*args, **kwargs)
+
+    def get_many(self, keys, version=None):
+        self._round_trip()
+        # 여러 키를 한 번의 왕복으로 조회
+        found = {}
+        for key in keys:
+            value = LocMemCache.get(self, key, _MISSING, version=version)
+            if value is not _MISSING:
+                found[key] = value
+        return found
@@ -0,0 +1,155 @@
+"""
+응답 압축 미들웨어
+
+Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip으로 응답을 압축한다.
+COMPRESSION_MIN_SIZE보다 작은 응답, COMPRESSION_CONTENT_TYPES에 없는 타입,
+이미 인코딩된 응답(사전 압축된 정적 파일 등)은 그대로 둔다. 스트리밍 응답은 청크 단위로 압축한다.
+
+BREACH: 비밀 값(토큰 등)과 요청에서 온 값이 한 응답에 같이 들어가면 압축 후 길이로 비밀 값을
+추측할 수 있으므로, 토큰을 발급하는 뷰(COMPRESSION_EXEMPT_VIEWS)나
+exempt_from_compression()으로 표시한 응답은 압축하지 않는다.
+"""
+
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+from .http import brotli, choose_encoding
+
+
+def exempt_from_compression(response):
+    """비밀 값이 포함된 응답을 압축 대상에서 제외"""
+    response.compression_exempt = True
+    return response
+
+
+class GzipCompressor:
+    def __init__(self, level):
+        # wbits=31: gzip 헤더/트레일러 포함
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self.compressor.compress(data)
+
+    def flush(self):
+        return self.compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, quality):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self.compressor.process(data)
+
+    def flush(self):
+        return self.compressor.finish()
+
+
+def make_compressor(encoding):
+    if encoding == "br":
+        return BrotliCompressor(settings.COMPRESSION_BROTLI_QUALITY)
+    return GzipCompressor(settings.COMPRESSION_GZIP_LEVEL)
+
+
+def compress(content, encoding):
+    compressor = make_compressor(encoding)
+    return compressor.compress(content) + compressor.flush()
+
+
+def compress_stream(iterator, encoding):
+    """스트리밍 응답 청크 압축 (압축기가 출력을 모을 때는 빈 청크를 내보내지 않음)"""
+    compressor = make_compressor(encoding)
+    for chunk in iterator:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def compress_async_stream(iterator, encoding):
+    compressor = make_compressor(encoding)
+    async for chunk in iterator:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    brotli/gzip 응답 압축 미들웨어
+    COMPRESSION_ENABLED=False면 미들웨어 체인에서 제외된다
+    ASGI에서는 비동기로 동작한다 (비동기 스트리밍 응답은 compress_async_stream)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.COMPRESSION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.min_size = settings.COMPRESSION_MIN_SIZE
+        self.content_types = frozenset(settings.COMPRESSION_CONTENT_TYPES)
+        self.exempt_views = frozenset(settings.COMPRESSION_EXEMPT_VIEWS)
+        self.encodings = ("br", "gzip") if brotli is not None else ("gzip",)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process(request, await self.get_response(request))
+
+    def process(self, request, response):
+        if not self.should_compress(request, response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request, self.encodings)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compress_async_stream(
+                    response.streaming_content, encoding
+                )
+            else:
+                response.streaming_content = compress_stream(
+                    response.streaming_content, encoding
+                )
+            del response.headers["Content-Length"]
+        else:
+            if len(response.content) < self.min_size:
+                return response
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # 압축 결과는 원본과 바이트 단위로 같지 않으므로 약한 ETag로 변경
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def should_compress(self, request, response):
+        if response.status_code != 200 or response.has_header("Content-Encoding"):
+            return False
+        if getattr(response, "compression_exempt", False):
+            return False
+        match = request.resolver_match
+        if match is not None and match.view_name in self.exempt_views:
+            return False
+        content_type = response.get("Content-Type", "").split(";", 1)[0].strip()
+        return content_type in self.content_types
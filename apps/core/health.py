@@ -0,0 +1,232 @@
+"""
+헬스 체크 (liveness/readiness)
+
+로드밸런서가 높은 빈도로 호출하므로 미들웨어 체인 맨 앞에서 처리하고,
+readiness 결과는 HEALTH_CHECK_CACHE_SECONDS 동안 프로세스 내에 캐싱한다.
+"""
+
+import copy
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.core.mail import get_connection
+from django.db import connections
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+
+LIVENESS_BODY = json.dumps(
+    {"status": "ok", "message": "Django API server is running!"}
+).encode()
+
+# Redis 캐시 백엔드별 (연결, 읽기/쓰기) 제한 시간 옵션 이름
+REDIS_TIMEOUT_OPTIONS = {
+    "django_redis.cache.RedisCache": ("SOCKET_CONNECT_TIMEOUT", "SOCKET_TIMEOUT"),
+    "django.core.cache.backends.redis.RedisCache": (
+        "socket_connect_timeout",
+        "socket_timeout",
+    ),
+}
+
+_lock = threading.Lock()
+_cached_result = None
+_cached_at = 0.0
+_probe_cache = None
+_running = {}  # 프로브 이름 -> 실행 중이거나 마지막으로 실행한 Future
+
+
+def probe_timeout():
+    """DB 드라이버 옵션용 제한 시간 (정수 초, 최소 1초)"""
+    return max(math.ceil(settings.HEALTH_CHECK_TIMEOUT), 1)
+
+
+def probe_database():
+    """기본 DB 연결 확인 (프로브 전용 연결에 연결/쿼리 제한 시간을 걸어 멈추지 않게 함)"""
+    connection = connections["default"].copy()
+    timeout = probe_timeout()
+    options = connection.settings_dict["OPTIONS"]
+    if connection.vendor in ("postgresql", "mysql"):
+        options["connect_timeout"] = timeout
+    if connection.vendor == "mysql":
+        options["read_timeout"] = options["write_timeout"] = timeout
+    elif connection.vendor == "sqlite":
+        options["timeout"] = timeout
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"SET statement_timeout = {timeout * 1000}")
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+    finally:
+        connection.close()
+
+
+def get_probe_cache():
+    """
+    프로브 전용 공유 캐시(2단 캐시면 L2) 인스턴스
+    Redis면 소켓 제한 시간을 걸어 응답 없는 서버에서 멈추지 않게 함
+    """
+    global _probe_cache
+    if _probe_cache is None:
+        params = copy.deepcopy(
+            settings.CACHES[getattr(cache, "l2_alias", DEFAULT_CACHE_ALIAS)]
+        )
+        backend = params.pop("BACKEND")
+        location = params.pop("LOCATION", "")
+        for option in REDIS_TIMEOUT_OPTIONS.get(backend, ()):
+            params.setdefault("OPTIONS", {}).setdefault(
+                option, settings.HEALTH_CHECK_TIMEOUT
+            )
+        _probe_cache = import_string(backend)(location, params)
+    return _probe_cache
+
+
+def probe_cache():
+    """공유 캐시 읽기/쓰기 확인"""
+    backend = get_probe_cache()
+    key = "health:probe"
+    value = str(time.monotonic())
+    backend.set(key, value, timeout=30)
+    if backend.get(key) != value:
+        raise RuntimeError("캐시 읽기 결과가 일치하지 않습니다.")
+
+
+def probe_mail():
+    """메일 발송 백엔드 연결 확인 (SMTP인 경우 실제 연결을 연다)"""
+    connection = get_connection(
+        fail_silently=False, timeout=settings.HEALTH_CHECK_TIMEOUT
+    )
+    connection.open()
+    connection.close()
+
+
+PROBES = {
+    "database": probe_database,
+    "cache": probe_cache,
+    "mail": probe_mail,
+}
+
+# 프로브마다 동시에 하나만 실행하므로 멈춘 프로브가 다른 프로브의 스레드를 빼앗지 않음
+_executor = ThreadPoolExecutor(
+    max_workers=len(PROBES), thread_name_prefix="health-probe"
+)
+
+
+def timed(probe):
+    """프로브 실행 시간(ms) 측정"""
+    started = time.perf_counter()
+    probe()
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def submit_probe(name):
+    """프로브 실행 (이전 실행이 아직 끝나지 않았으면 새로 제출하지 않고 그 결과를 기다림)"""
+    future = _running.get(name)
+    if future is None or future.done():
+        future = _running[name] = _executor.submit(timed, PROBES[name])
+    return future
+
+
+def run_probes():
+    """모든 프로브를 병렬로 실행하고 (정상 여부, 프로브별 결과) 반환"""
+    futures = {name: submit_probe(name) for name in PROBES}
+    deadline = time.monotonic() + settings.HEALTH_CHECK_TIMEOUT
+
+    checks = {}
+    for name, future in futures.items():
+        try:
+            latency_ms = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            checks[name] = {"status": "error", "error": "timeout"}
+            continue
+        except Exception as e:
+            checks[name] = {"status": "error", "error": str(e)}
+            continue
+        checks[name] = {"status": "ok", "latency_ms": latency_ms}
+
+    healthy = all(check["status"] == "ok" for check in checks.values())
+    return healthy, checks
+
+
+def is_cache_fresh():
+    """캐싱된 readiness 결과가 아직 유효한지 확인"""
+    if _cached_result is None:
+        return False
+    return time.monotonic() - _cached_at < settings.HEALTH_CHECK_CACHE_SECONDS
+
+
+def get_readiness():
+    """캐싱된 readiness 결과 반환 (만료 시 한 요청만 프로브 실행)"""
+    global _cached_result, _cached_at
+
+    if is_cache_fresh():
+        return _cached_result
+
+    with _lock:
+        # 대기하는 동안 다른 요청이 갱신했을 수 있음
+        if is_cache_fresh():
+            return _cached_result
+        _cached_result = run_probes()
+        _cached_at = time.monotonic()
+        return _cached_result
+
+
+def liveness(request):
+    """프로세스 생존 확인 - 외부 의존성을 확인하지 않음"""
+    return HttpResponse(LIVENESS_BODY, content_type="application/json")
+
+
+def readiness(request):
+    """DB/캐시/메일 의존성 확인"""
+    healthy, checks = get_readiness()
+    body = {"status": "ok" if healthy else "error", "checks": checks}
+    return HttpResponse(
+        json.dumps(body),
+        content_type="application/json",
+        status=200 if healthy else 503,
+    )
+
+
+class HealthCheckMiddleware:
+    """
+    헬스 체크 요청을 나머지 미들웨어/URL 라우팅/DRF를 거치지 않고 바로 응답
+    MIDDLEWARE 맨 앞에 위치해야 한다
+    ASGI에서는 헬스 체크 요청만 스레드에서 실행하고 나머지 요청은 그대로 넘긴다
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.handlers = {
+            settings.HEALTH_CHECK_LIVENESS_PATH: liveness,
+            settings.HEALTH_CHECK_READINESS_PATH: readiness,
+        }
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        handler = self.get_handler(request)
+        if handler is not None:
+            return handler(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        handler = self.get_handler(request)
+        if handler is not None:
+            return await sync_to_async(handler, thread_sensitive=False)(request)
+        return await self.get_response(request)
+
+    def get_handler(self, request):
+        if request.method not in ("GET", "HEAD"):
+            return None
+        return self.handlers.get(request.path_info)
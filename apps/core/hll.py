@@ -0,0 +1,69 @@
+"""
+HyperLogLog 카디널리티 추정
+
+값을 64비트 해시로 바꿔 2^PRECISION개 레지스터에 최대 선행 0비트 수를 기록한다.
+- 레지스터 4096개(4KB)로 고유 값 수를 표준 오차 약 1.6%로 추정한다
+- 같은 값을 여러 번 추가해도 결과가 같고(멱등), 두 스케치의 레지스터별 최댓값이 합집합이다
+  (일별 스케치를 합쳐 기간 내 고유 사용자 수를 구할 수 있다)
+저장 형식(registers bytes)은 PRECISION에 묶여 있으므로 PRECISION을 바꾸면 기존 스케치와 합칠 수 없다.
+"""
+
+import hashlib
+import math
+
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+VALUE_BITS = 64 - PRECISION
+
+# 레지스터 수에 따른 편향 보정 상수 (m >= 128)
+ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+class HyperLogLog:
+    __slots__ = ("registers",)
+
+    def __init__(self, registers=None):
+        if registers is None:
+            self.registers = bytearray(REGISTERS)
+        elif len(registers) != REGISTERS:
+            raise ValueError(
+                f"레지스터 크기가 {REGISTERS}가 아닙니다: {len(registers)}"
+            )
+        else:
+            self.registers = bytearray(registers)
+
+    def add(self, value):
+        """값 추가 (str로 변환해 해시)"""
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        index = hashed >> VALUE_BITS
+        rest = hashed & ((1 << VALUE_BITS) - 1)
+        rank = VALUE_BITS - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, other):
+        """다른 스케치와 합집합 (레지스터별 최댓값)"""
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        """고유 값 수 추정"""
+        total = math.fsum(2.0**-register for register in self.registers)
+        estimate = ALPHA * REGISTERS * REGISTERS / total
+        if estimate <= 2.5 * REGISTERS:
+            # 작은 범위는 빈 레지스터 수로 선형 계수
+            zeros = self.registers.count(0)
+            if zeros:
+                estimate = REGISTERS * math.log(REGISTERS / zeros)
+        return round(estimate)
+
+    def __bytes__(self):
+        return bytes(self.registers)
+
+    @classmethod
+    def union(cls, sketches):
+        result = cls()
+        for sketch in sketches:
+            result.update(sketch)
+        return result
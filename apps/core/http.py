@@ -0,0 +1,83 @@
+"""
+HTTP 공통 유틸리티
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, parse_etags
+
+try:
+    import brotli
+except ImportError:  # brotli는 production 그룹에만 포함
+    brotli = None
+
+# 사용자별 응답 - 공유 캐시에 저장하지 않고 매번 재검증
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더에서 q > 0 인 인코딩 집합 반환"""
+    encodings = set()
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            encodings.add(name)
+    return encodings
+
+
+def choose_encoding(request, available=("br", "gzip")):
+    """클라이언트가 허용하는 인코딩 중 우선순위가 가장 높은 것 반환 (없으면 None)"""
+    accepted = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    for encoding in available:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def etag_matches(request, etag):
+    """If-None-Match 헤더가 주어진 ETag와 일치하는지 확인 (약한 비교)"""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if "*" in etags:
+        return True
+    return etag.removeprefix("W/") in {value.removeprefix("W/") for value in etags}
+
+
+def make_etag(*parts):
+    """값 목록으로 강한 ETag 생성 (응답 본문을 만들지 않고 계산)"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """조건부 요청 헤더가 일치하면 304(또는 412) 응답, 아니면 None
+
+    last_modified는 timestamp (초)
+    """
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_cache_validators(
+    response, etag, last_modified=None, cache_control=PRIVATE_CACHE_CONTROL
+):
+    """ETag/Last-Modified/Cache-Control 헤더 설정 (인증 정보별로 다른 응답)"""
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    response["Cache-Control"] = cache_control
+    patch_vary_headers(response, ("Accept", "Authorization", "Cookie"))
+    return response
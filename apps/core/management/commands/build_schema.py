@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.schema import build_schema_artifacts
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마를 사전 생성해 압축본과 함께 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="저장 디렉터리 (기본값: settings.OPENAPI_SCHEMA_DIR)",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.ENABLE_API_DOCS:
+            raise CommandError(
+                "ENABLE_API_DOCS=False 상태에서는 스키마를 생성할 수 없습니다."
+            )
+
+        manifest = build_schema_artifacts(options["output"])
+
+        for fmt, entry in manifest.items():
+            encodings = ", ".join(
+                f"{encoding} {size:,} bytes"
+                for encoding, size in entry["encodings"].items()
+            )
+            self.stdout.write(
+                f"{entry['filename']}: {entry['size']:,} bytes ({encodings}) ETag {entry['etag']}"
+            )
+        self.stdout.write(self.style.SUCCESS("API 스키마 생성이 완료되었습니다."))
@@ -0,0 +1,119 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.core.profiling import (
+    FLAMEGRAPH_DIRNAME,
+    PROFILE_SUFFIX,
+    iter_view_dirs,
+    read_profile,
+    view_slug,
+)
+
+
+def to_speedscope(name, samples, interval_ms):
+    """합산된 collapsed-stack을 speedscope 파일 포맷(sampled)으로 변환"""
+    frame_index = {}
+    frames = []
+    stacks = []
+    weights = []
+
+    for stack, count in samples.most_common():
+        indices = []
+        for label in stack.split(";"):
+            if label not in frame_index:
+                frame_index[label] = len(frames)
+                frames.append({"name": label})
+            indices.append(frame_index[label])
+        stacks.append(indices)
+        weights.append(count * interval_ms)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "taskflow profile_flamegraph",
+        "shared": {"frames": frames},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": stacks,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = "샘플링 프로파일을 뷰별 플레임 그래프(collapsed/speedscope)로 합칩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--input",
+            default=None,
+            help="프로파일 디렉터리 (기본값: settings.PROFILER_OUTPUT_DIR)",
+        )
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="결과 저장 디렉터리 (기본값: <input>/_flamegraphs)",
+        )
+        parser.add_argument(
+            "--view", default=None, help="특정 뷰만 집계 (예: users:login)"
+        )
+        parser.add_argument(
+            "--top", type=int, default=5, help="뷰별로 출력할 self 상위 함수 수"
+        )
+
+    def handle(self, *args, **options):
+        input_dir = Path(options["input"] or settings.PROFILER_OUTPUT_DIR)
+        output_dir = Path(options["output"] or input_dir / FLAMEGRAPH_DIRNAME)
+        if not input_dir.is_dir():
+            raise CommandError(f"프로파일 디렉터리가 없습니다: {input_dir}")
+
+        view_dirs = iter_view_dirs(input_dir)
+        if options["view"]:
+            view_dirs = [
+                path for path in view_dirs if path.name == view_slug(options["view"])
+            ]
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        interval_ms = settings.PROFILER_INTERVAL_MS
+
+        for view_dir in view_dirs:
+            files = sorted(view_dir.glob(f"*{PROFILE_SUFFIX}"))
+            if not files:
+                continue
+
+            samples = Counter()
+            for path in files:
+                samples.update(read_profile(path))
+
+            with open(output_dir / f"{view_dir.name}{PROFILE_SUFFIX}", "w") as f:
+                for stack, count in samples.most_common():
+                    f.write(f"{stack} {count}\n")
+            with open(output_dir / f"{view_dir.name}.speedscope.json", "w") as f:
+                json.dump(to_speedscope(view_dir.name, samples, interval_ms), f)
+
+            total = sum(samples.values())
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{view_dir.name}: 프로파일 {len(files)}개, 샘플 {total}개 "
+                    f"(약 {total * interval_ms:.0f} ms)"
+                )
+            )
+
+            # 리프 프레임 기준 self 시간 상위 함수
+            leaves = Counter()
+            for stack, count in samples.items():
+                leaves[stack.rsplit(";", 1)[-1]] += count
+            for label, count in leaves.most_common(options["top"]):
+                self.stdout.write(f"  {count / total:>6.1%}  {label}")
+
+        self.stdout.write(f"결과 저장 위치: {output_dir}")
@@ -0,0 +1,137 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 자식 프로세스에서 실행할 스크립트
+# 현재 프로세스는 이미 모든 모듈을 import한 상태라 측정할 수 없으므로 새 인터프리터를 띄운다
+STARTUP_SCRIPT = """
+import time
+_started = time.perf_counter()
+import django
+django.setup()
+if {load_urls!r}:
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+if {load_wsgi!r}:
+    import config.wsgi
+print("__startup_ms__=%.1f" % ((time.perf_counter() - _started) * 1000))
+"""
+
+
+def parse_importtime(output):
+    """`python -X importtime` 출력을 (모듈명, self_us, cumulative_us) 목록으로 변환"""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        columns = line[len("import time:") :].split("|")
+        if len(columns) != 3:
+            continue
+        try:
+            self_us = int(columns[0])
+            cumulative_us = int(columns[1])
+        except ValueError:
+            # 헤더 행 ("self [us] | cumulative | imported package")
+            continue
+        entries.append((columns[2].strip(), self_us, cumulative_us))
+    return entries
+
+
+class Command(BaseCommand):
+    help = "워커 콜드 스타트 시 모듈별 import 비용을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=30, help="출력할 모듈 수 (기본값: 30)"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["self", "cumulative"],
+            default="cumulative",
+            help="정렬 기준 (기본값: cumulative)",
+        )
+        parser.add_argument(
+            "--group",
+            action="store_true",
+            help="최상위 패키지 단위로 self 시간을 합산해서 출력",
+        )
+        parser.add_argument(
+            "--skip-urls", action="store_true", help="URLConf 로딩을 측정에서 제외"
+        )
+        parser.add_argument(
+            "--wsgi", action="store_true", help="config.wsgi 애플리케이션까지 로딩"
+        )
+        parser.add_argument(
+            "--api-only",
+            action="store_true",
+            help="API 전용 워커 설정(문서화/소셜 로그인 비활성화)으로 측정",
+        )
+
+    def handle(self, *args, **options):
+        env = os.environ.copy()
+        env.setdefault("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)
+        if options["api_only"]:
+            env["ENABLE_API_DOCS"] = "False"
+            env["ENABLE_SOCIAL_LOGIN"] = "False"
+
+        script = STARTUP_SCRIPT.format(
+            load_urls=not options["skip_urls"], load_wsgi=options["wsgi"]
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", script],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"시작 프로세스 실행 실패:\n{result.stderr[-2000:]}")
+
+        entries = parse_importtime(result.stderr)
+        startup_ms = None
+        for line in result.stdout.splitlines():
+            if line.startswith("__startup_ms__="):
+                startup_ms = float(line.split("=", 1)[1])
+
+        if options["group"]:
+            self.print_grouped(entries, options["limit"])
+        else:
+            self.print_modules(entries, options["limit"], options["sort"])
+
+        total_self_ms = sum(entry[1] for entry in entries) / 1000
+        self.stdout.write("")
+        self.stdout.write(f"import된 모듈 수: {len(entries)}")
+        self.stdout.write(f"import 시간 합계: {total_self_ms:.1f} ms")
+        if startup_ms is not None:
+            self.stdout.write(
+                self.style.SUCCESS(f"전체 시작 시간: {startup_ms:.1f} ms")
+            )
+
+    def print_modules(self, entries, limit, sort):
+        """모듈별 import 비용 출력"""
+        index = 1 if sort == "self" else 2
+        ranked = sorted(entries, key=lambda entry: entry[index], reverse=True)
+
+        self.stdout.write(f"{'self(ms)':>10} {'cumulative(ms)':>15}  module")
+        for name, self_us, cumulative_us in ranked[:limit]:
+            self.stdout.write(
+                f"{self_us / 1000:>10.1f} {cumulative_us / 1000:>15.1f}  {name}"
+            )
+
+    def print_grouped(self, entries, limit):
+        """최상위 패키지별 import 비용 출력"""
+        totals = defaultdict(lambda: [0, 0])
+        for name, self_us, _ in entries:
+            package = totals[name.split(".")[0]]
+            package[0] += self_us
+            package[1] += 1
+
+        ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+
+        self.stdout.write(f"{'self(ms)':>10} {'modules':>8}  package")
+        for package, (self_us, count) in ranked[:limit]:
+            self.stdout.write(f"{self_us / 1000:>10.1f} {count:>8}  {package}")
@@ -0,0 +1,215 @@
+"""
+미디어 파일 서빙
+
+MEDIA_ACCEL_REDIRECT가 설정되면 권한/경로 확인만 하고 전송은 X-Accel-Redirect로 nginx에 넘긴다.
+설정되지 않으면 FileResponse(wsgi.file_wrapper → gunicorn sendfile)로 전송하고,
+Range 요청은 요청된 구간만 잘라서 206으로 응답한다.
+내용 해시가 경로에 포함된 파일(프로필 이미지 등)은 immutable 캐시 헤더를 붙인다.
+"""
+
+import hashlib
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.utils._os import safe_join
+from django.utils.http import content_disposition_header, http_date
+from django.views.decorators.http import require_safe
+from django.views.static import was_modified_since
+
+from .compression import exempt_from_compression
+from .http import etag_matches
+from .storage import IMMUTABLE_CACHE_CONTROL
+
+# 경로에 32~64자리 16진수 해시 디렉터리/파일명이 있으면 내용 주소 기반 파일로 본다
+CONTENT_ADDRESSED_PATTERN = re.compile(r"(?:^|/)[0-9a-f]{32,64}(?:/|\.)")
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK_SIZE = 64 * 1024
+
+
+def cache_control_for(path):
+    """미디어 경로별 Cache-Control 값"""
+    if CONTENT_ADDRESSED_PATTERN.search(path):
+        return IMMUTABLE_CACHE_CONTROL
+    return f"public, max-age={settings.MEDIA_CACHE_MAX_AGE}"
+
+
+def parse_range(header, size):
+    """
+    단일 구간 Range 헤더를 (start, end) 로 변환 (end 포함)
+    Range가 없거나 다중 구간이면 None, 만족할 수 없는 구간이면 ValueError
+    """
+    match = RANGE_PATTERN.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # bytes=-N : 마지막 N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def iter_file_range(path, start, length):
+    """파일의 [start, start + length) 구간을 청크 단위로 읽기"""
+    return iter_range(open(path, "rb"), start, length)
+
+
+def iter_range(f, start, length):
+    """열린 파일 객체의 [start, start + length) 구간을 청크 단위로 읽고 닫기"""
+    with f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def storage_file_response(request, storage, name, content_type, filename):
+    """
+    저장소 파일 다운로드 응답 (비공개 파일용 - private 캐시, 첨부 파일)
+    단일 구간 Range/If-Range를 지원해 중단된 다운로드를 이어받을 수 있다
+    """
+    size = storage.size(name)
+    etag = f'"{hashlib.blake2b(name.encode(), digest_size=8).hexdigest()}-{size:x}"'
+    headers = {
+        "Cache-Control": "private, no-cache",
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+    }
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+    range_header = request.META.get("HTTP_RANGE")
+    if request.META.get("HTTP_IF_RANGE", etag) != etag:
+        range_header = None
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        response = FileResponse(
+            storage.open(name, "rb"),
+            as_attachment=True,
+            filename=filename,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(size)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            iter_range(storage.open(name, "rb"), start, length),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Disposition"] = content_disposition_header(True, filename)
+
+    for key, value in headers.items():
+        response[key] = value
+    # Range는 원본 bytes 기준이므로 압축하지 않는다
+    return exempt_from_compression(response)
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat = os.stat(full_path)
+    except (OSError, ValueError):
+        raise Http404
+    if not os.path.isfile(full_path) or os.path.basename(path).startswith("."):
+        raise Http404
+
+    size = stat.st_size
+    last_modified = http_date(stat.st_mtime)
+    etag = f'"{int(stat.st_mtime):x}-{size:x}"'
+    headers = {
+        "Cache-Control": cache_control_for(path),
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Accept-Ranges": "bytes",
+    }
+
+    if etag_matches(request, etag) or (
+        "HTTP_IF_NONE_MATCH" not in request.META
+        and not was_modified_since(
+            request.META.get("HTTP_IF_MODIFIED_SINCE"), stat.st_mtime
+        )
+    ):
+        response = HttpResponseNotModified()
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+
+    if settings.MEDIA_ACCEL_REDIRECT:
+        # nginx가 Range/sendfile 처리
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = (
+            settings.MEDIA_ACCEL_REDIRECT.rstrip("/") + "/" + quote(path)
+        )
+        for key, value in headers.items():
+            response[key] = value
+        return response
+
+    # If-Range가 현재 버전과 다르면 전체 파일 전송
+    range_header = request.META.get("HTTP_RANGE")
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range and if_range not in (etag, last_modified):
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        response = FileResponse(open(full_path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        length = end - start + 1
+        response = StreamingHttpResponse(
+            iter_file_range(full_path, start, length),
+            status=206,
+            content_type=content_type,
+        )
+        response["Content-Length"] = str(length)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    for key, value in headers.items():
+        response[key] = value
+    return response
@@ -0,0 +1,33 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="StoredFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True, verbose_name="파일 경로")),
+                ("ref_count", models.PositiveIntegerField(default=0, verbose_name="참조 수")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 시간")),
+            ],
+            options={
+                "verbose_name": "저장 파일",
+                "verbose_name_plural": "저장 파일들",
+                "db_table": "stored_files",
+            },
+        ),
+    ]
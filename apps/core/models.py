@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class StoredFile(models.Model):
+    """
+    내용 주소 기반 저장소 파일의 참조 수
+    참조 수가 0이 되면 파일과 함께 삭제된다
+    """
+
+    name = models.CharField("파일 경로", max_length=255, unique=True)
+    ref_count = models.PositiveIntegerField("참조 수", default=0)
+
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+    updated_at = models.DateTimeField("수정 시간", auto_now=True)
+
+    class Meta:
+        db_table = "stored_files"
+        verbose_name = "저장 파일"
+        verbose_name_plural = "저장 파일들"
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
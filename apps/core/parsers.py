@@ -0,0 +1,43 @@
+"""
+API 요청 파서 (renderers.py의 렌더러와 짝)
+"""
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from .renderers import MessagePackRenderer, msgpack, orjson
+
+
+class FastJSONParser(JSONParser):
+    """
+    orjson 기반 JSON 파서 (orjson이 없으면 DRF 기본 JSONParser로 동작)
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read() if stream is not None else b""
+            if encoding.lower().replace("-", "") != "utf8":
+                body = body.decode(encoding).encode("utf-8")
+            return orjson.loads(body)
+        except (ValueError, UnicodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackParser(BaseParser):
+    """
+    MessagePack 파서 (Content-Type: application/msgpack)
+    """
+
+    media_type = MessagePackRenderer.media_type
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            body = stream.read() if stream is not None else b""
+            return msgpack.unpackb(body, raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -0,0 +1,335 @@
+"""
+요청 단위 성능 계측
+
+PerformanceMetricsMiddleware가 요청마다 뷰 실행 시간, DB 쿼리 수/시간,
+캐시 히트/미스, 시리얼라이저 시간을 기록하고 프로세스 단위 히스토그램으로 집계한다.
+집계 결과는 /api/metrics/ 에서 Prometheus 텍스트 포맷으로 노출된다.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# 현재 요청의 계측값 (계측 중이 아니면 None)
+_current = ContextVar("request_metrics", default=None)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class RequestMetrics:
+    """
+    요청 하나의 계측값
+    """
+
+    __slots__ = (
+        "view",
+        "db_count",
+        "db_seconds",
+        "cache_hits",
+        "cache_misses",
+        "serializer_seconds",
+        "serializer_depth",
+    )
+
+    def __init__(self):
+        self.view = None
+        self.db_count = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.serializer_seconds = 0.0
+        self.serializer_depth = 0
+
+
+class Histogram:
+    """
+    Prometheus 방식의 누적 버킷 히스토그램 (라벨별)
+    """
+
+    def __init__(self, name, help_text, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.series = {}
+
+    def observe(self, label, value):
+        series = self.series.get(label)
+        if series is None:
+            # [버킷별 카운트..., +Inf 카운트, 합계]
+            series = self.series[label] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self):
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for label, series in sorted(self.series.items()):
+            view = escape_label(label)
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(
+                    f'{self.name}_bucket{{view="{view}",le="{bound}"}} {cumulative}'
+                )
+            cumulative += series[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{view="{view}",le="+Inf"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{view="{view}"}} {series[-1]}')
+            lines.append(f'{self.name}_count{{view="{view}"}} {cumulative}')
+        return lines
+
+
+class Counter:
+    """
+    라벨별 카운터
+    """
+
+    def __init__(self, name, help_text, label_name="view"):
+        self.name = name
+        self.help_text = help_text
+        self.label_name = label_name
+        self.series = {}
+
+    def inc(self, label, amount=1):
+        self.series[label] = self.series.get(label, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for label, value in sorted(self.series.items()):
+            lines.append(
+                f'{self.name}{{{self.label_name}="{escape_label(label)}"}} {value}'
+            )
+        return lines
+
+
+def escape_label(value):
+    """Prometheus 라벨 값 이스케이프"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_registry_lock = threading.Lock()
+
+REQUEST_DURATION = Histogram(
+    "taskflow_request_duration_seconds", "뷰별 요청 처리 시간", DURATION_BUCKETS
+)
+DB_DURATION = Histogram(
+    "taskflow_db_duration_seconds", "요청당 DB 쿼리 시간", DURATION_BUCKETS
+)
+DB_QUERIES = Histogram("taskflow_db_queries", "요청당 DB 쿼리 수", QUERY_COUNT_BUCKETS)
+SERIALIZER_DURATION = Histogram(
+    "taskflow_serializer_duration_seconds", "요청당 시리얼라이저 시간", DURATION_BUCKETS
+)
+CACHE_HITS = Counter("taskflow_cache_hits_total", "캐시 히트 수")
+CACHE_MISSES = Counter("taskflow_cache_misses_total", "캐시 미스 수")
+CACHE_LOOKUPS = Counter(
+    "taskflow_cache_lookups_total", "캐시 계층별 조회 결과 (l1/l2/miss)", "result"
+)
+QUERY_BUDGET_EXCEEDED = Counter(
+    "taskflow_query_budget_exceeded_total", "쿼리 수 예산을 초과한 요청 수"
+)
+
+METRICS = (
+    REQUEST_DURATION,
+    DB_DURATION,
+    DB_QUERIES,
+    SERIALIZER_DURATION,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CACHE_LOOKUPS,
+    QUERY_BUDGET_EXCEEDED,
+)
+
+
+def render_metrics():
+    """수집된 메트릭을 Prometheus 텍스트 포맷으로 렌더링"""
+    lines = []
+    with _registry_lock:
+        for metric in METRICS:
+            lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def record_cache_access(hit):
+    """현재 요청의 캐시 히트/미스 기록 (캐시 백엔드에서 호출)"""
+    metrics = _current.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+
+def record_cache_lookup(result):
+    """캐시 계층별 조회 결과 기록 (l1 / l2 / miss, TieredCache에서 호출)"""
+    with _registry_lock:
+        CACHE_LOOKUPS.inc(result)
+    record_cache_access(result != "miss")
+
+
+def cache_hit_ratio():
+    """프로세스 시작 이후 캐시 히트율 (L1, L2 합계와 L1 비율)"""
+    with _registry_lock:
+        counts = dict(CACHE_LOOKUPS.series)
+    total = sum(counts.values())
+    if not total:
+        return {"total": 0, "hit": 0.0, "l1": 0.0}
+    return {
+        "total": total,
+        "hit": (counts.get("l1", 0) + counts.get("l2", 0)) / total,
+        "l1": counts.get("l1", 0) / total,
+    }
+
+
+def time_serializer(func):
+    """시리얼라이저 .data (또는 컴파일된 직렬화 함수) 실행 시간을 현재 요청에 기록하는 래퍼"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = _current.get()
+        if metrics is None or metrics.serializer_depth:
+            return func(*args, **kwargs)
+        metrics.serializer_depth += 1
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.serializer_seconds += time.perf_counter() - started
+            metrics.serializer_depth -= 1
+
+    wrapper.is_timed = True
+    return wrapper
+
+
+def install_serializer_timing():
+    """DRF BaseSerializer.data 프로퍼티에 계측 래퍼 설치 (AppConfig.ready에서 호출)"""
+    from rest_framework.serializers import BaseSerializer
+
+    fget = BaseSerializer.data.fget
+    if getattr(fget, "is_timed", False):
+        return
+    BaseSerializer.data = property(time_serializer(fget))
+
+
+class PerformanceMetricsMiddleware:
+    """
+    요청 단위 성능 계측 미들웨어
+    PERF_METRICS_ENABLED=False면 미들웨어 체인에서 완전히 제외된다
+    ASGI에서는 비동기로 동작한다 (스트리밍 응답은 응답을 만들기까지만 측정)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PERF_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.server_timing = settings.PERF_SERVER_TIMING
+        self.query_budget = settings.PERF_QUERY_BUDGET
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        started = time.perf_counter()
+        with self.recording(metrics):
+            response = self.get_response(request)
+        return self.finish(request, response, metrics, started)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        started = time.perf_counter()
+        with self.recording(metrics):
+            response = await self.get_response(request)
+        return self.finish(request, response, metrics, started)
+
+    @contextmanager
+    def recording(self, metrics):
+        """요청 처리 중 쿼리 수/시간 기록 (sync_to_async 스레드에도 컨텍스트가 전달됨)"""
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self.record_query))
+                yield
+        finally:
+            _current.reset(token)
+
+    def finish(self, request, response, metrics, started):
+        """측정 결과 기록과 Server-Timing 헤더 추가"""
+        elapsed = time.perf_counter() - started
+
+        view = metrics.view or "<unresolved>"
+        self.observe(view, metrics, elapsed)
+
+        if metrics.db_count > self.query_budget:
+            logger.warning(
+                "쿼리 수 예산 초과: %s %s (%d개, 예산 %d개)",
+                request.method,
+                view,
+                metrics.db_count,
+                self.query_budget,
+            )
+
+        if self.server_timing:
+            response["Server-Timing"] = format_server_timing(metrics, elapsed)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None and request.resolver_match is not None:
+            match = request.resolver_match
+            metrics.view = match.view_name or match._func_path
+        return None
+
+    def record_query(self, execute, sql, params, many, context):
+        metrics = _current.get()
+        if metrics is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.db_count += 1
+            metrics.db_seconds += time.perf_counter() - started
+
+    def observe(self, view, metrics, elapsed):
+        with _registry_lock:
+            REQUEST_DURATION.observe(view, elapsed)
+            DB_DURATION.observe(view, metrics.db_seconds)
+            DB_QUERIES.observe(view, metrics.db_count)
+            SERIALIZER_DURATION.observe(view, metrics.serializer_seconds)
+            if metrics.cache_hits:
+                CACHE_HITS.inc(view, metrics.cache_hits)
+            if metrics.cache_misses:
+                CACHE_MISSES.inc(view, metrics.cache_misses)
+            if metrics.db_count > self.query_budget:
+                QUERY_BUDGET_EXCEEDED.inc(view)
+
+
+def format_server_timing(metrics, elapsed):
+    """Server-Timing 헤더 값 생성"""
+    return ", ".join(
+        [
+            f"total;dur={elapsed * 1000:.2f}",
+            f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.db_count} queries"',
+            f"serializer;dur={metrics.serializer_seconds * 1000:.2f}",
+            f'cache;desc="hits={metrics.cache_hits} misses={metrics.cache_misses}"',
+        ]
+    )
@@ -0,0 +1,250 @@
+"""
+운영 환경용 샘플링 프로파일러
+
+cProfile처럼 모든 함수 호출을 추적하지 않고, 백그라운드 스레드가 일정 간격으로
+대상 요청 스레드의 스택만 읽어(sys._current_frames) collapsed-stack 형식으로 저장한다.
+저장된 파일은 `manage.py profile_flamegraph`로 뷰별 플레임 그래프로 합칠 수 있다.
+"""
+
+import itertools
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SUFFIX = ".collapsed"
+
+# 집계 결과 디렉터리 (뷰별 프로파일 디렉터리와 구분하기 위해 '_'로 시작)
+FLAMEGRAPH_DIRNAME = "_flamegraphs"
+
+
+def frame_label(frame):
+    """스택 프레임 표시 이름 (모듈:함수)"""
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+def collapse_stack(frame):
+    """프레임을 루트부터 리프까지 ';'로 이은 문자열로 변환"""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+class StackSampler:
+    """
+    등록된 스레드들의 스택을 주기적으로 수집하는 샘플러
+    프로파일링 중인 요청이 있을 때만 샘플링 스레드가 동작한다
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.targets = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def start(self, thread_id):
+        """스레드 샘플링 시작"""
+        samples = Counter()
+        with self.lock:
+            self.targets[thread_id] = samples
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="stack-sampler", daemon=True
+                )
+                self.thread.start()
+        self.wakeup.set()
+        return samples
+
+    def stop(self, thread_id):
+        """스레드 샘플링 종료 후 수집된 스택 반환"""
+        with self.lock:
+            return self.targets.pop(thread_id, Counter())
+
+    def run(self):
+        own_id = threading.get_ident()
+        while True:
+            # stop()과 동시에 Counter를 수정하지 않도록 락 안에서 샘플링
+            with self.lock:
+                active = bool(self.targets)
+                if active:
+                    frames = sys._current_frames()
+                    for thread_id, samples in self.targets.items():
+                        frame = frames.get(thread_id)
+                        if frame is not None and thread_id != own_id:
+                            samples[collapse_stack(frame)] += 1
+                    del frames
+                else:
+                    self.wakeup.clear()
+
+            if active:
+                time.sleep(self.interval)
+            else:
+                self.wakeup.wait()
+
+
+def view_slug(view):
+    """뷰 이름을 디렉터리명으로 변환 (users:login -> users.login)"""
+    return view.replace(":", ".").replace("/", "_")
+
+
+def write_profile(output_dir, view, samples, max_files):
+    """뷰별 디렉터리에 collapsed-stack 파일 저장 후 오래된 파일 정리"""
+    output_dir = Path(output_dir)
+    view_dir = output_dir / view_slug(view)
+    view_dir.mkdir(parents=True, exist_ok=True)
+
+    filename = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}{PROFILE_SUFFIX}"
+    path = view_dir / filename
+    with open(path, "w") as f:
+        for stack, count in samples.most_common():
+            f.write(f"{stack} {count}\n")
+
+    rotate_profiles(output_dir, max_files)
+    return path
+
+
+def iter_view_dirs(output_dir):
+    """뷰별 프로파일 디렉터리 목록"""
+    return sorted(
+        path
+        for path in Path(output_dir).iterdir()
+        if path.is_dir() and not path.name.startswith("_")
+    )
+
+
+def rotate_profiles(output_dir, max_files):
+    """전체 뷰를 통틀어 가장 최근 max_files개만 남기고 삭제"""
+    profiles = [
+        path
+        for view_dir in iter_view_dirs(output_dir)
+        for path in view_dir.glob(f"*{PROFILE_SUFFIX}")
+    ]
+    profiles.sort(key=lambda path: path.name)
+    for path in profiles[: max(len(profiles) - max_files, 0)]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def read_profile(path):
+    """collapsed-stack 파일을 Counter로 읽기"""
+    samples = Counter()
+    with open(path) as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack and count.isdigit():
+                samples[stack] += int(count)
+    return samples
+
+
+class SamplingProfilerMiddleware:
+    """
+    N개 요청 중 1개, 또는 스태프 사용자가 트리거 헤더를 보낸 요청을 샘플링 프로파일링
+    PROFILER_ENABLED=False면 미들웨어 체인에서 완전히 제외된다
+    ASGI에서는 이벤트 루프 스레드를 샘플링한다 (sync_to_async 스레드에서 실행되는 동기 코드는 제외)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILER_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILER_SAMPLE_RATE
+        self.trigger_header = (
+            "HTTP_" + settings.PROFILER_TRIGGER_HEADER.upper().replace("-", "_")
+        )
+        self.counter = itertools.count(1)
+        self.sampler = StackSampler(settings.PROFILER_INTERVAL_MS / 1000)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.should_profile(request):
+            return self.get_response(request)
+
+        thread_id = threading.get_ident()
+        self.sampler.start(thread_id)
+        try:
+            response = self.get_response(request)
+        finally:
+            samples = self.sampler.stop(thread_id)
+        self.save(request, samples)
+        return response
+
+    async def __acall__(self, request):
+        # 트리거 헤더가 있을 때만 스레드에서 스태프 여부 확인 (JWT 조회에 DB 접근)
+        if not self.sampled() and not (
+            request.META.get(self.trigger_header)
+            and await sync_to_async(self.is_staff)(request)
+        ):
+            return await self.get_response(request)
+
+        thread_id = threading.get_ident()
+        self.sampler.start(thread_id)
+        try:
+            response = await self.get_response(request)
+        finally:
+            samples = self.sampler.stop(thread_id)
+        self.save(request, samples)
+        return response
+
+    def save(self, request, samples):
+        """수집한 샘플을 뷰 이름별 프로파일 파일로 저장"""
+        match = getattr(request, "resolver_match", None)
+        view = (match.view_name or match._func_path) if match else "unresolved"
+        if samples:
+            try:
+                write_profile(
+                    settings.PROFILER_OUTPUT_DIR,
+                    view,
+                    samples,
+                    settings.PROFILER_MAX_FILES,
+                )
+            except OSError as e:
+                logger.warning("프로파일 저장 실패: %s", e)
+
+    def sampled(self):
+        """N개 요청 중 1개인지 확인"""
+        return bool(self.sample_rate and next(self.counter) % self.sample_rate == 0)
+
+    def should_profile(self, request):
+        """프로파일링 대상 요청인지 판단"""
+        if self.sampled():
+            return True
+        if request.META.get(self.trigger_header):
+            return self.is_staff(request)
+        return False
+
+    def is_staff(self, request):
+        """세션 또는 JWT로 인증된 스태프 사용자인지 확인"""
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return user.is_staff
+
+        from rest_framework.exceptions import AuthenticationFailed
+        from rest_framework_simplejwt.authentication import JWTAuthentication
+
+        try:
+            result = JWTAuthentication().authenticate(request)
+        except AuthenticationFailed:
+            return False
+        return bool(result and result[0].is_staff)
@@ -0,0 +1,181 @@
+"""
+프로세스 간 pub/sub
+
+실시간 스트림(SSE 등)처럼 연결을 오래 붙잡고 있는 구독자에게 메시지를 전달한다.
+- LocalPubSub: 프로세스 내 구독자에게만 전달 (단일 프로세스/테스트/로컬 개발)
+- RedisPubSub: Redis PUBLISH로 보내고, 프로세스마다 패턴 구독 하나로 받아 프로세스 내 구독자에게 전달
+  (발행하는 프로세스(관리 명령/WSGI 워커)와 구독자가 있는 ASGI 워커가 다를 때)
+
+구독은 이벤트 루프에서 만들고, 메시지는 어느 스레드에서든 발행할 수 있다.
+구독마다 크기 제한이 있는 큐를 두고, 소비가 늦어 큐가 넘치면 남은 메시지를 버리고 None을 넣어
+구독자가 연결을 끊고 다시 맞추도록 한다 (느린 클라이언트가 메모리를 계속 차지하지 않음).
+"""
+
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:  # redis는 RedisPubSub을 쓰는 배포에만 설치
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# 구독자 수만큼 반복하지 않도록 메시지는 발행할 때 한 번만 직렬화
+encode = DjangoJSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class Subscription:
+    """
+    채널 구독 하나 (이벤트 루프에 묶인 크기 제한 큐)
+    """
+
+    __slots__ = ("channel", "loop", "queue", "overflowed")
+
+    def __init__(self, channel, maxsize):
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+        self.overflowed = False
+
+    def put(self, data):
+        """어느 스레드에서든 호출 가능"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self.put_nowait(data)
+        else:
+            try:
+                self.loop.call_soon_threadsafe(self.put_nowait, data)
+            except RuntimeError:  # 루프가 이미 닫힘
+                pass
+
+    def put_nowait(self, data):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            # 밀린 메시지를 버리고 종료 신호(None)만 남김
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self):
+        """다음 메시지(JSON 문자열). 큐가 넘쳤으면 None"""
+        return await self.queue.get()
+
+
+class LocalPubSub:
+    """
+    프로세스 내 pub/sub
+    """
+
+    def __init__(self, **options):
+        self._subscribers = {}  # channel -> {Subscription, ...}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel, maxsize=100):
+        """이벤트 루프 안에서 호출"""
+        subscription = Subscription(channel, maxsize)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def subscriber_count(self, channel=None):
+        with self._lock:
+            if channel is not None:
+                return len(self._subscribers.get(channel, ()))
+            return sum(map(len, self._subscribers.values()))
+
+    def deliver(self, channel, data):
+        """프로세스 내 구독자에게 전달 (구독자가 없으면 아무것도 하지 않음)"""
+        with self._lock:
+            subscribers = tuple(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.put(data)
+
+    def publish(self, channel, message):
+        self.publish_many([(channel, message)])
+
+    def publish_many(self, messages):
+        """(channel, message) 목록 발행 (구독자가 있는 채널의 메시지만 직렬화)"""
+        for channel, message in messages:
+            if channel in self._subscribers:
+                self.deliver(channel, encode(message))
+
+
+class RedisPubSub(LocalPubSub):
+    """
+    Redis pub/sub (PUBLISH + 프로세스당 PSUBSCRIBE 하나)
+    """
+
+    def __init__(self, url="", prefix="taskflow:pubsub:", **options):
+        if redis is None:
+            raise ImproperlyConfigured("RedisPubSub에는 redis 패키지가 필요합니다.")
+        if not url:
+            raise ImproperlyConfigured("PUBSUB_URL이 설정되지 않았습니다.")
+        super().__init__()
+        self.url = url
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        self._listeners = {}  # 이벤트 루프 -> 수신 태스크
+
+    def subscribe(self, channel, maxsize=100):
+        subscription = super().subscribe(channel, maxsize)
+        listener = self._listeners.get(subscription.loop)
+        if listener is None or listener.done():
+            self._listeners[subscription.loop] = subscription.loop.create_task(
+                self.listen()
+            )
+        return subscription
+
+    def publish_many(self, messages):
+        pipeline = self._client.pipeline(transaction=False)
+        for channel, message in messages:
+            pipeline.publish(self.prefix + channel, encode(message))
+        pipeline.execute()
+
+    async def listen(self):
+        """Redis 메시지를 프로세스 내 구독자에게 전달 (연결이 끊기면 다시 연결)"""
+        pattern = self.prefix + "*"
+        while True:
+            client = aioredis.Redis.from_url(self.url)
+            try:
+                async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.psubscribe(pattern)
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+                        channel = message["channel"].decode()[len(self.prefix) :]
+                        self.deliver(channel, message["data"].decode())
+            except redis.RedisError:
+                logger.exception("pub/sub 수신 연결 끊김, 다시 연결")
+                await asyncio.sleep(1)
+            finally:
+                await client.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_pubsub():
+    config = settings.PUBSUB
+    return import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
@@ -0,0 +1,74 @@
+"""
+API 응답 렌더러
+
+FastJSONRenderer는 orjson으로 datetime/UUID를 직접 인코딩하고 항상 공백 없는 compact JSON을 만든다
+(Accept 헤더에 indent가 있으면 2칸 들여쓰기). orjson이 없으면 DRF 기본 JSONRenderer로 동작한다.
+MessagePackRenderer는 Accept: application/msgpack 요청에 MessagePack으로 응답한다.
+"""
+
+import datetime
+import uuid
+
+from rest_framework.utils import encoders
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson은 production 그룹에만 포함
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_drf_encoder = encoders.JSONEncoder()
+
+
+def encode_default(obj):
+    """orjson/msgpack이 직접 처리하지 못하는 타입 (lazy 문자열, Decimal 등)"""
+    return _drf_encoder.default(obj)
+
+
+def encode_msgpack_default(obj):
+    """MessagePack 확장 타입 대신 JSON 응답과 같은 문자열 표현 사용"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time, uuid.UUID)):
+        return _drf_encoder.default(obj)
+    return encode_default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=encode_default, option=option)
+        except orjson.JSONEncodeError:
+            # 64비트를 넘는 정수 등 orjson이 지원하지 않는 값은 stdlib json으로 처리
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack 렌더러 (Accept: application/msgpack)
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_msgpack_default, use_bin_type=True)
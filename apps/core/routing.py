@@ -0,0 +1,70 @@
+"""
+경로별 미들웨어 생략
+
+JWT로 인증하는 /api/ 요청은 세션, 메시지, CSRF가 필요 없으므로
+아래 미들웨어들은 SESSION_FREE_PATH_PREFIX 요청에서 아무 일도 하지 않고 다음 단계로 넘긴다.
+세션 기반 흐름인 소셜 로그인(SESSION_REQUIRED_PATH_PREFIXES)은 그대로 처리한다.
+
+allauth AccountMiddleware는 allauth가 MIDDLEWARE에 원래 경로로 있어야 하고
+세션을 건드리지 않으므로 감싸지 않는다.
+"""
+
+from django.conf import settings
+from django.contrib.auth.middleware import (
+    AuthenticationMiddleware as BaseAuthenticationMiddleware,
+)
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import (
+    MessageMiddleware as BaseMessageMiddleware,
+)
+from django.contrib.sessions.middleware import (
+    SessionMiddleware as BaseSessionMiddleware,
+)
+from django.middleware.csrf import CsrfViewMiddleware as BaseCsrfViewMiddleware
+
+
+def is_session_free(request):
+    """세션/CSRF 처리를 생략하는 요청인지 확인 (요청당 한 번만 계산)"""
+    try:
+        return request.session_free
+    except AttributeError:
+        pass
+    path = request.path_info
+    request.session_free = (
+        settings.SESSION_FREE_API
+        and path.startswith(settings.SESSION_FREE_PATH_PREFIX)
+        and not path.startswith(tuple(settings.SESSION_REQUIRED_PATH_PREFIXES))
+    )
+    return request.session_free
+
+
+class SessionFreeMixin:
+    """세션 없는 요청이면 process_request/process_response를 건너뛴다"""
+
+    def __call__(self, request):
+        if is_session_free(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SessionMiddleware(SessionFreeMixin, BaseSessionMiddleware):
+    pass
+
+
+class CsrfViewMiddleware(SessionFreeMixin, BaseCsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_session_free(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(SessionFreeMixin, BaseAuthenticationMiddleware):
+    def __call__(self, request):
+        if is_session_free(request):
+            # DRF가 JWT 인증 후 request.user를 다시 설정한다
+            request.user = AnonymousUser()
+        return super().__call__(request)
+
+
+class MessageMiddleware(SessionFreeMixin, BaseMessageMiddleware):
+    pass
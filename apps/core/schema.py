@@ -0,0 +1,120 @@
+"""
+OpenAPI 스키마 사전 생성 및 로딩
+
+`manage.py build_schema`로 스키마를 한 번만 생성해 파일로 저장하고,
+API 프로세스는 이를 메모리에 올려 그대로 서빙한다.
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from django.conf import settings
+
+from .http import brotli
+
+MANIFEST_NAME = "manifest.json"
+
+SCHEMA_FORMATS = {
+    "yaml": {"filename": "schema.yaml", "media_type": "application/vnd.oai.openapi"},
+    "json": {
+        "filename": "schema.json",
+        "media_type": "application/vnd.oai.openapi+json",
+    },
+}
+
+# 인코딩별 파일 확장자
+ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+# 프로세스당 한 번만 로딩
+_artifacts = None
+
+
+def generate_schema_documents():
+    """drf_spectacular로 스키마를 생성해 포맷별 bytes로 렌더링"""
+    from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS(
+        urlconf=spectacular_settings.SERVE_URLCONF
+    )
+    schema = generator.get_schema(
+        request=None, public=spectacular_settings.SERVE_PUBLIC
+    )
+
+    return {
+        "yaml": OpenApiYamlRenderer().render(schema, renderer_context={}),
+        "json": OpenApiJsonRenderer().render(schema, renderer_context={}),
+    }
+
+
+def compress_variants(content):
+    """사전 압축된 인코딩별 변형 생성"""
+    variants = {"gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(content, quality=11)
+    return variants
+
+
+def build_schema_artifacts(output_dir=None):
+    """스키마를 생성해 원본/압축본/manifest를 저장하고 manifest 반환"""
+    output_dir = Path(output_dir or settings.OPENAPI_SCHEMA_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest = {}
+    for fmt, content in generate_schema_documents().items():
+        filename = SCHEMA_FORMATS[fmt]["filename"]
+        (output_dir / filename).write_bytes(content)
+
+        variants = compress_variants(content)
+        for encoding, data in variants.items():
+            (output_dir / (filename + ENCODING_SUFFIXES[encoding])).write_bytes(data)
+
+        manifest[fmt] = {
+            "filename": filename,
+            "media_type": SCHEMA_FORMATS[fmt]["media_type"],
+            "etag": '"%s"' % hashlib.sha256(content).hexdigest()[:32],
+            "size": len(content),
+            "encodings": {encoding: len(data) for encoding, data in variants.items()},
+        }
+
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def load_schema_artifacts():
+    """저장된 스키마를 메모리로 로딩 (없으면 None)"""
+    global _artifacts
+    if _artifacts is not None:
+        return _artifacts
+
+    output_dir = Path(settings.OPENAPI_SCHEMA_DIR)
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+
+    artifacts = {}
+    for fmt, entry in json.loads(manifest_path.read_text()).items():
+        content = (output_dir / entry["filename"]).read_bytes()
+        variants = {
+            encoding: (
+                output_dir / (entry["filename"] + ENCODING_SUFFIXES[encoding])
+            ).read_bytes()
+            for encoding in entry["encodings"]
+        }
+        artifacts[fmt] = {
+            "media_type": entry["media_type"],
+            "etag": entry["etag"],
+            "content": content,
+            "variants": variants,
+        }
+
+    _artifacts = artifacts
+    return _artifacts
+
+
+def reset_schema_artifacts():
+    """메모리에 로딩된 스키마 초기화 (테스트/재빌드용)"""
+    global _artifacts
+    _artifacts = None
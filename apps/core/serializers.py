@@ -0,0 +1,173 @@
+"""
+읽기 전용 응답용 컴파일된 시리얼라이저
+
+DRF 시리얼라이저는 인스턴스를 만들 때마다 필드를 복사/인트로스펙션하고 필드마다
+get_attribute → to_representation을 동적으로 호출한다. compile_serializer는 시리얼라이저를
+한 번만 만들어 필드별 getter/변환 함수를 미리 정하고, 필드를 순서대로 채우는 함수를 생성해 둔다.
+출력은 원래 시리얼라이저의 .data와 같다 (context는 request만 사용).
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.settings import api_settings
+
+from .perf import time_serializer
+
+# 모델 클래스 속성이 이 타입이면 getattr 한 번으로 값을 얻을 수 있다
+DIRECT_DESCRIPTORS = (property, DeferredAttribute)
+# 값을 그대로 내보내는 필드 / 변환 함수가 내장 타입 생성자인 필드
+IDENTITY_FIELDS = (serializers.ReadOnlyField,)
+BUILTIN_FIELDS = {
+    serializers.CharField: "str",
+    serializers.EmailField: "str",
+    serializers.IntegerField: "int",
+}
+UNSUPPORTED_FIELDS = (
+    serializers.HyperlinkedRelatedField,
+    serializers.HiddenField,
+)
+
+
+def file_representation(field):
+    """FileField/ImageField.to_representation과 같은 결과를 내는 함수 (request 필요)"""
+    use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+
+    def represent(value, context):
+        if not value:
+            return None
+        if not use_url:
+            return value.name
+        try:
+            url = value.url
+        except AttributeError:
+            return None
+        request = context.get("request")
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    return represent
+
+
+class CompiledSerializer:
+    """
+    시리얼라이저 인스턴스로부터 생성한 직렬화 함수
+
+        reader = compile_serializer(UserBasicSerializer)
+        reader.serialize(user)
+        reader.serialize(users, many=True, context={"request": request})
+    """
+
+    def __init__(self, serializer):
+        if (
+            type(serializer).to_representation
+            is not serializers.Serializer.to_representation
+        ):
+            raise ImproperlyConfigured(
+                f"{type(serializer).__name__}: to_representation을 재정의한 "
+                "시리얼라이저는 컴파일할 수 없습니다."
+            )
+        self.serializer_class = type(serializer)
+        self.model = getattr(getattr(serializer, "Meta", None), "model", None)
+        self.source, namespace = self.generate(serializer)
+        exec(
+            compile(
+                self.source, f"<compiled {self.serializer_class.__name__}>", "exec"
+            ),
+            namespace,
+        )
+        self.to_representation = namespace["to_representation"]
+
+    def generate(self, serializer):
+        """필드 순서대로 값을 채우는 to_representation(instance, context) 소스 생성"""
+        namespace = {"SkipField": SkipField}
+        lines = ["def to_representation(instance, context):", "    ret = {}"]
+
+        for index, field in enumerate(serializer._readable_fields):
+            key = repr(field.field_name)
+            if isinstance(field, UNSUPPORTED_FIELDS):
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{field.field_name}: "
+                    f"{type(field).__name__}는 컴파일할 수 없습니다."
+                )
+
+            if isinstance(field, serializers.SerializerMethodField):
+                # source="*" - 인스턴스를 그대로 메서드에 전달
+                namespace[f"method_{index}"] = getattr(serializer, field.method_name)
+                lines.append(f"    ret[{key}] = method_{index}(instance)")
+                continue
+
+            getter = self.getter_expression(field)
+            transform = self.transform_expression(field, index, namespace)
+            assign = f"ret[{key}] = None if value is None else {transform}"
+            if getter is None:
+                # 일반 경로: Field.get_attribute (기본값/SkipField 처리 포함)
+                namespace[f"get_{index}"] = field.get_attribute
+                lines += [
+                    "    try:",
+                    f"        value = get_{index}(instance)",
+                    "    except SkipField:",
+                    "        pass",
+                    "    else:",
+                    f"        {assign}",
+                ]
+            else:
+                lines += [f"    value = {getter}", f"    {assign}"]
+
+        lines.append("    return ret")
+        return "\n".join(lines) + "\n", namespace
+
+    def getter_expression(self, field):
+        """모델 필드/프로퍼티를 직접 읽을 수 있으면 그 표현식, 아니면 None"""
+        if self.model is None or field.source == "*" or len(field.source_attrs) != 1:
+            return None
+        name = field.source_attrs[0]
+        descriptor = self.model.__dict__.get(name)
+        if descriptor is None:
+            # 상속받은 속성
+            for klass in self.model.__mro__[1:]:
+                if name in klass.__dict__:
+                    descriptor = klass.__dict__[name]
+                    break
+        if isinstance(descriptor, DIRECT_DESCRIPTORS) or isinstance(
+            getattr(descriptor, "field", None), models.FileField
+        ):
+            return f"instance.{name}"
+        return None
+
+    def transform_expression(self, field, index, namespace):
+        """None이 아닌 값에 적용할 표현식"""
+        if type(field) in IDENTITY_FIELDS:
+            return "value"
+        if type(field) in BUILTIN_FIELDS:
+            return f"{BUILTIN_FIELDS[type(field)]}(value)"
+        if isinstance(field, serializers.FileField):
+            namespace[f"file_{index}"] = file_representation(field)
+            return f"file_{index}(value, context)"
+        if isinstance(field, serializers.ListSerializer):
+            namespace[f"nested_{index}"] = CompiledSerializer(field.child)
+            return f"nested_{index}.serialize(value, many=True, context=context)"
+        if isinstance(field, serializers.BaseSerializer):
+            namespace[f"nested_{index}"] = CompiledSerializer(field)
+            return f"nested_{index}.to_representation(value, context)"
+        namespace[f"represent_{index}"] = field.to_representation
+        return f"represent_{index}(value)"
+
+    @time_serializer
+    def serialize(self, instance, many=False, context=None):
+        """instance(many=True면 iterable/매니저)를 직렬화"""
+        context = context or {}
+        to_representation = self.to_representation
+        if not many:
+            return to_representation(instance, context)
+        if isinstance(instance, models.manager.BaseManager):
+            instance = instance.all()
+        return [to_representation(item, context) for item in instance]
+
+
+def compile_serializer(serializer_class, **kwargs):
+    """시리얼라이저 클래스를 컴파일 (kwargs는 시리얼라이저 생성 인자)"""
+    return CompiledSerializer(serializer_class(**kwargs))
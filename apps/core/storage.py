@@ -0,0 +1,216 @@
+"""
+내용 주소 기반(content-addressed) 파일 저장소
+
+파일명을 내용의 SHA-256 해시로 정해서 같은 파일은 한 번만 저장하고,
+StoredFile 테이블로 참조 수를 관리해 더 이상 참조되지 않는 파일을 삭제한다.
+파일명이 바뀌지 않으면 내용도 바뀌지 않으므로 immutable 캐시 헤더로 서빙할 수 있다.
+
+같은 내용의 업로드가 기존 파일을 재사용하는 도중에 파일이 삭제되지 않도록
+- 참조 수가 0이 되어도 바로 지우지 않고 행을 남긴다 (tombstone)
+- 저장/재사용 전에 reserve_file로 행의 수정 시간을 갱신한다
+- delete_unreferenced_files(gc)가 유예 시간이 지난 tombstone만 행을 잠근 채 다시 확인하고 삭제한다
+"""
+
+import hashlib
+import io
+import os
+import posixpath
+
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+# 내용 주소 기반 파일 응답에 사용하는 캐시 헤더
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def get_avatar_storage():
+    """User.avatar 저장소 (settings.STORAGES["avatars"])"""
+    return storages["avatars"]
+
+
+def get_export_storage():
+    """개인 데이터 내보내기 파일 저장소 (settings.STORAGES["exports"], 공개 URL 없음)"""
+    return storages["exports"]
+
+
+class IteratorFile(io.RawIOBase):
+    """
+    bytes 청크 이터레이터를 읽기 전용 파일 객체로 변환
+    storage.save(name, File(IteratorFile(chunks)))로 전체 내용을 메모리에 모으지 않고 저장한다
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.pending:
+            try:
+                self.pending = next(self.chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+
+class ContentAddressedStorageMixin:
+    """
+    저장 시 파일명을 <디렉터리>/<해시 앞 2자리>/<해시>.<확장자> 로 바꾸고,
+    같은 내용의 파일이 이미 있으면 새로 쓰지 않는다
+    """
+
+    def content_name(self, name, digest):
+        """원래 이름과 해시로 저장 경로 생성"""
+        directory = posixpath.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        return posixpath.join(directory, digest[:2], f"{digest}{extension}")
+
+    def _save(self, name, content):
+        digest = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content.seek(0)
+
+        name = self.content_name(name, digest.hexdigest())
+        reserve_file(name)
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+    def save_exact(self, name, content):
+        """이미 내용 기반 이름을 가진 파일(썸네일 등)을 이름 그대로 저장"""
+        if self.exists(name):
+            return name
+        return super()._save(name, content)
+
+    def promote(self, temp_name, name, digest):
+        """스트리밍으로 저장한 임시 파일을 해시 경로로 옮기고 최종 이름 반환"""
+        final_name = self.content_name(name, digest)
+        reserve_file(final_name)
+        if self.exists(final_name):
+            self.delete(temp_name)
+        else:
+            self.move(temp_name, final_name)
+        return final_name
+
+    def move(self, source, destination):
+        raise NotImplementedError
+
+
+class ContentAddressedFileSystemStorage(
+    ContentAddressedStorageMixin, FileSystemStorage
+):
+    """
+    로컬 파일시스템용 (개발/테스트)
+    """
+
+    def move(self, source, destination):
+        destination_path = self.path(destination)
+        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+        os.replace(self.path(source), destination_path)
+
+
+try:
+    from storages.backends.s3 import S3Storage
+    from storages.utils import clean_name
+except ImportError:  # django-storages는 production 그룹에만 포함
+    S3Storage = None
+
+
+if S3Storage is not None:
+
+    class ContentAddressedS3Storage(ContentAddressedStorageMixin, S3Storage):
+        """
+        S3 호환 스토리지용 (운영)
+        업로드하는 모든 객체에 immutable Cache-Control을 지정한다
+        """
+
+        def get_object_parameters(self, name):
+            params = super().get_object_parameters(name)
+            params.setdefault("CacheControl", IMMUTABLE_CACHE_CONTROL)
+            return params
+
+        def move(self, source, destination):
+            # 서버 측 복사 (메타데이터/Cache-Control 유지)
+            self.bucket.Object(self._normalize_name(clean_name(destination))).copy_from(
+                CopySource={
+                    "Bucket": self.bucket_name,
+                    "Key": self._normalize_name(clean_name(source)),
+                }
+            )
+            self.delete(source)
+
+
+def reserve_file(name):
+    """
+    내용 주소 기반 파일을 쓰거나 재사용하기 직전에 호출
+    참조 기록의 수정 시간을 갱신해 gc가 유예 시간 동안 삭제하지 않게 한다
+    (gc가 이 파일을 삭제하는 중이면 끝날 때까지 기다린 뒤 새 기록을 만든다)
+    """
+    from .models import StoredFile
+
+    if not StoredFile.objects.filter(name=name).update(updated_at=timezone.now()):
+        StoredFile.objects.get_or_create(name=name)
+
+
+def acquire_file(name):
+    """파일 참조 수 증가"""
+    from .models import StoredFile
+
+    while not StoredFile.objects.filter(name=name).update(
+        ref_count=F("ref_count") + 1, updated_at=timezone.now()
+    ):
+        _, created = StoredFile.objects.get_or_create(
+            name=name, defaults={"ref_count": 1}
+        )
+        if created:
+            return
+
+
+def release_file(name):
+    """
+    파일 참조 수 감소 (참조 기록이 없는 파일은 건드리지 않음)
+    0이 되어도 파일은 남겨두고 delete_unreferenced_files가 유예 시간 후 삭제한다
+    """
+    from .models import StoredFile
+
+    StoredFile.objects.filter(name=name, ref_count__gt=0).update(
+        ref_count=F("ref_count") - 1, updated_at=timezone.now()
+    )
+
+
+def delete_unreferenced_files(storage, prefix, before, on_delete=None):
+    """
+    before 이전부터 참조 수가 0인 파일 삭제 후 삭제한 수 반환
+    행을 잠근 채 다시 확인하고 커밋 전에 파일을 지우므로,
+    그사이 reserve_file/acquire_file로 다시 쓰인 파일은 남는다
+    """
+    from .models import StoredFile
+
+    candidates = StoredFile.objects.filter(
+        name__startswith=prefix, ref_count=0, updated_at__lt=before
+    ).values_list("pk", flat=True)
+    deleted = 0
+    for pk in list(candidates):
+        with transaction.atomic():
+            stored = (
+                StoredFile.objects.select_for_update()
+                .filter(pk=pk, ref_count=0, updated_at__lt=before)
+                .first()
+            )
+            if stored is None:
+                continue
+            storage.delete(stored.name)
+            if on_delete is not None:
+                on_delete(stored.name)
+            stored.delete()
+        deleted += 1
+    return deleted
@@ -0,0 +1,318 @@
+import threading
+import time
+from unittest import mock
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import (
+    Client,
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+
+from apps.users.models import User
+
+from . import health
+from .hll import HyperLogLog
+from .compression import CompressionMiddleware
+from .perf import CACHE_LOOKUPS, PerformanceMetricsMiddleware
+from .profiling import SamplingProfilerMiddleware
+from .routing import is_session_free
+from .views import schema_view
+
+TIERED_CACHES = {
+    "default": {
+        "BACKEND": "apps.core.cache.TieredCache",
+        "LOCATION": "tests",
+        "OPTIONS": {"L2": "shared", "L1_MAX_ENTRIES": 3, "L1_TIMEOUT": 60},
+    },
+    "shared": {
+        "BACKEND": "apps.core.cache.LocalSharedCache",
+        "LOCATION": "tests-shared",
+    },
+}
+
+
+@override_settings(CACHES=TIERED_CACHES)
+class TieredCacheTests(SimpleTestCase):
+    """
+    2단 캐시 (L1 LRU + LocalSharedCache L2)
+    """
+
+    def setUp(self):
+        self.cache = caches["default"]
+        self.cache.clear()
+
+    def lookups(self):
+        return dict(CACHE_LOOKUPS.series)
+
+    def test_l1_serves_after_l2_hit(self):
+        caches["shared"].set("key", "value")
+        before = self.lookups()
+
+        self.assertEqual(self.cache.get("key"), "value")
+        self.assertEqual(self.cache.get("key"), "value")
+
+        after = self.lookups()
+        self.assertEqual(after.get("l2", 0) - before.get("l2", 0), 1)
+        self.assertEqual(after.get("l1", 0) - before.get("l1", 0), 1)
+
+    def test_l1_is_bounded_lru(self):
+        for index in range(5):
+            self.cache.set(f"key{index}", index)
+        self.assertEqual(len(self.cache.l1), 3)
+
+        # L1에서 밀려난 값은 L2에서 조회
+        self.assertEqual(self.cache.get("key0"), 0)
+
+    def test_delete_and_versioning(self):
+        self.cache.set("key", "v1")
+        self.cache.delete("key")
+        self.assertIsNone(self.cache.get("key"))
+        self.assertIsNone(caches["shared"].get("key"))
+
+        self.cache.set("key", "v1", version=1)
+        self.cache.set("key", "v2", version=2)
+        self.assertEqual(self.cache.get("key", version=1), "v1")
+        self.assertEqual(self.cache.get("key", version=2), "v2")
+
+    def test_l1_copies_values(self):
+        value = {"items": [1]}
+        self.cache.set("key", value)
+        self.cache.get("key")["items"].append(2)
+        self.assertEqual(self.cache.get("key"), {"items": [1]})
+
+    def test_get_or_compute_single_flight(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "computed"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    self.cache.get_or_compute("expensive", compute, timeout=60)
+                )
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["computed"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.cache.get_or_compute("expensive", compute), "computed")
+        self.assertEqual(len(calls), 1)
+
+    def test_get_or_compute_recomputes_expired(self):
+        self.assertEqual(self.cache.get_or_compute("key", lambda: 1, timeout=60), 1)
+        # 만료 직전 값은 재계산 (delta가 남은 시간보다 훨씬 큼)
+        self.cache.set("key", (1, time.time() + 0.001, 10.0), timeout=60)
+        self.assertEqual(self.cache.get_or_compute("key", lambda: 2, timeout=60), 2)
+
+
+class SessionFreeRoutingTests(TestCase):
+    """
+    /api/ 요청은 세션/CSRF/인증 미들웨어를 건너뜀 (JWT만 사용)
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="session@example.com", password="password123"
+        )
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.user)
+
+    def test_api_ignores_session(self):
+        response = self.client.get("/api/auth/status/")
+        self.assertFalse(response.json()["data"]["is_authenticated"])
+        self.assertEqual(dict(response.cookies), {})
+
+    def test_admin_keeps_session(self):
+        response = self.client.get("/admin/login/")
+        self.assertIn("csrftoken", response.cookies)
+
+    def test_is_session_free(self):
+        factory = RequestFactory()
+        self.assertTrue(is_session_free(factory.get("/api/auth/status/")))
+        self.assertFalse(is_session_free(factory.get("/api/auth/social/kakao/")))
+        self.assertFalse(is_session_free(factory.get("/admin/login/")))
+
+    @override_settings(SESSION_FREE_API=False)
+    def test_disabled(self):
+        self.assertFalse(is_session_free(RequestFactory().get("/api/auth/status/")))
+        response = self.client.get("/admin/login/")
+        self.assertIn("csrftoken", response.cookies)
+
+
+class HealthProbeTests(TestCase):
+    """
+    readiness 프로브: 멈춘 프로브는 끝날 때까지 다시 제출하지 않음
+    """
+
+    def test_hung_probe_is_not_resubmitted(self):
+        release = threading.Event()
+        calls = []
+
+        def hang():
+            calls.append(1)
+            release.wait(5)
+
+        probes = {**health.PROBES, "mail": hang}
+        with (
+            mock.patch.object(health, "PROBES", probes),
+            self.settings(HEALTH_CHECK_TIMEOUT=0.05),
+        ):
+            for _ in range(3):
+                healthy, checks = health.run_probes()
+                self.assertFalse(healthy)
+                self.assertEqual(checks["mail"]["error"], "timeout")
+                self.assertEqual(checks["database"]["status"], "ok")
+                self.assertEqual(checks["cache"]["status"], "ok")
+            self.assertEqual(len(calls), 1)
+
+            # 멈춘 프로브가 끝나면 다음 확인에서 다시 실행
+            release.set()
+            health._running["mail"].result(timeout=5)
+            healthy, checks = health.run_probes()
+            self.assertTrue(healthy)
+            self.assertEqual(len(calls), 2)
+
+
+class SchemaViewTests(SimpleTestCase):
+    """
+    사전 생성된 스키마: 인코딩별 본문마다 다른 ETag
+    """
+
+    ARTIFACTS = {
+        "yaml": {
+            "media_type": "application/yaml",
+            "etag": '"abc"',
+            "content": b"openapi: 3.0.3",
+            "variants": {"gzip": b"gz", "br": b"br"},
+        }
+    }
+
+    def get(self, **headers):
+        request = RequestFactory().get("/api/schema/", headers=headers)
+        with mock.patch(
+            "apps.core.views.load_schema_artifacts", return_value=self.ARTIFACTS
+        ):
+            return schema_view(request)
+
+    def test_etag_per_encoding(self):
+        self.assertEqual(self.get()["ETag"], '"abc"')
+        response = self.get(accept_encoding="gzip")
+        self.assertEqual(response["ETag"], '"abc-gzip"')
+        self.assertEqual(response.content, b"gz")
+        self.assertEqual(self.get(accept_encoding="br, gzip")["ETag"], '"abc-br"')
+
+        # 다른 인코딩의 ETag로는 304가 나가지 않음
+        response = self.get(accept_encoding="br", if_none_match='"abc"')
+        self.assertEqual(response.status_code, 200)
+        response = self.get(accept_encoding="br", if_none_match='"abc-br"')
+        self.assertEqual(response.status_code, 304)
+
+
+class MetricsAccessTests(SimpleTestCase):
+    """
+    /api/metrics/ 는 토큰이나 허용 대역이 없으면 DEBUG에서만 공개
+    """
+
+    @override_settings(PERF_METRICS_TOKEN="", PERF_METRICS_ALLOWED_NETWORKS=[])
+    def test_private_by_default(self):
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 403)
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get("/api/metrics/").status_code, 200)
+
+    @override_settings(PERF_METRICS_TOKEN="secret", PERF_METRICS_ALLOWED_NETWORKS=[])
+    def test_token(self):
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 401)
+        response = self.client.get(
+            "/api/metrics/", headers={"authorization": "Bearer secret"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(
+        PERF_METRICS_TOKEN="", PERF_METRICS_ALLOWED_NETWORKS=["10.0.0.0/8"]
+    )
+    def test_allowed_networks(self):
+        self.assertEqual(self.client.get("/api/metrics/").status_code, 403)
+        response = self.client.get("/api/metrics/", REMOTE_ADDR="10.1.2.3")
+        self.assertEqual(response.status_code, 200)
+
+
+@override_settings(
+    PERF_METRICS_ENABLED=True, COMPRESSION_ENABLED=True, PROFILER_ENABLED=True
+)
+class AsyncMiddlewareTests(SimpleTestCase):
+    """
+    ASGI에서 공통 미들웨어가 스레드를 거치지 않고 비동기로 동작
+    """
+
+    MIDDLEWARE = (
+        health.HealthCheckMiddleware,
+        PerformanceMetricsMiddleware,
+        CompressionMiddleware,
+        SamplingProfilerMiddleware,
+    )
+
+    async def test_async_chain(self):
+        async def view(request):
+            return HttpResponse("x" * 4096, content_type="application/json")
+
+        handler = view
+        for middleware in reversed(self.MIDDLEWARE):
+            handler = middleware(handler)
+            self.assertTrue(iscoroutinefunction(handler), middleware.__name__)
+
+        request = RequestFactory().get("/api/", HTTP_ACCEPT_ENCODING="gzip")
+        response = await handler(request)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Server-Timing", response)
+
+        request = RequestFactory().get(settings.HEALTH_CHECK_LIVENESS_PATH)
+        self.assertEqual((await handler(request)).status_code, 200)
+
+    def test_sync_chain(self):
+        def view(request):
+            return HttpResponse("ok")
+
+        handler = view
+        for middleware in reversed(self.MIDDLEWARE):
+            handler = middleware(handler)
+            self.assertFalse(iscoroutinefunction(handler), middleware.__name__)
+        self.assertEqual(handler(RequestFactory().get("/api/")).content, b"ok")
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_count_and_union(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        for value in range(30000):
+            first.add(value)
+            first.add(value)  # 중복은 무시
+        for value in range(20000, 60000):
+            second.add(value)
+
+        self.assertAlmostEqual(first.count(), 30000, delta=30000 * 0.05)
+        union = HyperLogLog.union([first, second])
+        self.assertAlmostEqual(union.count(), 60000, delta=60000 * 0.05)
+
+        # 저장 형식(bytes)으로 되돌려도 같고, 같은 스케치를 다시 합쳐도 같음
+        restored = HyperLogLog(bytes(union))
+        self.assertEqual(bytes(restored.update(first)), bytes(union))
+
+    def test_small_counts_are_exact(self):
+        sketch = HyperLogLog()
+        for value in range(10):
+            sketch.add(f"user-{value}")
+        self.assertEqual(sketch.count(), 10)
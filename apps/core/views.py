@@ -0,0 +1,108 @@
+import ipaddress
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_safe
+
+from .http import choose_encoding, etag_matches
+from .perf import render_metrics
+from .schema import load_schema_artifacts
+
+
+def negotiate_schema_format(request):
+    """?format= 파라미터 또는 Accept 헤더로 스키마 포맷 결정 (기본값: yaml)"""
+    fmt = request.GET.get("format")
+    if fmt in ("json", "yaml"):
+        return fmt
+    if "json" in request.META.get("HTTP_ACCEPT", ""):
+        return "json"
+    return "yaml"
+
+
+@require_safe
+def schema_view(request):
+    """
+    사전 생성된 OpenAPI 스키마 서빙
+    조건부 GET(If-None-Match)과 사전 압축된 gzip/brotli 변형을 지원 (ETag는 인코딩별)
+    """
+    artifacts = load_schema_artifacts()
+
+    if artifacts is None:
+        # 개발 환경에서만 요청마다 스키마를 생성
+        if settings.DEBUG:
+            from drf_spectacular.views import SpectacularAPIView
+
+            return SpectacularAPIView.as_view()(request)
+        return JsonResponse(
+            {
+                "success": False,
+                "message": "API 스키마가 생성되지 않았습니다. build_schema 명령을 실행해주세요.",
+            },
+            status=503,
+        )
+
+    artifact = artifacts[negotiate_schema_format(request)]
+    encoding = choose_encoding(
+        request, [name for name in ("br", "gzip") if name in artifact["variants"]]
+    )
+    # 인코딩마다 본문 바이트가 다르므로 ETag도 인코딩별로 구분 ("<해시>-br")
+    etag = artifact["etag"]
+    if encoding:
+        etag = f'{etag[:-1]}-{encoding}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, no-cache",
+        "Vary": "Accept, Accept-Encoding",
+    }
+
+    if etag_matches(request, etag):
+        return HttpResponseNotModified(headers=headers)
+
+    if encoding:
+        body = artifact["variants"][encoding]
+        headers["Content-Encoding"] = encoding
+    else:
+        body = artifact["content"]
+
+    return HttpResponse(body, content_type=artifact["media_type"], headers=headers)
+
+
+def metrics_allowed(request):
+    """
+    메트릭 접근 허용 여부
+    PERF_METRICS_TOKEN의 Bearer 토큰 또는 PERF_METRICS_ALLOWED_NETWORKS 안의 주소만 허용하고,
+    둘 다 설정되지 않았으면 DEBUG에서만 허용
+    """
+    token = settings.PERF_METRICS_TOKEN
+    if token:
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        if constant_time_compare(header, f"Bearer {token}"):
+            return True
+
+    networks = settings.PERF_METRICS_ALLOWED_NETWORKS
+    if networks:
+        try:
+            address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+        except ValueError:
+            return False
+        return any(
+            address in ipaddress.ip_network(network, strict=False)
+            for network in networks
+        )
+
+    return not token and settings.DEBUG
+
+
+@require_safe
+def metrics_view(request):
+    """
+    Prometheus 메트릭 엔드포인트 (프로세스 단위 집계)
+    운영 환경에서는 토큰이나 내부망 대역 설정이 필요 (metrics_allowed 참고)
+    """
+    if not metrics_allowed(request):
+        return HttpResponse(status=401 if settings.PERF_METRICS_TOKEN else 403)
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,40 @@
+from django.contrib import admin
+
+from .models import Delivery, Notification, PushSubscription
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    """
+    앱 내 알림 어드민
+    """
+
+    list_display = ["created_at", "user", "event", "title", "read_at"]
+    list_filter = ["event"]
+    search_fields = ["user__email", "dedup_key"]
+    raw_id_fields = ["user"]
+    ordering = ["-created_at"]
+
+
+@admin.register(Delivery)
+class DeliveryAdmin(admin.ModelAdmin):
+    """
+    알림 발송함 어드민
+    """
+
+    list_display = ["created_at", "channel", "user", "status", "attempts", "sent_at"]
+    list_filter = ["channel", "status"]
+    search_fields = ["user__email", "dedup_key"]
+    raw_id_fields = ["user"]
+    ordering = ["-created_at"]
+
+
+@admin.register(PushSubscription)
+class PushSubscriptionAdmin(admin.ModelAdmin):
+    """
+    웹 푸시 구독 어드민
+    """
+
+    list_display = ["created_at", "user", "endpoint"]
+    search_fields = ["user__email", "endpoint"]
+    raw_id_fields = ["user"]
@@ -0,0 +1,213 @@
+"""
+알림 채널
+
+settings.NOTIFICATION_CHANNELS에 등록한 채널로 알림을 보낸다. 채널은 두 단계로 나뉜다.
+- enqueue(job, recipients): fan-out 단계. (받는 사람, 렌더링된 메시지) 묶음을 알림함/발송함에
+  bulk_create로 기록한다 (같은 dedup_key는 유니크 제약으로 무시되어 재실행해도 중복되지 않음)
+- send(deliveries): 발송함(Delivery)을 쓰는 채널만. send_notifications 명령이 BATCH_SIZE개 묶음을
+  채널별 CONCURRENCY개 스레드에서 호출하므로 DB에 접근하지 않는다 (필요한 값은 enqueue 때 payload에 넣음)
+"""
+
+import json
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMessage, get_connection
+
+from apps.core.pubsub import get_pubsub
+
+from .models import Delivery, Notification, PushSubscription
+
+try:
+    from pywebpush import WebPushException, webpush
+except ImportError:  # pywebpush는 웹 푸시를 쓰는 배포에만 설치
+    webpush = None
+
+logger = logging.getLogger(__name__)
+
+
+def stream_channel(user_id):
+    """사용자의 실시간 알림 스트림(SSE) pub/sub 채널"""
+    return f"notifications:{user_id}"
+
+
+class Channel:
+    # UserProfile 알림 설정 필드 (None이면 설정과 관계없이 보냄)
+    preference = None
+
+    # Delivery 발송함을 거쳐 send()로 발송하는 채널인지
+    outbox = False
+
+    def __init__(self, name, batch_size=500, concurrency=1):
+        self.name = name
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    def accepts(self, recipient):
+        if self.preference is None:
+            return True
+        # 프로필이 없는 사용자는 모델 기본값(받음)
+        return getattr(recipient, self.preference) is not False
+
+    def enqueue(self, job, recipients):
+        """(Recipient, Message) 목록 기록 후 기록 시도한 수 반환"""
+        raise NotImplementedError
+
+    def send(self, deliveries):
+        """Delivery 묶음 발송 후 각 Delivery의 오류 메시지(성공은 None) 목록 반환"""
+        raise NotImplementedError
+
+    def create_deliveries(self, job, payloads):
+        """(user_id, payload) 목록을 발송함에 기록"""
+        deliveries = [
+            Delivery(
+                channel=self.name,
+                user_id=user_id,
+                dedup_key=job.dedup_key,
+                payload=payload,
+            )
+            for user_id, payload in payloads
+        ]
+        Delivery.objects.bulk_create(
+            deliveries, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        return len(deliveries)
+
+
+class InAppChannel(Channel):
+    """앱 내 알림함 - 기록이 곧 전달 (스트림에 연결된 사용자에게는 바로 발행)"""
+
+    def enqueue(self, job, recipients):
+        notifications = [
+            Notification(
+                user_id=recipient.pk,
+                event=job.event,
+                title=message.subject,
+                body=message.body,
+                data=job.data,
+                dedup_key=job.dedup_key,
+            )
+            for recipient, message in recipients
+        ]
+        Notification.objects.bulk_create(
+            notifications, batch_size=self.batch_size, ignore_conflicts=True
+        )
+        # 재실행으로 다시 발행될 수 있으므로 클라이언트는 id(dedup_key)로 중복을 거른다
+        get_pubsub().publish_many(
+            (
+                stream_channel(notification.user_id),
+                {
+                    "id": notification.dedup_key,
+                    "event": notification.event,
+                    "title": notification.title,
+                    "body": notification.body,
+                    "data": notification.data,
+                },
+            )
+            for notification in notifications
+        )
+        return len(notifications)
+
+
+class EmailChannel(Channel):
+    """이메일 - 묶음마다 메일 연결 하나로 보냄"""
+
+    preference = "email_notifications"
+    outbox = True
+
+    def enqueue(self, job, recipients):
+        return self.create_deliveries(
+            job,
+            (
+                (
+                    recipient.pk,
+                    {
+                        "to": recipient.email,
+                        "subject": message.subject,
+                        "body": message.body,
+                    },
+                )
+                for recipient, message in recipients
+            ),
+        )
+
+    def send(self, deliveries):
+        messages = [
+            EmailMessage(
+                delivery.payload["subject"],
+                delivery.payload["body"],
+                settings.DEFAULT_FROM_EMAIL,
+                [delivery.payload["to"]],
+            )
+            for delivery in deliveries
+        ]
+        get_connection().send_messages(messages)
+        return [None] * len(deliveries)
+
+
+class WebPushChannel(Channel):
+    """브라우저 웹 푸시 (pywebpush + VAPID) - 구독이 있는 사용자에게만"""
+
+    preference = "push_notifications"
+    outbox = True
+
+    def enqueue(self, job, recipients):
+        recipients = list(recipients)
+        subscriptions = {}
+        for user_id, endpoint, p256dh, auth in PushSubscription.objects.filter(
+            user_id__in=[recipient.pk for recipient, _ in recipients]
+        ).values_list("user_id", "endpoint", "p256dh", "auth"):
+            subscriptions.setdefault(user_id, []).append(
+                {"endpoint": endpoint, "keys": {"p256dh": p256dh, "auth": auth}}
+            )
+
+        return self.create_deliveries(
+            job,
+            (
+                (
+                    recipient.pk,
+                    {
+                        "title": message.subject,
+                        "body": message.body,
+                        "data": job.data,
+                        "subscriptions": subscriptions[recipient.pk],
+                    },
+                )
+                for recipient, message in recipients
+                if recipient.pk in subscriptions
+            ),
+        )
+
+    def send(self, deliveries):
+        if webpush is None:
+            raise ImproperlyConfigured("웹 푸시 발송에는 pywebpush가 필요합니다.")
+        if not settings.WEBPUSH_VAPID_PRIVATE_KEY:
+            raise ImproperlyConfigured(
+                "WEBPUSH_VAPID_PRIVATE_KEY가 설정되지 않았습니다."
+            )
+
+        errors = []
+        for delivery in deliveries:
+            payload = delivery.payload
+            data = json.dumps(
+                {key: payload[key] for key in ("title", "body", "data")},
+                ensure_ascii=False,
+            )
+            delivered, error = False, None
+            for subscription in payload["subscriptions"]:
+                try:
+                    webpush(
+                        subscription_info=subscription,
+                        data=data,
+                        vapid_private_key=settings.WEBPUSH_VAPID_PRIVATE_KEY,
+                        vapid_claims={"sub": f"mailto:{settings.DEFAULT_FROM_EMAIL}"},
+                    )
+                    delivered = True
+                except WebPushException as exc:
+                    # 만료된 구독(404/410)은 다른 구독 발송을 막지 않음
+                    logger.warning("웹 푸시 실패: %s", exc)
+                    error = str(exc)
+            # 한 기기라도 받았으면 재시도하지 않음 (재시도하면 받은 기기에 중복 발송)
+            errors.append(None if delivered else error)
+        return errors
@@ -0,0 +1,235 @@
+"""
+알림 fan-out / 발송
+
+dispatch(event, users)는 받는 사람을 pk 순서로 NOTIFICATION_FANOUT_CHUNK_SIZE명씩 읽어 채널에 기록한다.
+- 사용자와 알림 설정(UserProfile)은 묶음마다 JOIN 쿼리 하나로 읽는다 (사용자별 조회 없음)
+- 템플릿은 (언어, 시간대) 조합마다 한 번만 렌더링한다
+- 메모리에는 한 묶음과 렌더링 결과만 올라가므로 받는 사람 수와 관계없이 일정하다
+- 같은 dedup_key로 다시 실행하면 이미 기록된 사용자는 건너뛴다 (중단된 발송 재개)
+
+send_pending(channel)은 발송함(Delivery)의 대기 건을 BATCH_SIZE개씩 점유해 채널별 CONCURRENCY개
+스레드에서 발송하고, 실패한 건은 NOTIFICATION_MAX_ATTEMPTS까지 다시 시도한다.
+"""
+
+import logging
+import uuid
+import zoneinfo
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.template.loader import select_template
+from django.utils import timezone, translation
+from django.utils.module_loading import import_string
+
+from apps.users.models import User
+
+from .models import Delivery
+
+logger = logging.getLogger(__name__)
+
+Recipient = namedtuple(
+    "Recipient",
+    "pk email language timezone email_notifications push_notifications",
+)
+Message = namedtuple("Message", "subject body")
+
+RECIPIENT_FIELDS = (
+    "email",
+    "language",
+    "timezone",
+    "profile__email_notifications",
+    "profile__push_notifications",
+)
+
+
+@dataclass(frozen=True)
+class NotificationJob:
+    event: str
+    dedup_key: str
+    context: dict = field(default_factory=dict)
+    data: dict = field(default_factory=dict)
+
+
+@lru_cache(maxsize=None)
+def get_channel(name):
+    config = settings.NOTIFICATION_CHANNELS[name]
+    return import_string(config["BACKEND"])(
+        name,
+        batch_size=config.get("BATCH_SIZE", 500),
+        concurrency=config.get("CONCURRENCY", 1),
+    )
+
+
+def get_channels(names=None):
+    return [get_channel(name) for name in names or settings.NOTIFICATION_CHANNELS]
+
+
+def render_message(event, context, language, tz):
+    """이벤트 템플릿을 언어/시간대에 맞춰 렌더링 (notifications/<event>/{subject,body}[.<언어>].txt)"""
+    try:
+        tz = zoneinfo.ZoneInfo(tz)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        tz = zoneinfo.ZoneInfo(settings.TIME_ZONE)
+
+    with translation.override(language), timezone.override(tz):
+        subject, body = (
+            select_template(
+                [
+                    f"notifications/{event}/{part}.{language}.txt",
+                    f"notifications/{event}/{part}.txt",
+                ]
+            ).render(context)
+            for part in ("subject", "body")
+        )
+    return Message(" ".join(subject.split()), body.strip())
+
+
+def iter_recipients(users, chunk_size):
+    """받는 사람과 알림 설정을 pk 순서로 chunk_size명씩 (OFFSET 없이 마지막 pk 다음부터)"""
+    last_pk = 0
+    while rows := list(
+        users.filter(pk__gt=last_pk)
+        .order_by("pk")
+        .values_list("pk", *RECIPIENT_FIELDS)[:chunk_size]
+    ):
+        yield [Recipient(*row) for row in rows]
+        last_pk = rows[-1][0]
+
+
+def dispatch(
+    event,
+    users=None,
+    context=None,
+    data=None,
+    dedup_key=None,
+    channels=None,
+    chunk_size=None,
+):
+    """
+    event 알림을 users(기본: 활성 사용자 전체)에게 채널별로 기록하고 채널별 기록 수 반환
+    탈퇴/비활성 사용자는 항상 제외한다
+    """
+    if users is None:
+        users = User.objects.all()
+    users = users.alive().filter(is_active=True)
+    job = NotificationJob(
+        event,
+        dedup_key or f"{event}:{uuid.uuid4().hex}",
+        context or {},
+        data or {},
+    )
+    channels = get_channels(channels)
+
+    messages = {}
+    counts = Counter()
+    chunk_size = chunk_size or settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+    for recipients in iter_recipients(users, chunk_size):
+        rendered = []
+        for recipient in recipients:
+            key = (recipient.language, recipient.timezone)
+            message = messages.get(key)
+            if message is None:
+                message = messages[key] = render_message(event, job.context, *key)
+            rendered.append((recipient, message))
+
+        for channel in channels:
+            accepted = [item for item in rendered if channel.accepts(item[0])]
+            if accepted:
+                counts[channel.name] += channel.enqueue(job, accepted)
+    return counts
+
+
+def claim_deliveries(channel, limit, after=0):
+    """대기 중이거나 점유가 만료된 Delivery를 pk가 after보다 큰 것부터 limit개까지 점유"""
+    now = timezone.now()
+    claimable = Delivery.objects.filter(channel=channel.name, pk__gt=after).filter(
+        Q(status=Delivery.STATUS_PENDING)
+        | Q(status=Delivery.STATUS_SENDING, locked_until__lt=now)
+    )
+    pks = list(claimable.order_by("pk").values_list("pk", flat=True)[:limit])
+    locked_until = now + timedelta(seconds=settings.NOTIFICATION_SEND_LEASE_SECONDS)
+    claimable.filter(pk__in=pks).update(
+        status=Delivery.STATUS_SENDING, locked_until=locked_until
+    )
+    # 다른 워커가 먼저 점유한 건은 locked_until이 다르다
+    return list(
+        Delivery.objects.filter(
+            pk__in=pks, status=Delivery.STATUS_SENDING, locked_until=locked_until
+        )
+        .order_by("pk")
+        .only("pk", "payload", "attempts")
+    )
+
+
+def send_batch(channel, deliveries):
+    """채널 발송 (예외는 묶음 전체 실패로 처리)"""
+    try:
+        return channel.send(deliveries)
+    except Exception as exc:
+        logger.exception("%s 채널 발송 실패 (%d건)", channel.name, len(deliveries))
+        return [str(exc)] * len(deliveries)
+
+
+def record_results(deliveries, errors):
+    sent = [delivery.pk for delivery, error in zip(deliveries, errors) if not error]
+    if sent:
+        Delivery.objects.filter(pk__in=sent).update(
+            status=Delivery.STATUS_SENT,
+            attempts=F("attempts") + 1,
+            locked_until=None,
+            error="",
+            sent_at=timezone.now(),
+        )
+    failed = 0
+    for delivery, error in zip(deliveries, errors):
+        if not error:
+            continue
+        attempts = delivery.attempts + 1
+        retry = attempts < settings.NOTIFICATION_MAX_ATTEMPTS
+        Delivery.objects.filter(pk=delivery.pk).update(
+            status=Delivery.STATUS_PENDING if retry else Delivery.STATUS_FAILED,
+            attempts=attempts,
+            locked_until=None,
+            error=error,
+        )
+        failed += not retry
+    return len(sent), failed
+
+
+def send_pending(channel, limit=None):
+    """
+    채널 발송함의 대기 건을 CONCURRENCY개 스레드에서 BATCH_SIZE개씩 발송
+    (발송 수, 최종 실패 수) 반환. limit은 이번 실행에서 점유할 최대 건수
+    """
+    sent = failed = claimed = last_pk = 0
+    with ThreadPoolExecutor(
+        max_workers=channel.concurrency, thread_name_prefix=f"notify-{channel.name}"
+    ) as executor:
+        while limit is None or claimed < limit:
+            size = channel.batch_size * channel.concurrency
+            if limit is not None:
+                size = min(size, limit - claimed)
+            # 이번 실행에서 실패한 건은 다음 실행에서 다시 시도 (pk 순서로 한 번씩만)
+            deliveries = claim_deliveries(channel, size, after=last_pk)
+            if not deliveries:
+                break
+            claimed += len(deliveries)
+            last_pk = deliveries[-1].pk
+
+            batches = [
+                deliveries[start : start + channel.batch_size]
+                for start in range(0, len(deliveries), channel.batch_size)
+            ]
+            # DB 갱신은 현재 스레드에서 (발송 스레드는 DB에 접근하지 않음)
+            for batch, errors in zip(
+                batches, executor.map(lambda batch: send_batch(channel, batch), batches)
+            ):
+                batch_sent, batch_failed = record_results(batch, errors)
+                sent += batch_sent
+                failed += batch_failed
+    return sent, failed
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.notifications.dispatch import dispatch
+
+
+class Command(BaseCommand):
+    help = "활성 사용자 전체에게 공지 알림을 기록합니다 (외부 채널은 send_notifications가 발송)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--title", required=True, help="공지 제목")
+        parser.add_argument("--message", required=True, help="공지 내용")
+        parser.add_argument(
+            "--dedup-key",
+            help="중복 방지 키. 같은 키로 다시 실행하면 이미 기록된 사용자는 건너뜀",
+        )
+        parser.add_argument(
+            "--channels",
+            nargs="+",
+            choices=list(settings.NOTIFICATION_CHANNELS),
+            help="보낼 채널 (기본값: 전체)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.NOTIFICATION_FANOUT_CHUNK_SIZE,
+            help="한 번에 읽을 사용자 수 "
+            f"(기본값: {settings.NOTIFICATION_FANOUT_CHUNK_SIZE})",
+        )
+
+    def handle(self, *args, **options):
+        counts = dispatch(
+            "announcement",
+            context={
+                "title": options["title"],
+                "message": options["message"],
+                "sent_at": timezone.now(),
+            },
+            dedup_key=options["dedup_key"],
+            channels=options["channels"],
+            chunk_size=options["chunk_size"],
+        )
+        for channel, count in sorted(counts.items()):
+            self.stdout.write(f"{channel}: {count}건")
+        self.stdout.write(self.style.SUCCESS("공지 알림 기록 완료"))
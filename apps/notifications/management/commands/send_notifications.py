@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.notifications.dispatch import get_channels, send_pending
+
+
+class Command(BaseCommand):
+    help = "이메일/웹 푸시 발송함의 대기 알림을 채널별 동시 실행 수 제한 안에서 발송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--channels",
+            nargs="+",
+            help="발송할 채널 (기본값: 발송함을 쓰는 채널 전체)",
+        )
+        parser.add_argument(
+            "--limit", type=int, help="채널별로 이번 실행에서 발송할 최대 건수"
+        )
+
+    def handle(self, *args, **options):
+        for channel in get_channels(options["channels"]):
+            if not channel.outbox:
+                continue
+            sent, failed = send_pending(channel, limit=options["limit"])
+            self.stdout.write(f"{channel.name}: 발송 {sent}건, 실패 {failed}건")
+        self.stdout.write(self.style.SUCCESS("알림 발송 완료"))
@@ -0,0 +1,149 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PushSubscription",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "endpoint",
+                    models.URLField(max_length=500, unique=True, verbose_name="엔드포인트"),
+                ),
+                ("p256dh", models.CharField(max_length=200, verbose_name="p256dh 키")),
+                ("auth", models.CharField(max_length=100, verbose_name="auth 키")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="push_subscriptions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "웹 푸시 구독",
+                "verbose_name_plural": "웹 푸시 구독들",
+                "db_table": "push_subscriptions",
+            },
+        ),
+        migrations.CreateModel(
+            name="Delivery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("channel", models.CharField(max_length=20, verbose_name="채널")),
+                ("dedup_key", models.CharField(max_length=100, verbose_name="중복 방지 키")),
+                ("payload", models.JSONField(verbose_name="발송 내용")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("sending", "발송 중"),
+                            ("sent", "발송 완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수")),
+                (
+                    "locked_until",
+                    models.DateTimeField(blank=True, null=True, verbose_name="점유 만료 시각"),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                ("sent_at", models.DateTimeField(blank=True, null=True, verbose_name="발송 시간")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notification_deliveries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "알림 발송",
+                "verbose_name_plural": "알림 발송들",
+                "db_table": "notification_deliveries",
+                "indexes": [
+                    models.Index(
+                        fields=["channel", "status", "id"], name="notificatio_channel_fe3212_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("channel", "user", "dedup_key"),
+                        name="notification_deliveries_dedup_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="Notification",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("event", models.CharField(max_length=50, verbose_name="이벤트")),
+                ("title", models.CharField(max_length=200, verbose_name="제목")),
+                ("body", models.TextField(blank=True, verbose_name="내용")),
+                ("data", models.JSONField(blank=True, default=dict, verbose_name="추가 정보")),
+                ("dedup_key", models.CharField(max_length=100, verbose_name="중복 방지 키")),
+                ("read_at", models.DateTimeField(blank=True, null=True, verbose_name="읽은 시간")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notifications",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "알림",
+                "verbose_name_plural": "알림들",
+                "db_table": "notifications",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at"], name="notificatio_user_id_611c58_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "dedup_key"), name="notifications_dedup_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.db import models
+
+
+class Notification(models.Model):
+    """
+    앱 내 알림함 (in_app 채널)
+    같은 사용자에게 같은 dedup_key의 알림은 한 번만 저장된다
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notifications",
+    )
+
+    event = models.CharField("이벤트", max_length=50)
+    title = models.CharField("제목", max_length=200)
+    body = models.TextField("내용", blank=True)
+    data = models.JSONField("추가 정보", default=dict, blank=True)
+    dedup_key = models.CharField("중복 방지 키", max_length=100)
+
+    read_at = models.DateTimeField("읽은 시간", null=True, blank=True)
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+
+    class Meta:
+        db_table = "notifications"
+        verbose_name = "알림"
+        verbose_name_plural = "알림들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "dedup_key"], name="notifications_dedup_uniq"
+            )
+        ]
+        indexes = [models.Index(fields=["user", "-created_at"])]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.title}"
+
+
+class Delivery(models.Model):
+    """
+    외부 채널(이메일/웹 푸시) 발송함
+    fan-out은 여기에 기록만 하고, send_notifications 명령이 채널별 동시 실행 수 제한 안에서 묶음 발송한다
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    channel = models.CharField("채널", max_length=20)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="notification_deliveries",
+    )
+    dedup_key = models.CharField("중복 방지 키", max_length=100)
+    payload = models.JSONField("발송 내용")
+
+    status = models.CharField(
+        "상태",
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, "대기"),
+            (STATUS_SENDING, "발송 중"),
+            (STATUS_SENT, "발송 완료"),
+            (STATUS_FAILED, "실패"),
+        ],
+        default=STATUS_PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField("시도 횟수", default=0)
+    locked_until = models.DateTimeField("점유 만료 시각", null=True, blank=True)
+    error = models.TextField("마지막 오류", blank=True)
+
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+    sent_at = models.DateTimeField("발송 시간", null=True, blank=True)
+
+    class Meta:
+        db_table = "notification_deliveries"
+        verbose_name = "알림 발송"
+        verbose_name_plural = "알림 발송들"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["channel", "user", "dedup_key"],
+                name="notification_deliveries_dedup_uniq",
+            )
+        ]
+        indexes = [models.Index(fields=["channel", "status", "id"])]
+
+    def __str__(self):
+        return f"{self.channel} → {self.user_id} ({self.get_status_display()})"
+
+
+class PushSubscription(models.Model):
+    """
+    브라우저 웹 푸시 구독 (PushSubscription.toJSON()의 endpoint/keys)
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="push_subscriptions",
+    )
+    endpoint = models.URLField("엔드포인트", max_length=500, unique=True)
+    p256dh = models.CharField("p256dh 키", max_length=200)
+    auth = models.CharField("auth 키", max_length=100)
+
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+
+    class Meta:
+        db_table = "push_subscriptions"
+        verbose_name = "웹 푸시 구독"
+        verbose_name_plural = "웹 푸시 구독들"
+
+    def __str__(self):
+        return f"{self.user_id} - {self.endpoint[:50]}"
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from .models import Notification, PushSubscription
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    """
+    앱 내 알림 시리얼라이저
+    """
+
+    class Meta:
+        model = Notification
+        fields = ["id", "event", "title", "body", "data", "read_at", "created_at"]
+        read_only_fields = fields
+
+
+class PushSubscriptionSerializer(serializers.Serializer):
+    """
+    웹 푸시 구독 시리얼라이저 (브라우저 PushSubscription.toJSON() 형식)
+    """
+
+    endpoint = serializers.URLField(max_length=500)
+    keys = serializers.DictField(child=serializers.CharField(max_length=200))
+
+    def validate_keys(self, value):
+        if not value.get("p256dh") or not value.get("auth"):
+            raise serializers.ValidationError("p256dh와 auth 키가 필요합니다.")
+        return value
+
+    def save(self, user):
+        subscription, _ = PushSubscription.objects.update_or_create(
+            endpoint=self.validated_data["endpoint"],
+            defaults={
+                "user": user,
+                "p256dh": self.validated_data["keys"]["p256dh"],
+                "auth": self.validated_data["keys"]["auth"],
+            },
+        )
+        return subscription
@@ -0,0 +1,16 @@
+"""
+알림 관련 시그널
+
+NOTIFICATION_CHANNELS가 바뀌면(테스트의 override_settings 등) 생성해 둔 채널을 버린다.
+"""
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .dispatch import get_channel
+
+
+@receiver(setting_changed)
+def notification_settings_changed(setting, **kwargs):
+    if setting == "NOTIFICATION_CHANNELS":
+        get_channel.cache_clear()
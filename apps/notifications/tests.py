@@ -0,0 +1,268 @@
+import asyncio
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.pubsub import get_pubsub
+from apps.users.models import User, UserProfile
+
+from . import dispatch as dispatch_module
+from .channels import stream_channel
+from .dispatch import dispatch, get_channel, send_pending
+from .models import Delivery, Notification, PushSubscription
+
+
+class NotificationFanoutTests(TestCase):
+    """
+    공지 fan-out (알림 설정, 재실행 중복 방지, 언어/시간대별 렌더링, 발송함 발송)
+    """
+
+    def setUp(self):
+        self.ko = User.objects.create_user(
+            email="ko@example.com", password="x", language="ko", timezone="Asia/Seoul"
+        )
+        self.en = User.objects.create_user(
+            email="en@example.com", password="x", language="en", timezone="UTC"
+        )
+        self.quiet = User.objects.create_user(
+            email="quiet@example.com", password="x", language="ko"
+        )
+        UserProfile.objects.create(
+            user=self.quiet, email_notifications=False, push_notifications=False
+        )
+        self.deleted = User.objects.create_user(email="gone@example.com", password="x")
+        self.deleted.deleted_at = timezone.now()
+        self.deleted.save(update_fields=["deleted_at"])
+        PushSubscription.objects.create(
+            user=self.en,
+            endpoint="https://push.example.com/en",
+            p256dh="key",
+            auth="auth",
+        )
+        PushSubscription.objects.create(
+            user=self.quiet,
+            endpoint="https://push.example.com/quiet",
+            p256dh="key",
+            auth="auth",
+        )
+        self.context = {
+            "title": "점검 안내",
+            "message": "오늘 밤 점검이 있습니다 <b>",
+            "sent_at": timezone.now(),
+        }
+
+    def test_fanout_honours_preferences_and_dedup(self):
+        with mock.patch.object(
+            dispatch_module, "render_message", wraps=dispatch_module.render_message
+        ) as render:
+            counts = dispatch(
+                "announcement",
+                context=self.context,
+                dedup_key="maintenance-1",
+                chunk_size=1,
+            )
+
+        # 탈퇴 사용자 제외, 알림을 끈 사용자는 앱 내 알림만, 구독이 없으면 푸시 없음
+        self.assertEqual(counts, {"in_app": 3, "email": 2, "push": 1})
+        self.assertEqual(
+            set(Notification.objects.values_list("user__email", flat=True)),
+            {"ko@example.com", "en@example.com", "quiet@example.com"},
+        )
+        self.assertEqual(
+            set(
+                Delivery.objects.filter(channel="email").values_list(
+                    "user__email", flat=True
+                )
+            ),
+            {"ko@example.com", "en@example.com"},
+        )
+        self.assertEqual(
+            list(
+                Delivery.objects.filter(channel="push").values_list("user", flat=True)
+            ),
+            [self.en.pk],
+        )
+        # (ko, Asia/Seoul), (en, UTC)마다 한 번씩 (quiet은 ko와 같은 조합)
+        self.assertEqual(render.call_count, 2)
+
+        en = Notification.objects.get(user=self.en)
+        self.assertEqual(en.title, "[TaskFlow] 점검 안내")
+        self.assertIn("(UTC)", en.body)
+        self.assertIn("The TaskFlow team", en.body)
+        # 텍스트 템플릿은 HTML 이스케이프하지 않음
+        self.assertIn("<b>", en.body)
+        self.assertIn("TaskFlow 팀", Notification.objects.get(user=self.ko).body)
+
+        # 같은 dedup_key로 다시 실행해도 중복 기록되지 않음
+        dispatch("announcement", context=self.context, dedup_key="maintenance-1")
+        self.assertEqual(Notification.objects.count(), 3)
+        self.assertEqual(Delivery.objects.count(), 3)
+
+    def test_send_pending_uses_outbox(self):
+        dispatch("announcement", context=self.context, dedup_key="maintenance-2")
+
+        sent, failed = send_pending(get_channel("email"))
+
+        self.assertEqual((sent, failed), (2, 0))
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ["en@example.com", "ko@example.com"],
+        )
+        self.assertFalse(
+            Delivery.objects.filter(channel="email")
+            .exclude(status=Delivery.STATUS_SENT)
+            .exists()
+        )
+        # 이미 보낸 건은 다시 보내지 않음
+        self.assertEqual(send_pending(get_channel("email")), (0, 0))
+
+        # pywebpush/VAPID 키가 없으면 실패로 기록하고 재시도 대기
+        with self.settings(WEBPUSH_VAPID_PRIVATE_KEY=""):
+            self.assertEqual(send_pending(get_channel("push")), (0, 0))
+        push = Delivery.objects.get(channel="push")
+        self.assertEqual(push.status, Delivery.STATUS_PENDING)
+        self.assertEqual(push.attempts, 1)
+
+    def test_notification_api(self):
+        call_command(
+            "send_announcement",
+            title="점검 안내",
+            message="오늘 밤 점검이 있습니다",
+            dedup_key="maintenance-3",
+            channels=["in_app"],
+            stdout=mock.Mock(),
+        )
+        client = APIClient()
+        client.force_authenticate(self.ko)
+
+        response = client.get("/api/notifications/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["data"]["unread_count"], 1)
+        [notification] = response.data["data"]["notifications"]
+        self.assertEqual(notification["title"], "[TaskFlow] 점검 안내")
+
+        for body in ([1], {"ids": "1"}):
+            response = client.post("/api/notifications/read/", body, format="json")
+            self.assertEqual(response.status_code, 400)
+        response = client.post("/api/notifications/read/", {}, format="json")
+        self.assertEqual(response.data["data"]["updated"], 1)
+        response = client.get("/api/notifications/", {"unread": 1})
+        self.assertEqual(response.data["data"]["unread_count"], 0)
+        self.assertEqual(response.data["data"]["notifications"], [])
+
+        subscription = {
+            "endpoint": "https://push.example.com/ko",
+            "keys": {"p256dh": "key", "auth": "auth"},
+        }
+        response = client.post(
+            "/api/notifications/push-subscriptions/", subscription, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(self.ko.push_subscriptions.exists())
+        client.delete(
+            "/api/notifications/push-subscriptions/",
+            {"endpoint": subscription["endpoint"]},
+            format="json",
+        )
+        self.assertFalse(self.ko.push_subscriptions.exists())
+
+
+class NotificationStreamTests(TestCase):
+    """
+    실시간 알림 스트림 (SSE): JWT 인증, 이벤트 전달, 하트비트, 느린 클라이언트 종료
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="live@example.com", password="x")
+        self.token = str(AccessToken.for_user(self.user))
+
+    async def open_stream(self, **params):
+        response = await self.async_client.get("/api/notifications/stream/", params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 3000\n\n")
+        return stream
+
+    @sync_to_async
+    def issue_ticket(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        response = client.post("/api/notifications/stream/ticket/")
+        self.assertEqual(response.status_code, 201)
+        return response.data["data"]["ticket"]
+
+    async def test_ticket_is_single_use(self):
+        # 액세스 토큰은 URL로 받지 않음 (접속/프록시 로그에 남음)
+        response = await self.async_client.get(
+            "/api/notifications/stream/", {"token": self.token}
+        )
+        self.assertEqual(response.status_code, 401)
+
+        ticket = await self.issue_ticket()
+        stream = await self.open_stream(ticket=ticket)
+        await stream.aclose()
+        response = await self.async_client.get(
+            "/api/notifications/stream/", {"ticket": ticket}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    async def test_stream_requires_token(self):
+        response = await self.async_client.get("/api/notifications/stream/")
+        self.assertEqual(response.status_code, 401)
+        response = await self.async_client.get(
+            "/api/notifications/stream/", headers={"authorization": "Bearer invalid"}
+        )
+        self.assertEqual(response.status_code, 401)
+        # WSGI 워커에서는 연결을 받지 않음
+        response = await sync_to_async(self.client.get)(
+            "/api/notifications/stream/", {"ticket": "unused"}
+        )
+        self.assertEqual(response.status_code, 501)
+
+    async def test_stream_delivers_notifications(self):
+        channel = stream_channel(self.user.pk)
+        stream = await self.open_stream(ticket=await self.issue_ticket())
+        self.assertEqual(get_pubsub().subscriber_count(channel), 1)
+
+        # fan-out(동기 코드, 다른 스레드)에서 발행한 앱 내 알림이 전달됨
+        await sync_to_async(dispatch)(
+            "announcement",
+            context={"title": "점검", "message": "곧 시작", "sent_at": timezone.now()},
+            dedup_key="live-1",
+            channels=["in_app"],
+        )
+        chunk = await asyncio.wait_for(anext(stream), 5)
+        self.assertTrue(chunk.startswith(b"data: {"))
+        self.assertIn('"id":"live-1"', chunk.decode())
+        self.assertIn('"title":"[TaskFlow] 점검"', chunk.decode())
+
+        with self.settings(SSE_HEARTBEAT_SECONDS=0.01):
+            self.assertEqual(await asyncio.wait_for(anext(stream), 5), b": ping\n\n")
+
+        # 클라이언트가 끊으면 ASGI 핸들러가 스트림 읽기를 취소함
+        reading = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        reading.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await reading
+        self.assertEqual(get_pubsub().subscriber_count(channel), 0)
+
+    async def test_slow_client_is_disconnected(self):
+        channel = stream_channel(self.user.pk)
+        with self.settings(SSE_QUEUE_SIZE=2):
+            stream = await self.open_stream(ticket=await self.issue_ticket())
+            for index in range(5):
+                get_pubsub().publish(channel, {"id": index})
+
+        # 밀린 이벤트는 버리고 overflow 후 종료
+        self.assertEqual(await anext(stream), b"event: overflow\ndata: {}\n\n")
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertEqual(get_pubsub().subscriber_count(channel), 0)
@@ -0,0 +1,17 @@
+from django.urls import path
+
+from . import views
+
+app_name = "notifications"
+
+urlpatterns = [
+    path("", views.notification_list, name="list"),
+    path("read/", views.mark_read, name="read"),
+    path("stream/", views.notification_stream, name="stream"),
+    path("stream/ticket/", views.stream_ticket, name="stream_ticket"),
+    path(
+        "push-subscriptions/",
+        views.PushSubscriptionView.as_view(),
+        name="push_subscriptions",
+    ),
+]
@@ -0,0 +1,252 @@
+import asyncio
+import secrets
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from apps.core.pubsub import get_pubsub
+from apps.users.models import User
+from apps.users.presence import touch
+
+from .channels import stream_channel
+from .models import PushSubscription
+from .serializers import NotificationSerializer, PushSubscriptionSerializer
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def notification_list(request):
+    """
+    내 알림 목록 API
+    최신순, ?unread=1이면 읽지 않은 알림만. 다음 페이지는 ?before=<마지막 id>
+    """
+    notifications = request.user.notifications.order_by("-created_at", "-pk")
+    try:
+        limit = min(int(request.query_params.get("limit", 50)), 200)
+        before = request.query_params.get("before")
+        if before:
+            notifications = notifications.filter(pk__lt=int(before))
+    except ValueError:
+        return Response(
+            {"success": False, "message": "limit/before는 숫자로 입력해주세요."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if request.query_params.get("unread"):
+        notifications = notifications.filter(read_at__isnull=True)
+
+    data = NotificationSerializer(notifications[:limit], many=True).data
+    return Response(
+        {
+            "success": True,
+            "data": {
+                "notifications": data,
+                "unread_count": request.user.notifications.filter(
+                    read_at__isnull=True
+                ).count(),
+                "next_before": data[-1]["id"] if len(data) == limit else None,
+            },
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def mark_read(request):
+    """
+    알림 읽음 처리 API
+    {"ids": [...]}이면 해당 알림만, 없으면 전체
+    """
+    notifications = request.user.notifications.filter(read_at__isnull=True)
+    # 본문이 객체가 아니면(JSON 배열 등) 잘못된 ids와 같이 처리
+    ids = request.data.get("ids") if isinstance(request.data, dict) else ()
+    if ids is not None:
+        if not isinstance(ids, list) or not all(isinstance(pk, int) for pk in ids):
+            return Response(
+                {"success": False, "message": "ids는 숫자 목록으로 입력해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        notifications = notifications.filter(pk__in=ids)
+
+    updated = notifications.update(read_at=timezone.now())
+    return Response(
+        {
+            "success": True,
+            "data": {"updated": updated},
+            "message": "알림을 읽음으로 표시했습니다.",
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+class PushSubscriptionView(APIView):
+    """
+    웹 푸시 구독 API
+    POST: 구독 등록 (같은 endpoint는 갱신) / DELETE: 구독 해제
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = PushSubscriptionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(
+            {"success": True, "message": "웹 푸시 알림을 구독했습니다."},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def delete(self, request):
+        PushSubscription.objects.filter(
+            user=request.user, endpoint=request.data.get("endpoint", "")
+        ).delete()
+        return Response(
+            {"success": True, "message": "웹 푸시 알림 구독을 해제했습니다."},
+            status=status.HTTP_200_OK,
+        )
+
+
+def ticket_key(ticket):
+    return f"sse-ticket:{ticket}"
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def stream_ticket(request):
+    """
+    실시간 알림 스트림 연결용 일회용 티켓 발급 API
+    EventSource는 헤더를 보낼 수 없으므로 액세스 토큰 대신 ?ticket=으로 넘긴다
+    (URL은 접속/프록시 로그에 남으므로 SSE_TICKET_TTL초 안에 한 번만 쓸 수 있다)
+    """
+    if request.auth is not None:
+        expires_at = request.auth["exp"]
+    else:
+        expires_at = time.time() + jwt_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+    ticket = secrets.token_urlsafe(32)
+    caches[settings.SSE_TICKET_CACHE].set(
+        ticket_key(ticket), (request.user.pk, expires_at), settings.SSE_TICKET_TTL
+    )
+    return Response(
+        {
+            "success": True,
+            "data": {"ticket": ticket, "expires_in": settings.SSE_TICKET_TTL},
+        },
+        status=status.HTTP_201_CREATED,
+    )
+
+
+def redeem_ticket(ticket):
+    """티켓을 사용 처리하고 (사용자 id, 만료 시각) 반환 (없거나 이미 쓴 티켓이면 None)"""
+    cache = caches[settings.SSE_TICKET_CACHE]
+    key = ticket_key(ticket)
+    value = cache.get(key)
+    # delete가 True인 요청 하나만 티켓을 사용
+    if value is None or not cache.delete(key):
+        return None
+    return value
+
+
+@sync_to_async
+def authenticate_stream(request):
+    """
+    Authorization 헤더의 액세스 토큰 또는 ?ticket=(stream_ticket)으로
+    (사용자, 연결 만료 시각) 반환. 인증 실패면 (None, None)
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    try:
+        if header:
+            raw_token = authentication.get_raw_token(header)
+            if not raw_token:
+                return None, None
+            token = authentication.get_validated_token(raw_token)
+            user, expires_at = authentication.get_user(token), token["exp"]
+        else:
+            redeemed = redeem_ticket(request.GET.get("ticket", ""))
+            if redeemed is None:
+                return None, None
+            user_id, expires_at = redeemed
+            user = User.objects.alive().filter(pk=user_id, is_active=True).first()
+            if user is None:
+                return None, None
+        touch(user.pk)
+        return user, expires_at
+    except (InvalidToken, AuthenticationFailed):
+        return None, None
+    finally:
+        # 스트림은 연결이 끊길 때까지 요청이 끝나지 않으므로 DB 연결을 바로 반납
+        connections.close_all()
+
+
+async def event_stream(user_id, expires_at):
+    """
+    SSE 이벤트 스트림
+    - 이벤트가 없으면 SSE_HEARTBEAT_SECONDS마다 주석(: ping)을 보냄
+    - 밀린 이벤트가 SSE_QUEUE_SIZE를 넘으면 overflow 이벤트 후 종료 (다시 연결해 알림함 조회)
+    - 토큰이 만료되면 expired 이벤트 후 종료 (새 토큰으로 다시 연결)
+    """
+    pubsub = get_pubsub()
+    subscription = pubsub.subscribe(stream_channel(user_id), settings.SSE_QUEUE_SIZE)
+    try:
+        yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+        while (remaining := expires_at - time.time()) > 0:
+            try:
+                async with asyncio.timeout(
+                    min(settings.SSE_HEARTBEAT_SECONDS, remaining)
+                ):
+                    data = await subscription.get()
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if data is None:
+                yield "event: overflow\ndata: {}\n\n"
+                return
+            yield f"data: {data}\n\n"
+        yield "event: expired\ndata: {}\n\n"
+    finally:
+        # 클라이언트가 끊으면 ASGI 핸들러가 스트림을 취소하므로 여기서 구독 해제
+        pubsub.unsubscribe(subscription)
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    실시간 알림 스트림 API (Server-Sent Events, ASGI 전용)
+    새 앱 내 알림을 {"id", "event", "title", "body", "data"} JSON으로 보낸다
+    """
+    if not isinstance(request, ASGIRequest):
+        # WSGI 워커는 연결 하나가 워커 하나를 계속 점유함
+        return JsonResponse(
+            {
+                "success": False,
+                "message": "실시간 알림은 ASGI 서버에서만 사용할 수 있습니다.",
+            },
+            status=501,
+        )
+    user, expires_at = await authenticate_stream(request)
+    if user is None:
+        return JsonResponse(
+            {"success": False, "message": "인증 정보가 유효하지 않습니다."},
+            status=401,
+        )
+
+    response = StreamingHttpResponse(
+        event_stream(user.pk, expires_at), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # nginx 응답 버퍼링 끔
+    return response
@@ -0,0 +1,128 @@
+"""
+allauth 어댑터
+
+소셜 로그인 사용자는 users 테이블의 (social_provider, social_id)로도 식별한다.
+allauth SocialAccount 연결이 없는 사용자(직접 생성/이전된 계정)는 인덱스 조회로 찾아 연결한다.
+
+allauth는 로그인/콜백 요청마다 SocialApp(DB + SOCIALACCOUNT_PROVIDERS 설정)을 다시 조회하므로
+사이트/제공자별 조회 결과를 프로세스 내에 보관한다. SocialApp/Site가 바뀌면 공유 캐시의
+설정 버전을 올려 모든 프로세스의 보관 결과를 무효화한다 (최대 L1 캐시 TTL만큼 지연).
+"""
+
+import threading
+import uuid
+
+from allauth import app_settings as allauth_settings
+from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+
+from .analytics import record_login, record_signup
+from .avatars import schedule_avatar_import
+from .models import User
+
+SOCIAL_CONFIG_VERSION_KEY = "socialaccount:config-version"
+
+# (site_id, provider, client_id) -> SocialApp 목록, 설정 버전이 바뀌면 비움
+_apps_cache = {}
+_apps_cache_version = None
+_apps_cache_lock = threading.Lock()
+
+
+def social_config_version():
+    """현재 소셜 로그인 설정 버전 (없으면 새로 발급)"""
+    version = cache.get(SOCIAL_CONFIG_VERSION_KEY)
+    if version is None:
+        cache.add(SOCIAL_CONFIG_VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(SOCIAL_CONFIG_VERSION_KEY)
+    return version
+
+
+def invalidate_social_config():
+    """SocialApp/Site/설정 변경 시 모든 프로세스의 SocialApp 조회 결과 무효화"""
+    global _apps_cache_version
+    cache.set(SOCIAL_CONFIG_VERSION_KEY, uuid.uuid4().hex, None)
+    with _apps_cache_lock:
+        _apps_cache.clear()
+        _apps_cache_version = None
+
+
+class SocialAccountAdapter(DefaultSocialAccountAdapter):
+    def list_apps(self, request, provider=None, client_id=None):
+        """SocialApp 조회 결과를 사이트/제공자/client_id별로 프로세스 내에 보관"""
+        global _apps_cache_version
+        site_id = None
+        if request is not None and allauth_settings.SITES_ENABLED:
+            # Site는 Django가 프로세스 내에 캐시한다 (SITE_CACHE)
+            site_id = get_current_site(request).pk
+        key = (site_id, provider, client_id)
+
+        version = social_config_version()
+        with _apps_cache_lock:
+            if _apps_cache_version != version:
+                _apps_cache.clear()
+                _apps_cache_version = version
+            apps = _apps_cache.get(key)
+
+        if apps is None:
+            apps = super().list_apps(request, provider=provider, client_id=client_id)
+            with _apps_cache_lock:
+                if _apps_cache_version == version:
+                    _apps_cache[key] = apps
+        return list(apps)
+
+    def pre_social_login(self, request, sociallogin):
+        """
+        SocialAccount가 없으면 users 테이블의 소셜 ID로 기존 사용자를 찾아 연결하고,
+        기존 사용자의 소셜 정보가 바뀌었을 때만 저장
+        """
+        account = sociallogin.account
+        user = sociallogin.user
+        # lookup()이 기존 사용자를 찾았으면 pk가 있다 (is_existing은 쿼리를 한 번 더 함)
+        if user is None or user.pk is None:
+            user = User.objects.get_by_social_identity(account.provider, account.uid)
+            if user is None:
+                return
+
+            # connect()는 사용자 저장과 연결 알림 메일까지 보내므로 계정 연결만 저장
+            account.user = user
+            account.save()
+            sociallogin.user = user
+
+        self.sync_user(user, account)
+        record_login(user)
+
+    def sync_user(self, user, account):
+        """
+        social_provider/social_id가 비어 있을 때만 기록하고 프로필 이미지 가져오기 예약
+        여러 제공자를 연결한 사용자가 다른 제공자로 로그인해도 처음 기록한 값을 덮어쓰지 않는다
+        (추가로 연결한 제공자는 allauth SocialAccount로 조회됨)
+        """
+        changed = []
+        if not user.social_provider and not user.social_id:
+            user.social_provider = account.provider
+            user.social_id = account.uid
+            changed = ["social_provider", "social_id"]
+            user.save(update_fields=[*changed, "updated_at"])
+
+        # 사용자가 올린 이미지는 덮어쓰지 않음 (내려받기/썸네일은 백그라운드)
+        avatar_url = account.get_avatar_url()
+        if avatar_url and not user.avatar:
+            schedule_avatar_import(user, avatar_url)
+        return changed
+
+    def populate_user(self, request, sociallogin, data):
+        """신규 소셜 가입 사용자에 제공자/ID 기록 (저장은 allauth가 한 번에 수행)"""
+        user = super().populate_user(request, sociallogin, data)
+        user.social_provider = sociallogin.account.provider
+        user.social_id = sociallogin.account.uid
+        return user
+
+    def save_user(self, request, sociallogin, form=None):
+        user = super().save_user(request, sociallogin, form)
+        record_signup(user)
+        record_login(user)
+        avatar_url = sociallogin.account.get_avatar_url()
+        if avatar_url:
+            schedule_avatar_import(user, avatar_url)
+        return user
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
-from .models import User, UserProfile, EmailVerificationToken
+from .models import AuditEvent, User, UserProfile, EmailVerificationToken
 
 
 @admin.register(User)
@@ -31,6 +31,7 @@ class UserAdmin(BaseUserAdmin):
         "theme",
         "language",
         "created_at",
+        "deleted_at",
     ]
 
     search_fields = ["email", "first_name", "last_name"]
@@ -66,13 +67,22 @@ class UserAdmin(BaseUserAdmin):
                     "updated_at",
                     "last_login",
                     "last_login_ip",
+                    "last_seen",
+                    "deleted_at",
                 ),
                 "classes": ("collapse",),
             },
         ),
     )
 
-    readonly_fields = ["created_at", "updated_at", "last_login", "social_id"]
+    readonly_fields = [
+        "created_at",
+        "updated_at",
+        "last_login",
+        "last_seen",
+        "social_id",
+        "deleted_at",
+    ]
 
     # 사용자 추가 페이지 설정
     add_fieldsets = (
@@ -185,3 +195,28 @@ class EmailVerificationTokenAdmin(admin.ModelAdmin):
         self.message_user(request, f"{updated}개의 토큰이 사용됨으로 처리되었습니다.")
 
     mark_as_used.short_description = "선택된 토큰들을 사용됨으로 표시"
+
+
+@admin.register(AuditEvent)
+class AuditEventAdmin(admin.ModelAdmin):
+    """
+    보안 감사 로그 어드민 (읽기 전용)
+    """
+
+    list_display = ["created_at", "event", "user_id", "email", "ip"]
+
+    # month 인덱스로 범위를 좁힌 뒤 목록 조회
+    list_filter = ["event", "month"]
+
+    search_fields = ["=user_id", "=ip", "email"]
+
+    ordering = ["-created_at"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,221 @@
+"""
+가입/로그인 집계
+
+대시보드의 가입자 수와 DAU/MAU를 users 테이블 스캔(O(사용자)) 대신 일별 집계 테이블(O(일))에서 구한다.
+- record_signup / record_login은 프로세스 내 카운터와 HyperLogLog 스케치만 갱신한다 (DB 접근 없음)
+- 마지막 저장 후 ANALYTICS_FLUSH_INTERVAL초가 지나면 응답을 보낸 뒤(request_finished), 그리고
+  프로세스 종료 시 DB에 합친다. 가입자 수는 F()로 더하고, 활성 사용자 스케치는 행을 잠근 뒤
+  레지스터별 최댓값으로 합친다 (같은 사용자를 여러 번 합쳐도 결과가 같다)
+- 과거 데이터는 backfill_login_rollups 명령이 users/감사 로그를 pk 순서로 나눠 읽어 채운다
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.core.hll import HyperLogLog
+
+from .models import AuditEvent, DailyActiveUsers, DailySignup, User
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_signups = Counter()  # (date, social_provider, language) -> 가입자 수
+_active = {}  # date -> (HyperLogLog, 로그인 수)
+_last_flush = time.monotonic()
+
+
+def record_signup(user):
+    """가입 1건 집계 (저장은 flush_rollups)"""
+    key = (timezone.localdate(), user.social_provider or "", user.language)
+    with _lock:
+        _signups[key] += 1
+
+
+def record_login(user):
+    """로그인 1건 집계 (저장은 flush_rollups)"""
+    day = timezone.localdate()
+    with _lock:
+        sketch, logins = _active.get(day) or (HyperLogLog(), 0)
+        sketch.add(user.pk)
+        _active[day] = (sketch, logins + 1)
+
+
+def discard_rollups():
+    """저장하지 않은 집계 버리기 (테스트용)"""
+    with _lock:
+        _signups.clear()
+        _active.clear()
+
+
+def apply_signups(counts, replace=False):
+    """
+    (날짜, 제공자, 언어)별 가입자 수를 더함 (replace=True면 기존 값과 큰 값으로)
+    영구 삭제된 계정은 다시 셀 수 없으므로 다시 계산한 값이 기존 집계를 줄이지 않게 한다
+    """
+    for (day, provider, language), count in counts.items():
+        rows = DailySignup.objects.filter(
+            date=day, social_provider=provider, language=language
+        )
+        value = Greatest(F("count"), count) if replace else F("count") + count
+        if rows.update(count=value):
+            continue
+        try:
+            with transaction.atomic():
+                DailySignup.objects.create(
+                    date=day, social_provider=provider, language=language, count=count
+                )
+        except IntegrityError:
+            # 다른 프로세스가 먼저 만든 경우
+            rows.update(count=value)
+
+
+def apply_active(active, replace=False):
+    """날짜별 (스케치, 로그인 수)를 합침 (replace=True면 로그인 수는 큰 값으로)"""
+    with transaction.atomic():
+        for day, (sketch, logins) in sorted(active.items()):
+            row = DailyActiveUsers.objects.select_for_update().filter(date=day).first()
+            if row is None:
+                try:
+                    with transaction.atomic():
+                        DailyActiveUsers.objects.create(
+                            date=day, sketch=bytes(sketch), logins=logins
+                        )
+                    continue
+                except IntegrityError:
+                    row = DailyActiveUsers.objects.select_for_update().get(date=day)
+
+            row.sketch = bytes(HyperLogLog(row.sketch).update(sketch))
+            row.logins = max(row.logins, logins) if replace else row.logins + logins
+            row.save(update_fields=["sketch", "logins"])
+
+
+def flush_rollups():
+    """모인 집계를 DB에 합침 (실패하면 다음 저장에서 다시 시도)"""
+    global _signups, _active, _last_flush
+    with _lock:
+        signups, _signups = _signups, Counter()
+        active, _active = _active, {}
+        _last_flush = time.monotonic()
+    if not signups and not active:
+        return
+
+    try:
+        apply_signups(signups)
+        apply_active(active)
+    except Exception:
+        with _lock:
+            _signups.update(signups)
+            for day, (sketch, logins) in active.items():
+                pending, pending_logins = _active.get(day) or (HyperLogLog(), 0)
+                _active[day] = (pending.update(sketch), pending_logins + logins)
+        raise
+
+
+def flush_if_due(**kwargs):
+    """request_finished 수신: 마지막 저장 후 ANALYTICS_FLUSH_INTERVAL초가 지났을 때만 저장"""
+    if not _signups and not _active:
+        return
+    if time.monotonic() - _last_flush < settings.ANALYTICS_FLUSH_INTERVAL:
+        return
+    try:
+        flush_rollups()
+    except Exception:
+        logger.exception("가입/로그인 집계 저장 실패")
+
+
+@atexit.register
+def flush_on_exit():
+    try:
+        flush_rollups()
+    except Exception:
+        logger.exception("종료 시 가입/로그인 집계 저장 실패")
+
+
+def iter_chunks(queryset, fields, chunk_size):
+    """pk 순서로 chunk_size개씩 값 목록 반환 (OFFSET 없이 마지막 pk 다음부터)"""
+    last_pk = 0
+    while rows := list(
+        queryset.filter(pk__gt=last_pk)
+        .order_by("pk")
+        .values_list("pk", *fields)[:chunk_size]
+    ):
+        yield rows
+        last_pk = rows[-1][0]
+
+
+def backfill_rollups(since=None, chunk_size=5000, progress=None):
+    """
+    users(가입일/last_login)와 감사 로그(로그인)로 since 이후 집계를 다시 계산
+    가입자/로그인 수는 기존 값과 큰 값으로, 활성 사용자 스케치는 기존 값과 합친다 (여러 번 실행해도 같음)
+    """
+    signups = Counter()
+    active = {}
+
+    def add_active(day, user_id, logins=0):
+        sketch, count = active.get(day) or (HyperLogLog(), 0)
+        sketch.add(user_id)
+        active[day] = (sketch, count + logins)
+
+    users = User.objects.all()
+    logins = AuditEvent.objects.filter(event=AuditEvent.LOGIN)
+    if since:
+        since_at = timezone.make_aware(datetime.combine(since, datetime.min.time()))
+        users = users.filter(Q(created_at__gte=since_at) | Q(last_login__gte=since_at))
+        logins = logins.filter(created_at__gte=since_at)
+
+    fields = ("created_at", "social_provider", "language", "last_login")
+    for rows in iter_chunks(users, fields, chunk_size):
+        for pk, created_at, provider, language, last_login in rows:
+            day = timezone.localdate(created_at)
+            if not since or day >= since:
+                signups[(day, provider or "", language)] += 1
+            if last_login and (not since or timezone.localdate(last_login) >= since):
+                add_active(timezone.localdate(last_login), pk)
+        if progress:
+            progress("users", rows[-1][0], len(rows))
+
+    for rows in iter_chunks(logins, ("user_id", "created_at"), chunk_size):
+        for _, user_id, created_at in rows:
+            add_active(timezone.localdate(created_at), user_id, logins=1)
+        if progress:
+            progress("audit_events", rows[-1][0], len(rows))
+
+    apply_signups(signups, replace=True)
+    apply_active(active, replace=True)
+    return signups, active
+
+
+def signup_counts(start, end):
+    """기간 내 날짜/제공자/언어별 가입자 수"""
+    return (
+        DailySignup.objects.filter(date__range=(start, end))
+        .order_by("date", "social_provider", "language")
+        .values("date", "social_provider", "language", "count")
+    )
+
+
+def daily_active_users(start, end):
+    """기간 내 날짜별 (날짜, 활성 사용자 추정치, 로그인 수)"""
+    rows = DailyActiveUsers.objects.filter(date__range=(start, end)).order_by("date")
+    return [
+        (date, HyperLogLog(sketch).count(), logins)
+        for date, sketch, logins in rows.values_list("date", "sketch", "logins")
+    ]
+
+
+def active_users(start, end):
+    """기간 내 고유 활성 사용자 추정치 (일별 스케치 합집합, MAU 등)"""
+    sketches = DailyActiveUsers.objects.filter(date__range=(start, end)).values_list(
+        "sketch", flat=True
+    )
+    return HyperLogLog.union(HyperLogLog(sketch) for sketch in sketches).count()
@@ -7,8 +7,12 @@ class UsersConfig(AppConfig):
     verbose_name = "사용자 관리"
 
     def ready(self):
-        # 시그널 연결 (필요시)
-        try:
-            import apps.users.signals
-        except ImportError:
-            pass
+        # 시그널 연결 (프로필 이미지 참조 수 관리 등 - import 실패를 숨기지 않음)
+        import apps.users.signals  # noqa: F401
+        import apps.users.checks  # noqa: F401
+
+        from django.conf import settings
+
+        # drf_spectacular 인증 스킴 확장 등록 (API 전용 워커에서는 import하지 않음)
+        if settings.ENABLE_API_DOCS:
+            import apps.users.schema  # noqa: F401
@@ -0,0 +1,205 @@
+"""
+보안 감사 로그
+
+로그인/로그인 실패/비밀번호 변경/이메일 인증/인증 메일 재발송/계정 삭제를 AuditEvent에 남긴다.
+- record_event는 튜플 하나를 프로세스 내 링 버퍼(deque)에 넣기만 한다 (요청당 수 us, DB 접근 없음)
+- 버퍼가 AUDIT_LOG_BATCH_SIZE만큼 찼거나 마지막 저장 후 AUDIT_LOG_FLUSH_INTERVAL초가 지나면
+  응답을 보낸 뒤(request_finished) bulk_create로 한 번에 저장한다. 프로세스 종료 시에도 저장한다.
+- 버퍼가 AUDIT_LOG_BUFFER_SIZE를 넘으면(DB 장애 등) 가장 오래된 이벤트부터 버리고 수를 기록한다
+- 묶음 저장이 데이터 오류로 실패하면 한 건씩 다시 저장하고, 저장할 수 없는 이벤트는 버리고 수를 기록한다
+  (잘못된 이벤트 하나 때문에 같은 묶음을 계속 재시도하며 로그가 쌓이지 않는 일이 없도록)
+- IP는 TRUSTED_PROXY_COUNT개의 프록시가 붙인 X-Forwarded-For만 믿고, 주소 형식이 아니면 NULL로 저장한다
+- 월(month) 단위로 보관하며 AUDIT_LOG_RETENTION_MONTHS가 지난 월은 purge_audit_events로 지운다
+"""
+
+import atexit
+import ipaddress
+import logging
+import threading
+import time
+from collections import Counter, deque
+from datetime import date
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, transaction
+from django.utils import timezone
+
+from .models import AuditEvent
+from .purge import raw_delete
+
+logger = logging.getLogger(__name__)
+
+_buffer = deque(maxlen=settings.AUDIT_LOG_BUFFER_SIZE)
+_flush_lock = threading.Lock()
+_last_flush = time.monotonic()
+_dropped = 0
+_rejected = 0
+
+
+def client_ip(request):
+    """
+    클라이언트 IP (주소 형식이 아니면 None)
+    TRUSTED_PROXY_COUNT개의 프록시 뒤에서는 X-Forwarded-For의 오른쪽에서 그 수번째 주소,
+    그 앞의 값은 클라이언트가 마음대로 넣을 수 있으므로 쓰지 않는다
+    """
+    address = request.META.get("REMOTE_ADDR")
+    proxies = settings.TRUSTED_PROXY_COUNT
+    if proxies:
+        forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+        if len(forwarded) >= proxies:
+            address = forwarded[-proxies].strip()
+    try:
+        return str(ipaddress.ip_address(address))
+    except ValueError:
+        return None
+
+
+def record_event(event, request=None, user=None, email="", **data):
+    """감사 이벤트를 버퍼에 추가 (저장은 flush_events)"""
+    global _dropped
+    if len(_buffer) == _buffer.maxlen:
+        _dropped += 1
+    ip = user_agent = None
+    if request is not None:
+        ip = client_ip(request)
+        user_agent = request.META.get("HTTP_USER_AGENT", "")[:255]
+    _buffer.append(
+        (
+            timezone.now(),
+            event,
+            user.pk if user is not None else None,
+            email,
+            ip,
+            user_agent or "",
+            data,
+        )
+    )
+
+
+def pending_events():
+    return len(_buffer)
+
+
+def discard_events():
+    """저장하지 않은 이벤트 버리기 (테스트용)"""
+    _buffer.clear()
+
+
+def to_event(record):
+    created_at, event, user_id, email, ip, user_agent, data = record
+    return AuditEvent(
+        month=created_at.date().replace(day=1),
+        created_at=created_at,
+        event=event,
+        user_id=user_id,
+        email=email,
+        ip=ip,
+        user_agent=user_agent,
+        data=data,
+    )
+
+
+def save_records(records):
+    """
+    이벤트 묶음 저장 후 저장한 수 반환
+    데이터 오류로 실패하면 한 건씩 저장하고 저장할 수 없는 이벤트는 버린다
+    (DB 장애 등 다른 오류는 그대로 전달)
+    """
+    global _rejected
+    try:
+        with transaction.atomic():
+            AuditEvent.objects.bulk_create([to_event(record) for record in records])
+        return len(records)
+    except (DataError, IntegrityError):
+        pass
+
+    written = 0
+    for record in records:
+        try:
+            with transaction.atomic():
+                AuditEvent.objects.bulk_create([to_event(record)])
+        except (DataError, IntegrityError):
+            logger.exception("저장할 수 없는 감사 로그를 버립니다: %s", record[1])
+            _rejected += 1
+        else:
+            written += 1
+    return written
+
+
+def flush_events():
+    """버퍼의 이벤트를 bulk_create로 저장하고 저장한 수 반환 (다른 스레드가 저장 중이면 0)"""
+    global _last_flush, _dropped, _rejected
+    if not _flush_lock.acquire(blocking=False):
+        return 0
+    try:
+        _last_flush = time.monotonic()
+        if _dropped:
+            logger.warning(
+                "감사 로그 버퍼가 가득 차 이벤트 %d건을 버렸습니다.", _dropped
+            )
+            _dropped = 0
+
+        written = 0
+        while _buffer:
+            records = []
+            while _buffer and len(records) < settings.AUDIT_LOG_BATCH_SIZE:
+                records.append(_buffer.popleft())
+            try:
+                written += save_records(records)
+            except Exception:
+                # 다음 저장에서 다시 시도 (버퍼가 차면 오래된 것부터 버려짐)
+                _buffer.extendleft(reversed(records))
+                raise
+        return written
+    finally:
+        if _rejected:
+            logger.warning("저장할 수 없는 감사 로그 %d건을 버렸습니다.", _rejected)
+            _rejected = 0
+        _flush_lock.release()
+
+
+def flush_if_due(**kwargs):
+    """request_finished 수신: 모인 이벤트가 충분하거나 오래되었을 때만 저장"""
+    if not _buffer:
+        return
+    if (
+        len(_buffer) < settings.AUDIT_LOG_BATCH_SIZE
+        and time.monotonic() - _last_flush < settings.AUDIT_LOG_FLUSH_INTERVAL
+    ):
+        return
+    try:
+        flush_events()
+    except Exception:
+        logger.exception("감사 로그 저장 실패 (버퍼 %d건)", len(_buffer))
+
+
+@atexit.register
+def flush_on_exit():
+    try:
+        flush_events()
+    except Exception:
+        logger.exception("종료 시 감사 로그 저장 실패 (버퍼 %d건)", len(_buffer))
+
+
+def retention_cutoff(months=None):
+    """보관할 가장 오래된 월의 1일"""
+    if months is None:
+        months = settings.AUDIT_LOG_RETENTION_MONTHS
+    today = timezone.localdate()
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def purge_audit_events(months=None, batch_size=10000):
+    """보관 기간이 지난 월의 이벤트를 월 인덱스로 묶음 삭제하고 월별 삭제 수 반환"""
+    cutoff = retention_cutoff(months)
+    deleted = Counter()
+    expired = AuditEvent.objects.filter(month__lt=cutoff)
+    for month in expired.values_list("month", flat=True).distinct().order_by("month"):
+        while pks := list(
+            AuditEvent.objects.filter(month=month).values_list("pk", flat=True)[
+                :batch_size
+            ]
+        ):
+            deleted[month] += raw_delete(AuditEvent, pks)
+    return deleted
@@ -0,0 +1,15 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .presence import touch
+
+
+class PresenceJWTAuthentication(JWTAuthentication):
+    """
+    JWT 인증 + 접속 상태 기록 (공유 캐시에만 쓰고 DB에는 쓰지 않음, apps.users.presence)
+    """
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            touch(result[0].pk)
+        return result
@@ -0,0 +1,284 @@
+"""
+프로필 이미지 처리 파이프라인
+
+업로드된 원본을 한 번만 디코딩해서(JPEG는 draft 모드로 축소 디코딩) 메타데이터를 제거하고,
+고정된 크기의 WebP/JPEG 썸네일을 원본 해시 기반 경로(avatars/<hash>/<size>.<ext>)에 저장한다.
+처리는 요청 스레드가 아닌 백그라운드 스레드에서 트랜잭션 커밋 이후에 실행된다.
+"""
+
+import hashlib
+import io
+import ipaddress
+import logging
+import os
+import socket
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from apps.core.storage import get_avatar_storage
+
+logger = logging.getLogger(__name__)
+
+# 포맷별 (확장자, Pillow 포맷, 저장 옵션)
+AVATAR_FORMATS = {
+    "webp": ("webp", "WEBP", {"quality": 80, "method": 4}),
+    "jpeg": ("jpg", "JPEG", {"quality": 85, "optimize": True, "progressive": True}),
+}
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="avatar")
+
+
+def avatar_hash_for(data):
+    """원본 이미지 내용 해시"""
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def avatar_variant_name(avatar_hash, size, fmt):
+    """썸네일 저장 경로"""
+    extension = AVATAR_FORMATS[fmt][0]
+    return f"avatars/{avatar_hash}/{size}.{extension}"
+
+
+def decode_avatar(data, max_size):
+    """원본을 디코딩해 max_size 이하의 정사각형 RGB/RGBA 이미지로 변환"""
+    image = Image.open(io.BytesIO(data))
+
+    # JPEG는 디코더 단계에서 1/2, 1/4, 1/8로 축소 (다른 포맷은 무시됨)
+    image.draft("RGB", (max_size, max_size))
+
+    # EXIF 회전 정보를 픽셀에 반영 (이후 메타데이터는 저장하지 않음)
+    image = ImageOps.exif_transpose(image)
+
+    if image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    ):
+        image = image.convert("RGBA")
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # 가운데 기준 정사각형 자르기
+    side = min(image.size)
+    left = (image.width - side) // 2
+    top = (image.height - side) // 2
+    image = image.crop((left, top, left + side, top + side))
+
+    if side > max_size:
+        # reducing_gap: 정수배 reduce()로 먼저 줄인 뒤 리샘플링
+        image = image.resize(
+            (max_size, max_size), Image.Resampling.LANCZOS, reducing_gap=3.0
+        )
+    return image
+
+
+def encode_avatar(image, fmt):
+    """이미지를 지정 포맷 bytes로 인코딩 (메타데이터 없음)"""
+    _, pil_format, options = AVATAR_FORMATS[fmt]
+    if pil_format == "JPEG" and image.mode == "RGBA":
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    buffer = io.BytesIO()
+    image.save(buffer, format=pil_format, **options)
+    return buffer.getvalue()
+
+
+def render_avatar_variants(data, sizes=None):
+    """원본 bytes로부터 {(size, fmt): bytes} 썸네일 생성"""
+    sizes = sorted(sizes or settings.AVATAR_SIZES, reverse=True)
+    image = decode_avatar(data, sizes[0])
+
+    variants = {}
+    for size in sizes:
+        # 큰 크기부터 순서대로 줄여서 리샘플링 비용을 줄인다
+        if image.width != size:
+            image = image.resize(
+                (size, size), Image.Resampling.LANCZOS, reducing_gap=2.0
+            )
+        for fmt in AVATAR_FORMATS:
+            variants[(size, fmt)] = encode_avatar(image, fmt)
+    return variants
+
+
+def process_avatar(user_id):
+    """사용자의 현재 avatar로 썸네일을 생성하고 avatar_hash 저장"""
+    from .models import User
+
+    user = User.objects.only("id", "avatar").filter(pk=user_id).first()
+    if user is None or not user.avatar:
+        return None
+
+    avatar_name = user.avatar.name
+    with user.avatar.open("rb") as f:
+        data = f.read()
+    avatar_hash = avatar_hash_for(data)
+
+    names = {
+        (size, fmt): avatar_variant_name(avatar_hash, size, fmt)
+        for size in settings.AVATAR_SIZES
+        for fmt in AVATAR_FORMATS
+    }
+    # 같은 이미지가 이미 처리된 경우 디코딩 생략
+    storage = get_avatar_storage()
+    if not all(storage.exists(name) for name in names.values()):
+        for key, content in render_avatar_variants(data).items():
+            storage.save_exact(names[key], ContentFile(content))
+
+    # 처리 중에 avatar가 다시 바뀌었다면 덮어쓰지 않음
+    User.objects.filter(pk=user_id, avatar=avatar_name).update(
+        avatar_hash=avatar_hash, updated_at=timezone.now()
+    )
+    return avatar_hash
+
+
+def delete_avatar_variants(avatar_name):
+    """내용 주소 기반 원본 이름에 해당하는 썸네일 삭제 (원본 GC 시 호출)"""
+    stem = os.path.splitext(os.path.basename(avatar_name))[0]
+    if len(stem) != 64:
+        return
+    storage = get_avatar_storage()
+    for size in settings.AVATAR_SIZES:
+        for fmt in AVATAR_FORMATS:
+            storage.delete(avatar_variant_name(stem[:32], size, fmt))
+
+
+def run_avatar_processing(user_id):
+    """백그라운드 스레드용 래퍼"""
+    try:
+        process_avatar(user_id)
+    except Exception:
+        logger.exception("프로필 이미지 처리 실패: user_id=%s", user_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_avatar_processing(user):
+    """트랜잭션 커밋 후 썸네일 생성 예약"""
+
+    def submit():
+        if settings.AVATAR_PROCESS_ASYNC:
+            _executor.submit(run_avatar_processing, user.pk)
+        else:
+            process_avatar(user.pk)
+
+    transaction.on_commit(submit)
+
+
+# 소셜 프로필 이미지 Content-Type -> 확장자 (User.avatar 허용 확장자만)
+REMOTE_AVATAR_TYPES = {"image/jpeg": "jpg", "image/png": "png", "image/gif": "gif"}
+
+
+def is_public_url(url):
+    """http(s)이고 호스트의 모든 주소가 공인 IP인 URL인지 확인 (내부망 요청 방지)"""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    try:
+        addresses = socket.getaddrinfo(parts.hostname, None, type=socket.SOCK_STREAM)
+    except (OSError, UnicodeError):
+        return False
+    return all(
+        ipaddress.ip_address(address[4][0].split("%")[0]).is_global
+        for address in addresses
+    )
+
+
+class PublicRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """공인 http(s) 주소로의 리다이렉트만 따라감"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        if not is_public_url(newurl):
+            raise urllib.error.HTTPError(
+                newurl, code, "허용되지 않은 리다이렉트", headers, fp
+            )
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+_opener = urllib.request.build_opener(PublicRedirectHandler)
+
+
+def download_avatar(url, timeout=5):
+    """원격 이미지를 MAX_UPLOAD_SIZE까지만 내려받아 (bytes, 확장자) 반환"""
+    if not is_public_url(url):
+        return None, None
+
+    # 2xx가 아니면 HTTPError를 발생시킴
+    with _opener.open(url, timeout=timeout) as response:
+        extension = REMOTE_AVATAR_TYPES.get(response.headers.get_content_type())
+        if extension is None:
+            return None, None
+        data = bytearray()
+        while chunk := response.read(64 * 1024):
+            data += chunk
+            if len(data) > settings.MAX_UPLOAD_SIZE:
+                return None, None
+    return bytes(data), extension
+
+
+def import_remote_avatar(user_id, url):
+    """프로필 이미지가 없는 사용자에게 원격(소셜 제공자) 이미지를 저장하고 썸네일 생성"""
+    from .models import User
+
+    user = User.objects.filter(pk=user_id).first()
+    if user is None or user.avatar:
+        return None
+
+    try:
+        data, extension = download_avatar(url)
+        if data is not None:
+            with Image.open(io.BytesIO(data)) as image:
+                if image.width * image.height > settings.AVATAR_MAX_PIXELS:
+                    data = None
+    except Exception:
+        mark_avatar_import_failed(url)
+        raise
+    if data is None:
+        mark_avatar_import_failed(url)
+        return None
+
+    # 내용 주소 기반 저장소라 같은 이미지는 한 번만 저장된다
+    user.avatar.save(f"social.{extension}", ContentFile(data), save=False)
+    user.save(update_fields=["avatar", "updated_at"])
+    return process_avatar(user_id)
+
+
+def import_failure_key(url):
+    return f"avatar-import-failed:{hashlib.sha256(url.encode()).hexdigest()}"
+
+
+def mark_avatar_import_failed(url):
+    """가져오지 못한 URL 기록 (AVATAR_IMPORT_RETRY_SECONDS 동안 다시 받지 않음)"""
+    cache.set(import_failure_key(url), True, settings.AVATAR_IMPORT_RETRY_SECONDS)
+
+
+def run_avatar_import(user_id, url):
+    """백그라운드 스레드용 래퍼"""
+    try:
+        import_remote_avatar(user_id, url)
+    except Exception:
+        logger.exception("소셜 프로필 이미지 가져오기 실패: user_id=%s", user_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_avatar_import(user, url):
+    """트랜잭션 커밋 후 원격 프로필 이미지 가져오기 예약 (최근에 실패한 URL은 건너뜀)"""
+    if cache.get(import_failure_key(url)):
+        return
+
+    def submit():
+        if settings.AVATAR_PROCESS_ASYNC:
+            _executor.submit(run_avatar_import, user.pk, url)
+        else:
+            import_remote_avatar(user.pk, url)
+
+    transaction.on_commit(submit)
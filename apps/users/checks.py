@@ -0,0 +1,46 @@
+"""
+사용자 앱 시스템 체크 (manage.py check, runserver, migrate 시 실행)
+"""
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Tags, Warning, register
+
+from apps.core.cache import TieredCache
+
+# 프로세스마다 따로 저장하는 캐시 (LocalSharedCache 포함, TieredCache는 L1이 프로세스 내)
+PROCESS_LOCAL_CACHES = (LocMemCache, DummyCache, TieredCache)
+
+
+@register(Tags.caches)
+def check_presence_cache(app_configs, **kwargs):
+    """
+    PRESENCE_CACHE가 프로세스 간에 공유되는 캐시인지 확인
+    프로세스 내 캐시면 워커마다 접속 상태가 다르고, 별도 프로세스인 compact_presence는
+    빈 캐시를 읽어 users.last_seen을 갱신하지 못한다
+    """
+    alias = settings.PRESENCE_CACHE
+    try:
+        cache = caches[alias]
+    except InvalidCacheBackendError:
+        return [
+            Error(
+                f"PRESENCE_CACHE({alias!r})가 CACHES에 없습니다.",
+                id="users.E001",
+            )
+        ]
+    if isinstance(cache, PROCESS_LOCAL_CACHES):
+        return [
+            Warning(
+                f"PRESENCE_CACHE({alias!r})가 프로세스 내 캐시"
+                f"({type(cache).__name__})입니다.",
+                hint=(
+                    "워커마다 접속 상태가 다르고 compact_presence가 last_seen을 "
+                    "갱신하지 못합니다. CACHE_URL로 Redis를 설정하세요."
+                ),
+                id="users.W001",
+            )
+        ]
+    return []
@@ -0,0 +1,365 @@
+"""
+개인 데이터 내보내기
+
+사용자 데이터(계정/프로필/이메일 인증 이력/보안 감사 로그)를 섹션(EXPORT_SECTIONS)별로
+JSON 중간 파일에 쓴 뒤 하나의 JSON/ZIP 파일로 합친다.
+- 행은 iterator()로 읽어 JSON 청크 제너레이터로 바꾸고, IteratorFile로 저장소에 바로 저장한다
+  (계정 데이터 크기와 관계없이 메모리에는 청크 하나만 올라간다)
+- 섹션 하나가 끝날 때마다 DataExport.completed_sections에 기록되어, 중단된 작업은
+  run_data_exports 명령(또는 다음 요청)이 남은 섹션부터 이어서 실행한다
+- 완료된 파일은 DATA_EXPORT_TTL_DAYS 동안 보관하고, 탈퇴 시 바로 삭제한다
+- 진행 상황은 탈퇴하지 않은 사용자의 행에만 기록하고, 실행 중에 행이 삭제(탈퇴)되면
+  그때까지 쓴 파일을 지우고 중단한다 (행 없이 남는 파일이 없도록)
+- 실패/중단된 작업은 DATA_EXPORT_MAX_ATTEMPTS번까지만 다시 실행한다
+"""
+
+import logging
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from apps.core.storage import IteratorFile, get_export_storage
+
+from .models import AuditEvent, DataExport, EmailVerificationToken, User, UserProfile
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+
+ACCOUNT_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "bio",
+    "avatar",
+    "timezone",
+    "theme",
+    "language",
+    "is_email_verified",
+    "social_provider",
+    "social_id",
+    "date_joined",
+    "created_at",
+    "updated_at",
+    "last_login",
+    "last_login_ip",
+)
+
+PROFILE_FIELDS = (
+    "phone_number",
+    "birth_date",
+    "email_notifications",
+    "push_notifications",
+    "created_at",
+    "updated_at",
+)
+
+
+def account_rows(user_id):
+    return User.objects.filter(pk=user_id).values(*ACCOUNT_FIELDS)
+
+
+def profile_rows(user_id):
+    return UserProfile.objects.filter(user_id=user_id).values(*PROFILE_FIELDS)
+
+
+def email_verification_rows(user_id):
+    # 토큰 값은 내보내지 않음 (인증 이력만)
+    return (
+        EmailVerificationToken.objects.filter(user_id=user_id)
+        .order_by("pk")
+        .values("email", "is_used", "expires_at", "created_at")
+        .iterator(chunk_size=2000)
+    )
+
+
+def security_event_rows(user_id):
+    return (
+        AuditEvent.objects.filter(user_id=user_id)
+        .order_by("pk")
+        .values("event", "ip", "user_agent", "created_at")
+        .iterator(chunk_size=2000)
+    )
+
+
+# (섹션 이름, user_id -> 행 iterable, 여러 행 여부) - 순서대로 내보낸다
+EXPORT_SECTIONS = [
+    ("account", account_rows, False),
+    ("profile", profile_rows, False),
+    ("email_verifications", email_verification_rows, True),
+    ("security_events", security_event_rows, True),
+]
+
+
+# json.dumps(cls=...)는 호출마다 인코더를 새로 만들므로 하나를 재사용
+_encoder = DjangoJSONEncoder(ensure_ascii=False)
+
+
+def encode(value):
+    return _encoder.encode(value).encode()
+
+
+def iter_json(rows, many):
+    """행 iterable을 JSON bytes 청크로 변환 (many=False면 첫 행 객체 또는 null)"""
+    if not many:
+        yield encode(next(iter(rows), None))
+        return
+
+    buffer = [b"["]
+    size = 1
+    for index, row in enumerate(rows):
+        data = encode(row)
+        buffer.append(b"," + data if index else data)
+        size += len(data) + 1
+        if size >= CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    buffer.append(b"]")
+    yield b"".join(buffer)
+
+
+class ZipStream:
+    """ZipFile이 쓰는 bytes를 모아 두는 쓰기 전용 스트림 (seek 불가 → data descriptor 사용)"""
+
+    def __init__(self):
+        self.buffer = []
+        self.offset = 0
+
+    def write(self, data):
+        self.buffer.append(bytes(data))
+        self.offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.offset
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self.buffer)
+        self.buffer = []
+        return data
+
+
+def iter_zip(entries):
+    """(파일명, bytes 청크 iterable) 목록을 ZIP bytes 청크로 변환"""
+    stream = ZipStream()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for arcname, chunks in entries:
+            with archive.open(arcname, "w", force_zip64=True) as entry:
+                for chunk in chunks:
+                    entry.write(chunk)
+                    if stream.buffer:
+                        yield stream.pop()
+            yield stream.pop()
+    yield stream.pop()
+
+
+def iter_storage_file(storage, name):
+    with storage.open(name, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def save_stream(storage, name, chunks):
+    """bytes 청크를 저장소에 바로 저장 (같은 이름의 이전 시도 파일은 덮어씀)"""
+    storage.delete(name)
+    return storage.save(name, File(IteratorFile(chunks), name=name))
+
+
+def part_name(export, section):
+    return f"{export.pk}.{section}.part.json"
+
+
+def export_name(export):
+    return f"{export.pk}.{export.format}"
+
+
+def assemble(export, storage):
+    """섹션 중간 파일을 합친 최종 파일 bytes 청크"""
+    sections = [name for name, _, _ in EXPORT_SECTIONS]
+    if export.format == DataExport.FORMAT_ZIP:
+        return iter_zip(
+            (f"{name}.json", iter_storage_file(storage, part_name(export, name)))
+            for name in sections
+        )
+
+    def iter_document():
+        for index, name in enumerate(sections):
+            yield (b"{" if index == 0 else b",") + encode(name) + b":"
+            yield from iter_storage_file(storage, part_name(export, name))
+        yield b"}"
+
+    return iter_document()
+
+
+class ExportCancelled(Exception):
+    """실행 중에 작업 행이 삭제되었거나 사용자가 탈퇴함"""
+
+
+def active_exports():
+    """탈퇴하지 않은 사용자의 내보내기 작업"""
+    return DataExport.objects.filter(user__deleted_at__isnull=True)
+
+
+def update_export(export, **fields):
+    """작업 행 갱신 (행이 삭제되었거나 사용자가 탈퇴했으면 ExportCancelled)"""
+    for field, value in fields.items():
+        setattr(export, field, value)
+    export.updated_at = timezone.now()
+    rows = active_exports().filter(pk=export.pk)
+    if not rows.update(updated_at=export.updated_at, **fields):
+        raise ExportCancelled()
+
+
+def delete_export_files(export, storage):
+    """작업의 중간 파일과 최종 파일 삭제"""
+    for name, _, _ in EXPORT_SECTIONS:
+        storage.delete(part_name(export, name))
+    storage.delete(export_name(export))
+    if export.file:
+        storage.delete(export.file)
+
+
+def run_export(export):
+    """남은 섹션부터 내보내기를 실행 (섹션마다 진행 상황 저장)"""
+    storage = get_export_storage()
+    lease = timedelta(seconds=settings.DATA_EXPORT_LEASE_SECONDS)
+
+    for name, rows, many in EXPORT_SECTIONS:
+        if name in export.completed_sections:
+            continue
+        save_stream(
+            storage, part_name(export, name), iter_json(rows(export.user_id), many)
+        )
+        update_export(
+            export,
+            completed_sections=[*export.completed_sections, name],
+            locked_until=timezone.now() + lease,
+        )
+
+    file = save_stream(storage, export_name(export), assemble(export, storage))
+    update_export(
+        export,
+        file=file,
+        size=storage.size(file),
+        status=DataExport.STATUS_DONE,
+        locked_until=None,
+        error="",
+        finished_at=timezone.now(),
+    )
+    for name, _, _ in EXPORT_SECTIONS:
+        storage.delete(part_name(export, name))
+    return export
+
+
+def retryable_exports():
+    """아직 실행할 수 있는 작업 (미완료, 시도 횟수 남음, 탈퇴하지 않은 사용자)"""
+    return (
+        active_exports()
+        .exclude(status=DataExport.STATUS_DONE)
+        .filter(attempts__lt=settings.DATA_EXPORT_MAX_ATTEMPTS)
+    )
+
+
+def claim_export(export_id):
+    """다른 워커가 실행 중이 아닌 작업을 점유 (점유 만료된 작업은 이어서 실행)"""
+    now = timezone.now()
+    claimed = (
+        retryable_exports()
+        .filter(pk=export_id)
+        .filter(models.Q(locked_until__isnull=True) | models.Q(locked_until__lt=now))
+        .update(
+            status=DataExport.STATUS_RUNNING,
+            locked_until=now + timedelta(seconds=settings.DATA_EXPORT_LEASE_SECONDS),
+            attempts=models.F("attempts") + 1,
+            updated_at=now,
+        )
+    )
+    return DataExport.objects.get(pk=export_id) if claimed else None
+
+
+def process_export(export_id):
+    """작업을 점유해 실행하고, 실패하면 상태를 기록 (다음 실행에서 재시도)"""
+    export = claim_export(export_id)
+    if export is None:
+        return None
+    try:
+        return run_export(export)
+    except ExportCancelled:
+        logger.info("탈퇴로 개인 데이터 내보내기 중단: export_id=%s", export_id)
+        delete_export_files(export, get_export_storage())
+        return None
+    except Exception as exc:
+        logger.exception("개인 데이터 내보내기 실패: export_id=%s", export_id)
+        failed = (
+            active_exports()
+            .filter(pk=export_id)
+            .update(
+                status=DataExport.STATUS_FAILED,
+                locked_until=None,
+                error=str(exc),
+                updated_at=timezone.now(),
+            )
+        )
+        if not failed:
+            delete_export_files(export, get_export_storage())
+        return None
+
+
+def run_export_job(export_id):
+    """백그라운드 스레드용 래퍼"""
+    try:
+        process_export(export_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_export(export):
+    """트랜잭션 커밋 후 내보내기 실행 예약"""
+
+    def submit():
+        if settings.DATA_EXPORT_ASYNC:
+            _executor.submit(run_export_job, export.pk)
+        else:
+            process_export(export.pk)
+
+    transaction.on_commit(submit)
+
+
+def run_pending_exports():
+    """대기/실패/중단된 작업을 순서대로 실행하고 완료된 작업 목록 반환"""
+    pending = retryable_exports().order_by("pk").values_list("pk", flat=True)
+    finished = []
+    for export_id in list(pending):
+        export = process_export(export_id)
+        if export is not None:
+            finished.append(export)
+    return finished
+
+
+def delete_exports(exports):
+    """내보내기 파일과 기록 삭제 (탈퇴/보관 기간 만료)"""
+    storage = get_export_storage()
+    deleted = 0
+    for export in exports.iterator():
+        delete_export_files(export, storage)
+        export.delete()
+        deleted += 1
+    return deleted
+
+
+def expired_exports():
+    cutoff = timezone.now() - timedelta(days=settings.DATA_EXPORT_TTL_DAYS)
+    return DataExport.objects.filter(created_at__lt=cutoff)
@@ -0,0 +1,41 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.analytics import backfill_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "users 테이블(가입일/last_login)과 감사 로그(로그인)를 pk 순서로 나눠 읽어 "
+        "일별 가입자 수/활성 사용자 집계를 채웁니다. 여러 번 실행해도 결과가 같습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since", help="이 날짜(YYYY-MM-DD) 이후만 다시 계산 (기본값: 전체)"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="한 번에 읽을 행 수 (기본값: 5000)",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            try:
+                since = datetime.date.fromisoformat(options["since"])
+            except ValueError:
+                raise CommandError("--since는 YYYY-MM-DD 형식이어야 합니다.")
+
+        def progress(source, last_pk, count):
+            self.stdout.write(f"{source}: pk {last_pk}까지 {count}행")
+
+        signups, active = backfill_rollups(since, options["chunk_size"], progress)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"집계 완료: 가입 {sum(signups.values())}명, 활성 사용자 {len(active)}일"
+            )
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from apps.users.presence import compact_presence
+
+
+class Command(BaseCommand):
+    help = "캐시에 쌓인 접속 기록을 users.last_seen에 묶음으로 반영합니다 (주기적으로 실행)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="한 번에 읽을 접속 기록 수 (기본값: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        def progress(number, end, users):
+            self.stdout.write(f"기록 {number}/{end}: 사용자 {users}명")
+
+        updated = compact_presence(options["chunk_size"], progress=progress)
+        self.stdout.write(self.style.SUCCESS(f"마지막 접속 시각 {updated}건 갱신"))
@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.core.models import StoredFile
+from apps.core.storage import delete_unreferenced_files, get_avatar_storage
+from apps.users.avatars import delete_avatar_variants
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = "프로필 이미지 참조 수를 다시 계산하고 참조되지 않는 파일을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tmp-max-age",
+            type=int,
+            default=24,
+            help="이 시간(시간 단위)보다 오래된 업로드 임시 파일 삭제 (기본값: 24)",
+        )
+        parser.add_argument(
+            "--orphan-max-age",
+            type=int,
+            default=24,
+            help="참조되지 않은 지 이 시간(시간 단위)이 지난 원본 삭제 (기본값: 24)",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="삭제하지 않고 대상만 출력"
+        )
+
+    def handle(self, *args, **options):
+        storage = get_avatar_storage()
+        dry_run = options["dry_run"]
+
+        # 1. users.avatar 기준으로 참조 수 재계산 (참조가 없으면 tombstone으로 남김)
+        counts = dict(
+            User.objects.exclude(avatar__isnull=True)
+            .exclude(avatar="")
+            .values_list("avatar")
+            .annotate(count=Count("id"))
+        )
+        fixed = 0
+        for stored in StoredFile.objects.filter(name__startswith="avatars/"):
+            count = counts.pop(stored.name, 0)
+            if count == stored.ref_count:
+                continue
+            fixed += 1
+            if not dry_run:
+                StoredFile.objects.filter(pk=stored.pk).update(
+                    ref_count=count, updated_at=timezone.now()
+                )
+        if not dry_run:
+            StoredFile.objects.bulk_create(
+                [
+                    StoredFile(name=name, ref_count=count)
+                    for name, count in counts.items()
+                ],
+                ignore_conflicts=True,
+            )
+        fixed += len(counts)
+
+        # 2. 중단된 업로드가 남긴 임시 파일 삭제
+        cutoff = timezone.now() - timedelta(hours=options["tmp_max_age"])
+        removed = 0
+        try:
+            _, files = storage.listdir("avatars/tmp")
+        except FileNotFoundError:
+            files = []
+        for filename in files:
+            name = f"avatars/tmp/{filename}"
+            if storage.get_modified_time(name) < cutoff:
+                removed += 1
+                if not dry_run:
+                    storage.delete(name)
+
+        # 3. 참조 기록 없이 남은 원본은 tombstone을 만들어 다음 실행에서 유예 시간 후 삭제
+        # (이전 버전에서 남은 파일 등. 새 업로드는 reserve_file이 기록을 먼저 만든다)
+        cutoff = timezone.now() - timedelta(hours=options["orphan_max_age"])
+        known = set(
+            StoredFile.objects.filter(name__startswith="avatars/").values_list(
+                "name", flat=True
+            )
+        )
+        orphaned = [
+            name
+            for name in content_files(storage)
+            if name not in known and storage.get_modified_time(name) < cutoff
+        ]
+        if not dry_run:
+            StoredFile.objects.bulk_create(
+                [StoredFile(name=name, ref_count=0) for name in orphaned],
+                ignore_conflicts=True,
+            )
+
+        # 4. 유예 시간이 지나도록 참조되지 않은 원본과 썸네일 삭제
+        if dry_run:
+            deleted = StoredFile.objects.filter(
+                name__startswith="avatars/", ref_count=0, updated_at__lt=cutoff
+            ).count()
+        else:
+            deleted = delete_unreferenced_files(
+                storage, "avatars/", cutoff, on_delete=delete_avatar_variants
+            )
+
+        prefix = "[dry-run] " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}참조 수 수정 {fixed}건, 임시 파일 삭제 {removed}건, "
+                f"참조 기록 없는 원본 {len(orphaned)}건, 참조 없는 원본 삭제 {deleted}건"
+            )
+        )
+
+
+def content_files(storage):
+    """내용 주소 기반 원본 경로 (avatars/<해시 앞 2자리>/<해시>.<확장자>) 목록"""
+    try:
+        directories, _ = storage.listdir("avatars")
+    except FileNotFoundError:
+        return
+    for directory in directories:
+        # avatars/tmp, 썸네일 디렉터리(avatars/<hash>/)는 제외
+        if len(directory) != 2:
+            continue
+        _, files = storage.listdir(f"avatars/{directory}")
+        for filename in files:
+            yield f"avatars/{directory}/{filename}"
@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.users.audit import purge_audit_events, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 월의 보안 감사 로그를 월 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=settings.AUDIT_LOG_RETENTION_MONTHS,
+            help="최근 이 기간(개월)의 로그만 보관 "
+            f"(기본값: {settings.AUDIT_LOG_RETENTION_MONTHS})",
+        )
+
+    def handle(self, *args, **options):
+        months = options["retention_months"]
+        deleted = purge_audit_events(months)
+        for month, count in sorted(deleted.items()):
+            self.stdout.write(f"{month:%Y-%m}: {count}건")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{retention_cutoff(months):%Y-%m} 이전 감사 로그 "
+                f"{sum(deleted.values())}건 삭제"
+            )
+        )
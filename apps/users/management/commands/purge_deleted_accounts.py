@@ -0,0 +1,69 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.users.purge import (
+    purgeable_users,
+    retryable_purges,
+    run_pending_purges,
+    schedule_purges,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "보관 기간이 지난 탈퇴 계정과 연관 데이터를 묶음 단위로 영구 삭제합니다. "
+        "중단된 작업은 마지막으로 저장된 단계부터 이어서 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.ACCOUNT_PURGE_RETENTION_DAYS,
+            help="탈퇴 후 이 기간(일)이 지난 계정 삭제 "
+            f"(기본값: {settings.ACCOUNT_PURGE_RETENTION_DAYS})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ACCOUNT_PURGE_BATCH_SIZE,
+            help="DELETE 문 하나에서 삭제할 행 수 "
+            f"(기본값: {settings.ACCOUNT_PURGE_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--limit", type=int, help="이번 실행에서 처리할 최대 계정 수"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="삭제하지 않고 대상 수만 출력"
+        )
+
+    def handle(self, *args, **options):
+        retention_days = options["retention_days"]
+        if options["dry_run"]:
+            count = purgeable_users(retention_days).count()
+            pending = retryable_purges().count()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[dry-run] 삭제 대상 계정 {count}명, 진행 중/대기 작업 {pending}건"
+                )
+            )
+            return
+
+        schedule_purges(retention_days)
+        jobs = run_pending_purges(options["batch_size"], options["limit"])
+
+        rows = elapsed = 0
+        for job in jobs:
+            rows += job.rows_deleted
+            elapsed += job.elapsed
+            self.stdout.write(
+                f"user {job.user_id}: {job.rows_deleted}행, "
+                f"{job.elapsed:.2f}초 ({job.throughput:,.0f}행/초)"
+            )
+        throughput = rows / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"영구 삭제 완료: 계정 {len(jobs)}명, {rows}행, "
+                f"{elapsed:.2f}초 ({throughput:,.0f}행/초)"
+            )
+        )
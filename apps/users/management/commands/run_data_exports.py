@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from apps.users.exports import delete_exports, expired_exports, run_pending_exports
+
+
+class Command(BaseCommand):
+    help = (
+        "대기/실패/중단된 개인 데이터 내보내기를 남은 섹션부터 이어서 실행하고, "
+        "보관 기간이 지난 내보내기 파일을 삭제합니다."
+    )
+
+    def handle(self, *args, **options):
+        exports = run_pending_exports()
+        for export in exports:
+            self.stdout.write(
+                f"export {export.pk} (user {export.user_id}): {export.size:,} bytes"
+            )
+        deleted = delete_exports(expired_exports())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"내보내기 완료 {len(exports)}건, 만료 파일 삭제 {deleted}건"
+            )
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 6.1.2 on 2026-10-19 04:45
+
+import apps.core.storage
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_user_avatar_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="avatar",
+            field=models.ImageField(
+                blank=True,
+                help_text="프로필 이미지 (jpg, png, gif 지원)",
+                null=True,
+                storage=apps.core.storage.get_avatar_storage,
+                upload_to="avatars/",
+                validators=[
+                    django.core.validators.FileExtensionValidator(
+                        allowed_extensions=["jpg", "jpeg", "png", "gif"]
+                    )
+                ],
+                verbose_name="프로필 이미지",
+            ),
+        ),
+    ]
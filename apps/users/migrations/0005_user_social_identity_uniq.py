@@ -0,0 +1,24 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0004_alter_user_avatar"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("social_id__isnull", False), ("social_provider__isnull", False)
+                ),
+                fields=("social_provider", "social_id"),
+                name="users_social_identity_uniq",
+            ),
+        ),
+    ]
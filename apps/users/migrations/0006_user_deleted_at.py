@@ -0,0 +1,92 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:08
+
+import re
+
+from django.db import migrations, models
+
+# 이전 탈퇴 처리 방식: is_active=False + email="deleted_{id}_{email}"
+LEGACY_DELETED_EMAIL = re.compile(r"^deleted_(\d+)_(.+)$")
+BATCH_SIZE = 1000
+
+
+def mark_legacy_deleted_users(apps, schema_editor):
+    """이전 방식으로 탈퇴한 계정을 deleted_at + 원래 이메일로 변환"""
+    User = apps.get_model("users", "User")
+    users = User.objects.filter(is_active=False, email__startswith="deleted_").only(
+        "id", "email", "updated_at"
+    )
+    batch = []
+    for user in users.iterator(chunk_size=BATCH_SIZE):
+        match = LEGACY_DELETED_EMAIL.match(user.email)
+        if match is None or int(match[1]) != user.pk:
+            continue
+        user.email = match[2]
+        user.deleted_at = user.updated_at
+        batch.append(user)
+        if len(batch) >= BATCH_SIZE:
+            User.objects.bulk_update(batch, ["email", "deleted_at"])
+            batch = []
+    User.objects.bulk_update(batch, ["email", "deleted_at"])
+
+
+def restore_legacy_deleted_emails(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    users = User.objects.filter(deleted_at__isnull=False).only("id", "email")
+    batch = []
+    for user in users.iterator(chunk_size=BATCH_SIZE):
+        user.email = f"deleted_{user.pk}_{user.email}"
+        batch.append(user)
+        if len(batch) >= BATCH_SIZE:
+            User.objects.bulk_update(batch, ["email"])
+            batch = []
+    User.objects.bulk_update(batch, ["email"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0005_user_social_identity_uniq"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="user",
+            name="users_social_identity_uniq",
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="탈퇴일"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="email",
+            field=models.EmailField(
+                help_text="로그인에 사용될 이메일 주소", max_length=254, verbose_name="이메일"
+            ),
+        ),
+        migrations.RunPython(mark_legacy_deleted_users, restore_legacy_deleted_emails),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("email",),
+                name="users_email_active_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("deleted_at__isnull", True),
+                    ("social_id__isnull", False),
+                    ("social_provider__isnull", False),
+                ),
+                fields=("social_provider", "social_id"),
+                name="users_social_identity_uniq",
+            ),
+        ),
+    ]
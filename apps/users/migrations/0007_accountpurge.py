@@ -0,0 +1,62 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_user_deleted_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AccountPurge",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("user_id", models.BigIntegerField(unique=True, verbose_name="사용자 ID")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "진행 중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("step", models.PositiveIntegerField(default=0, verbose_name="진행 단계")),
+                (
+                    "rows_deleted",
+                    models.PositiveBigIntegerField(default=0, verbose_name="삭제한 행 수"),
+                ),
+                ("deleted", models.JSONField(default=dict, verbose_name="모델별 삭제 수")),
+                ("elapsed", models.FloatField(default=0, verbose_name="삭제 소요 시간(초)")),
+                (
+                    "locked_until",
+                    models.DateTimeField(blank=True, null=True, verbose_name="점유 만료 시각"),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 시간")),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="완료 시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "계정 영구 삭제 작업",
+                "verbose_name_plural": "계정 영구 삭제 작업들",
+                "db_table": "account_purges",
+            },
+        ),
+    ]
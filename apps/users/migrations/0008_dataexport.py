@@ -0,0 +1,81 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0007_accountpurge"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataExport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "format",
+                    models.CharField(
+                        choices=[("json", "JSON"), ("zip", "ZIP")],
+                        default="zip",
+                        max_length=10,
+                        verbose_name="형식",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "진행 중"),
+                            ("done", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("completed_sections", models.JSONField(default=list, verbose_name="완료된 섹션")),
+                ("file", models.CharField(blank=True, max_length=255, verbose_name="파일")),
+                ("size", models.PositiveBigIntegerField(default=0, verbose_name="파일 크기")),
+                (
+                    "locked_until",
+                    models.DateTimeField(blank=True, null=True, verbose_name="점유 만료 시각"),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="마지막 오류")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="수정 시간")),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="완료 시간"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="data_exports",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "개인 데이터 내보내기",
+                "verbose_name_plural": "개인 데이터 내보내기들",
+                "db_table": "data_exports",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at"], name="data_export_user_id_49b43c_idx"
+                    )
+                ],
+            },
+        ),
+    ]
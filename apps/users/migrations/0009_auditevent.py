@@ -0,0 +1,60 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0008_dataexport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("month", models.DateField(verbose_name="기록 월")),
+                ("created_at", models.DateTimeField(verbose_name="기록 시간")),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("login", "로그인"),
+                            ("login_failed", "로그인 실패"),
+                            ("password_change", "비밀번호 변경"),
+                            ("email_verified", "이메일 인증"),
+                            ("email_resend", "인증 메일 재발송"),
+                            ("account_deleted", "계정 삭제"),
+                        ],
+                        max_length=30,
+                        verbose_name="이벤트",
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.BigIntegerField(blank=True, null=True, verbose_name="사용자 ID"),
+                ),
+                (
+                    "email",
+                    models.CharField(blank=True, max_length=254, verbose_name="시도한 이메일"),
+                ),
+                ("ip", models.GenericIPAddressField(blank=True, null=True, verbose_name="IP 주소")),
+                (
+                    "user_agent",
+                    models.CharField(blank=True, max_length=255, verbose_name="User-Agent"),
+                ),
+                ("data", models.JSONField(blank=True, default=dict, verbose_name="추가 정보")),
+            ],
+            options={
+                "verbose_name": "감사 로그",
+                "verbose_name_plural": "감사 로그들",
+                "db_table": "audit_events",
+                "indexes": [
+                    models.Index(fields=["user_id", "-created_at"], name="audit_user_idx"),
+                    models.Index(fields=["ip", "-created_at"], name="audit_ip_idx"),
+                    models.Index(fields=["month"], name="audit_month_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.1.2 on 2026-10-19 05:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0009_auditevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyActiveUsers",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField(unique=True, verbose_name="날짜")),
+                ("sketch", models.BinaryField(verbose_name="HyperLogLog 레지스터")),
+                ("logins", models.PositiveIntegerField(default=0, verbose_name="로그인 수")),
+            ],
+            options={
+                "verbose_name": "일별 활성 사용자",
+                "verbose_name_plural": "일별 활성 사용자",
+                "db_table": "daily_active_users",
+            },
+        ),
+        migrations.CreateModel(
+            name="DailySignup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "social_provider",
+                    models.CharField(blank=True, max_length=20, verbose_name="소셜 로그인 제공자"),
+                ),
+                ("language", models.CharField(max_length=10, verbose_name="언어")),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="가입자 수")),
+            ],
+            options={
+                "verbose_name": "일별 가입자 수",
+                "verbose_name_plural": "일별 가입자 수",
+                "db_table": "daily_signups",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "social_provider", "language"), name="daily_signups_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.1.2 on 2026-10-19 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0010_login_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="last_seen",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="마지막 접속"
+            ),
+        ),
+    ]
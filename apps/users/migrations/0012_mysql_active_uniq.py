@@ -0,0 +1,67 @@
+"""
+MySQL용 탈퇴하지 않은 사용자 유니크 인덱스
+
+MySQL은 조건부 유니크 제약(users_email_active_uniq, users_social_identity_uniq)을 지원하지 않아
+Django가 제약을 만들지 않는다 (models.W036). 탈퇴하지 않은 사용자에서만 값을 갖는
+가상 생성 컬럼에 유니크 인덱스를 만들어 같은 제약을 건다 (NULL은 중복 허용).
+다른 DB는 부분 유니크 인덱스를 쓰므로 아무것도 하지 않는다.
+"""
+
+from django.db import migrations
+
+# (생성 컬럼, 원본 컬럼, 인덱스 이름, 인덱스 컬럼)
+ACTIVE_COLUMNS = (
+    (
+        "active_email",
+        "email",
+        "users_email_active_uniq",
+        ("active_email",),
+    ),
+    (
+        "active_social_id",
+        "social_id",
+        "users_social_identity_uniq",
+        ("social_provider", "active_social_id"),
+    ),
+)
+
+
+def add_active_columns(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "mysql":
+        return
+    quote = schema_editor.quote_name
+    User = apps.get_model("users", "User")
+    table = quote(User._meta.db_table)
+    for column, source, index, columns in ACTIVE_COLUMNS:
+        field = User._meta.get_field(source)
+        schema_editor.execute(
+            f"ALTER TABLE {table} ADD COLUMN {quote(column)} {field.db_type(connection)} "
+            f"GENERATED ALWAYS AS (CASE WHEN {quote('deleted_at')} IS NULL "
+            f"THEN {quote(field.column)} END) VIRTUAL"
+        )
+        schema_editor.execute(
+            f"CREATE UNIQUE INDEX {quote(index)} ON {table} "
+            f"({', '.join(map(quote, columns))})"
+        )
+
+
+def remove_active_columns(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    quote = schema_editor.quote_name
+    table = quote(apps.get_model("users", "User")._meta.db_table)
+    for column, _, index, _ in ACTIVE_COLUMNS:
+        schema_editor.execute(f"DROP INDEX {quote(index)} ON {table}")
+        schema_editor.execute(f"ALTER TABLE {table} DROP COLUMN {quote(column)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0011_user_last_seen"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_active_columns, remove_active_columns),
+    ]
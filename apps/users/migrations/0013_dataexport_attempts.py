@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-19 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0012_mysql_active_uniq"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataexport",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수"),
+        ),
+    ]
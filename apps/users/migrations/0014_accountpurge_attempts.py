@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-19 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0013_dataexport_attempts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accountpurge",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="시도 횟수"),
+        ),
+    ]
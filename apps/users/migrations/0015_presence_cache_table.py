@@ -0,0 +1,25 @@
+"""
+접속 상태 DB 캐시 테이블 (CACHE_URL이 없을 때의 PRESENCE_CACHE)
+
+createcachetable은 설정된 DatabaseCache 테이블만 만들고 이미 있으면 건너뛴다.
+"""
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_table(apps, schema_editor):
+    call_command(
+        "createcachetable", database=schema_editor.connection.alias, verbosity=0
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0014_accountpurge_attempts"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_table, migrations.RunPython.noop),
+    ]
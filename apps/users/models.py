@@ -1,14 +1,31 @@
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
 from django.core.validators import FileExtensionValidator
 import uuid
 
+from apps.core.storage import get_avatar_storage
 
-class UserManager(BaseUserManager):
+
+class UserQuerySet(models.QuerySet):
+    def alive(self):
+        """삭제(deleted_at)되지 않은 사용자"""
+        return self.filter(deleted_at__isnull=True)
+
+    def deleted(self):
+        """탈퇴 처리된 사용자 (영구 삭제 대기)"""
+        return self.filter(deleted_at__isnull=False)
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
     """
     Custom User Manager - 이메일 기반 사용자 관리
     """
 
+    def get_by_natural_key(self, username):
+        """로그인용 조회 - 탈퇴한 계정은 같은 이메일이 있어도 제외"""
+        return self.alive().get(**{self.model.USERNAME_FIELD: username})
+
     def create_user(self, email, password=None, **extra_fields):
         """일반 사용자 생성"""
         if not email:
@@ -37,6 +54,22 @@ class UserManager(BaseUserManager):
 
         return self.create_user(email, password, **extra_fields)
 
+    def get_by_social_identity(self, provider, social_id):
+        """
+        소셜 로그인 제공자/ID로 사용자 조회 (프로필 포함, 없으면 None)
+        (social_provider, social_id) 부분 유니크 인덱스를 사용하는 쿼리 한 번으로 조회한다.
+        """
+        if not provider or not social_id:
+            return None
+        try:
+            return (
+                self.alive()
+                .select_related("profile")
+                .get(social_provider=provider, social_id=social_id)
+            )
+        except self.model.DoesNotExist:
+            return None
+
 
 class User(AbstractUser):
     """
@@ -47,10 +80,8 @@ class User(AbstractUser):
     # 기본 username 필드는 사용하지 않음
     username = None
 
-    # 이메일을 유니크한 사용자명으로 사용
-    email = models.EmailField(
-        "이메일", unique=True, help_text="로그인에 사용될 이메일 주소"
-    )
+    # 이메일을 사용자명으로 사용 (탈퇴하지 않은 사용자끼리 유니크, Meta.constraints)
+    email = models.EmailField("이메일", help_text="로그인에 사용될 이메일 주소")
 
     # 이름 필드들
     first_name = models.CharField("이름", max_length=30)
@@ -60,6 +91,7 @@ class User(AbstractUser):
     avatar = models.ImageField(
         "프로필 이미지",
         upload_to="avatars/",
+        storage=get_avatar_storage,
         null=True,
         blank=True,
         validators=[
@@ -68,6 +100,11 @@ class User(AbstractUser):
         help_text="프로필 이미지 (jpg, png, gif 지원)",
     )
 
+    # 썸네일 생성이 끝난 원본의 해시 (avatars/<hash>/<size>.<ext>)
+    avatar_hash = models.CharField(
+        "프로필 이미지 해시", max_length=64, blank=True, editable=False
+    )
+
     bio = models.TextField(
         "자기소개", max_length=500, blank=True, help_text="간단한 자기소개"
     )
@@ -125,6 +162,12 @@ class User(AbstractUser):
     last_login_ip = models.GenericIPAddressField(
         "마지막 로그인 IP", null=True, blank=True
     )
+    # 마지막 접속 시각 (요청마다 쓰지 않고 compact_presence가 묶음으로 반영, apps.users.presence)
+    last_seen = models.DateTimeField(
+        "마지막 접속", null=True, blank=True, editable=False
+    )
+    # 탈퇴 시각 (보관 기간이 지나면 purge_deleted_accounts가 영구 삭제)
+    deleted_at = models.DateTimeField("탈퇴일", null=True, blank=True, editable=False)
 
     # 이메일을 USERNAME_FIELD로 사용
     USERNAME_FIELD = "email"
@@ -137,6 +180,25 @@ class User(AbstractUser):
         db_table = "users"
         verbose_name = "사용자"
         verbose_name_plural = "사용자들"
+        # 유니크 인덱스에는 탈퇴하지 않은 사용자만 포함 (탈퇴 후 같은 이메일로 재가입 가능)
+        # MySQL은 조건부 제약을 지원하지 않으므로 0012 마이그레이션이 생성 컬럼 유니크 인덱스로 대신함
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="users_email_active_uniq",
+            ),
+            # 소셜 계정 하나는 사용자 한 명에게만 연결 (소셜 로그인 사용자만 인덱스에 포함)
+            models.UniqueConstraint(
+                fields=["social_provider", "social_id"],
+                condition=models.Q(
+                    social_provider__isnull=False,
+                    social_id__isnull=False,
+                    deleted_at__isnull=True,
+                ),
+                name="users_social_identity_uniq",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
@@ -149,12 +211,39 @@ class User(AbstractUser):
         """짧은 이름 반환"""
         return self.first_name
 
+    def get_avatar_url(self, size=None, fmt="jpeg"):
+        """크기/포맷별 썸네일 URL 반환 (썸네일 생성 전이면 원본 URL)"""
+        if not self.avatar:
+            return None
+        if not self.avatar_hash:
+            return self.avatar.url
+
+        from .avatars import avatar_variant_name
+
+        size = size or settings.AVATAR_DEFAULT_SIZE
+        return self.avatar.storage.url(avatar_variant_name(self.avatar_hash, size, fmt))
+
     @property
     def avatar_url(self):
-        """프로필 이미지 URL 반환"""
-        if self.avatar:
-            return self.avatar.url
-        return None
+        """프로필 이미지 URL 반환 (기본 크기 썸네일)"""
+        return self.get_avatar_url()
+
+    @property
+    def avatar_urls(self):
+        """크기별 썸네일 URL 반환 ({"128": {"webp": ..., "jpeg": ...}})"""
+        if not self.avatar or not self.avatar_hash:
+            return None
+
+        from .avatars import AVATAR_FORMATS
+
+        return {
+            str(size): {fmt: self.get_avatar_url(size, fmt) for fmt in AVATAR_FORMATS}
+            for size in settings.AVATAR_SIZES
+        }
+
+    @property
+    def is_deleted(self):
+        return self.deleted_at is not None
 
     def is_social_user(self):
         """소셜 로그인 사용자인지 확인"""
@@ -239,3 +328,246 @@ class EmailVerificationToken(models.Model):
         from django.utils import timezone
 
         return timezone.now() > self.expires_at
+
+
+class AccountPurge(models.Model):
+    """
+    탈퇴 계정 영구 삭제 작업 진행 상황
+    사용자 행이 삭제된 뒤에도 남도록 외래 키 대신 user_id만 보관한다.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    user_id = models.BigIntegerField("사용자 ID", unique=True)
+
+    status = models.CharField(
+        "상태",
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, "대기"),
+            (STATUS_RUNNING, "진행 중"),
+            (STATUS_DONE, "완료"),
+            (STATUS_FAILED, "실패"),
+        ],
+        default=STATUS_PENDING,
+    )
+
+    # 삭제 계획(apps.users.purge.purge_plan)에서 다음에 실행할 단계
+    step = models.PositiveIntegerField("진행 단계", default=0)
+
+    rows_deleted = models.PositiveBigIntegerField("삭제한 행 수", default=0)
+    deleted = models.JSONField("모델별 삭제 수", default=dict)
+    elapsed = models.FloatField("삭제 소요 시간(초)", default=0)
+
+    # 실행 중인 워커의 점유 만료 시각 (워커가 중단되면 만료 후 다른 워커가 이어서 실행)
+    locked_until = models.DateTimeField("점유 만료 시각", null=True, blank=True)
+    # 점유한 횟수 (ACCOUNT_PURGE_MAX_ATTEMPTS에 도달하면 더 이상 재시도하지 않음)
+    attempts = models.PositiveSmallIntegerField("시도 횟수", default=0)
+    error = models.TextField("마지막 오류", blank=True)
+
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+    updated_at = models.DateTimeField("수정 시간", auto_now=True)
+    finished_at = models.DateTimeField("완료 시간", null=True, blank=True)
+
+    class Meta:
+        db_table = "account_purges"
+        verbose_name = "계정 영구 삭제 작업"
+        verbose_name_plural = "계정 영구 삭제 작업들"
+
+    def __str__(self):
+        return f"user {self.user_id} - {self.get_status_display()}"
+
+    @property
+    def throughput(self):
+        """초당 삭제 행 수"""
+        return self.rows_deleted / self.elapsed if self.elapsed else 0.0
+
+
+class DataExport(models.Model):
+    """
+    개인 데이터 내보내기 작업 (apps.users.exports)
+    섹션별 중간 파일을 만든 뒤 하나의 JSON/ZIP 파일로 합친다.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    FORMAT_JSON = "json"
+    FORMAT_ZIP = "zip"
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="data_exports"
+    )
+
+    format = models.CharField(
+        "형식",
+        max_length=10,
+        choices=[(FORMAT_JSON, "JSON"), (FORMAT_ZIP, "ZIP")],
+        default=FORMAT_ZIP,
+    )
+
+    status = models.CharField(
+        "상태",
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, "대기"),
+            (STATUS_RUNNING, "진행 중"),
+            (STATUS_DONE, "완료"),
+            (STATUS_FAILED, "실패"),
+        ],
+        default=STATUS_PENDING,
+    )
+
+    # 중간 파일 저장이 끝난 섹션 (중단 후 재실행 시 건너뜀)
+    completed_sections = models.JSONField("완료된 섹션", default=list)
+
+    file = models.CharField("파일", max_length=255, blank=True)
+    size = models.PositiveBigIntegerField("파일 크기", default=0)
+
+    locked_until = models.DateTimeField("점유 만료 시각", null=True, blank=True)
+    # 점유한 횟수 (DATA_EXPORT_MAX_ATTEMPTS에 도달하면 더 이상 재시도하지 않음)
+    attempts = models.PositiveSmallIntegerField("시도 횟수", default=0)
+    error = models.TextField("마지막 오류", blank=True)
+
+    created_at = models.DateTimeField("생성 시간", auto_now_add=True)
+    updated_at = models.DateTimeField("수정 시간", auto_now=True)
+    finished_at = models.DateTimeField("완료 시간", null=True, blank=True)
+
+    class Meta:
+        db_table = "data_exports"
+        verbose_name = "개인 데이터 내보내기"
+        verbose_name_plural = "개인 데이터 내보내기들"
+        indexes = [models.Index(fields=["user", "-created_at"])]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.get_format_display()} ({self.get_status_display()})"
+
+    @property
+    def filename(self):
+        """다운로드 파일명"""
+        return f"taskflow-export-{self.created_at:%Y%m%d}.{self.format}"
+
+
+class AuditEventQuerySet(models.QuerySet):
+    """감사 로그 조회 (추가 전용 - 수정/삭제 불가, 보관 기간 정리는 apps.users.audit)"""
+
+    def for_user(self, user_id):
+        return self.filter(user_id=user_id).order_by("-created_at", "-pk")
+
+    def from_ip(self, ip):
+        return self.filter(ip=ip).order_by("-created_at", "-pk")
+
+    def update(self, **kwargs):
+        raise TypeError("감사 로그는 수정할 수 없습니다.")
+
+    def delete(self):
+        raise TypeError("감사 로그는 보관 기간 정리로만 삭제됩니다.")
+
+
+class AuditEvent(models.Model):
+    """
+    인증 관련 보안 감사 로그 (추가 전용)
+    apps.users.audit.record_event가 프로세스 내 버퍼에 쌓고 bulk_create로 모아서 저장한다.
+    month(기록 월의 1일)가 파티션 키 역할을 하며 보관 기간 정리는 월 단위로 지운다.
+    """
+
+    LOGIN = "login"
+    LOGIN_FAILED = "login_failed"
+    PASSWORD_CHANGE = "password_change"
+    EMAIL_VERIFIED = "email_verified"
+    EMAIL_RESEND = "email_resend"
+    ACCOUNT_DELETED = "account_deleted"
+
+    EVENT_CHOICES = [
+        (LOGIN, "로그인"),
+        (LOGIN_FAILED, "로그인 실패"),
+        (PASSWORD_CHANGE, "비밀번호 변경"),
+        (EMAIL_VERIFIED, "이메일 인증"),
+        (EMAIL_RESEND, "인증 메일 재발송"),
+        (ACCOUNT_DELETED, "계정 삭제"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    month = models.DateField("기록 월")
+    created_at = models.DateTimeField("기록 시간")
+    event = models.CharField("이벤트", max_length=30, choices=EVENT_CHOICES)
+
+    # 사용자 행이 영구 삭제되어도 로그는 보관 기간까지 남도록 FK가 아닌 값으로 저장
+    user_id = models.BigIntegerField("사용자 ID", null=True, blank=True)
+    email = models.CharField("시도한 이메일", max_length=254, blank=True)
+    ip = models.GenericIPAddressField("IP 주소", null=True, blank=True)
+    user_agent = models.CharField("User-Agent", max_length=255, blank=True)
+    data = models.JSONField("추가 정보", default=dict, blank=True)
+
+    objects = AuditEventQuerySet.as_manager()
+
+    class Meta:
+        db_table = "audit_events"
+        verbose_name = "감사 로그"
+        verbose_name_plural = "감사 로그들"
+        indexes = [
+            models.Index(fields=["user_id", "-created_at"], name="audit_user_idx"),
+            models.Index(fields=["ip", "-created_at"], name="audit_ip_idx"),
+            models.Index(fields=["month"], name="audit_month_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_event_display()} - {self.user_id or self.email} ({self.ip})"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("감사 로그는 수정할 수 없습니다.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("감사 로그는 보관 기간 정리로만 삭제됩니다.")
+
+
+class DailySignup(models.Model):
+    """
+    일별 가입자 수 집계 (apps.users.analytics)
+    가입 경로(social_provider, 이메일 가입은 빈 값)와 언어별로 나눈다.
+    """
+
+    date = models.DateField("날짜")
+    social_provider = models.CharField("소셜 로그인 제공자", max_length=20, blank=True)
+    language = models.CharField("언어", max_length=10)
+    count = models.PositiveIntegerField("가입자 수", default=0)
+
+    class Meta:
+        db_table = "daily_signups"
+        verbose_name = "일별 가입자 수"
+        verbose_name_plural = "일별 가입자 수"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "social_provider", "language"],
+                name="daily_signups_uniq",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.social_provider or 'email'}/{self.language}: {self.count}"
+
+
+class DailyActiveUsers(models.Model):
+    """
+    일별 활성 사용자 집계 (apps.users.analytics)
+    sketch는 그날 로그인한 사용자 ID의 HyperLogLog 레지스터로, 여러 날을 합쳐 기간 내 고유 사용자 수를 구한다.
+    """
+
+    date = models.DateField("날짜", unique=True)
+    sketch = models.BinaryField("HyperLogLog 레지스터")
+    logins = models.PositiveIntegerField("로그인 수", default=0)
+
+    class Meta:
+        db_table = "daily_active_users"
+        verbose_name = "일별 활성 사용자"
+        verbose_name_plural = "일별 활성 사용자"
+
+    def __str__(self):
+        return f"{self.date}: {self.logins}회 로그인"
@@ -0,0 +1,154 @@
+"""
+접속 상태(presence)
+
+인증된 요청마다 users 테이블을 갱신하지 않고 공유 캐시(PRESENCE_CACHE)에 마지막 접속 시각을 남긴다.
+- touch(user_id)는 같은 프로세스에서 사용자당 PRESENCE_TOUCH_INTERVAL초에 한 번만 캐시에 쓴다
+  (그 사이의 요청은 프로세스 내 dict 조회만 함, DB 접근 없음)
+- 캐시에 쓸 때 presence:<id>(조회용)와 함께 증가하는 번호의 기록(presence:log:<번호>)을 남긴다
+- compact_presence 명령이 마지막으로 처리한 번호 이후의 기록만 읽어 users.last_seen을 분 단위로
+  묶어 갱신한다 (전체 사용자를 훑지 않으므로 비용이 접속한 사용자 수에 비례)
+- 조회(last_seen_many)는 캐시 값과 users.last_seen 중 최근 값을 쓴다
+
+기록은 PRESENCE_LOG_TTL 동안 보관되므로 compact_presence는 그보다 자주 실행해야 한다.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_KEY = "presence:seq"  # 마지막으로 발급한 기록 번호
+CURSOR_KEY = "presence:cursor"  # compact_presence가 마지막으로 처리한 기록 번호
+
+# 사용자 id -> 마지막으로 캐시에 쓴 시각(monotonic). 너무 커지면 비움 (다음 요청에서 한 번 더 쓸 뿐)
+_touched = {}
+MAX_TRACKED = 100_000
+
+
+def presence_cache():
+    return caches[settings.PRESENCE_CACHE]
+
+
+def presence_key(user_id):
+    return f"presence:{user_id}"
+
+
+def log_key(number):
+    return f"presence:log:{number}"
+
+
+def next_log_number(cache):
+    try:
+        return cache.incr(SEQUENCE_KEY)
+    except ValueError:
+        cache.add(SEQUENCE_KEY, 0, timeout=None)
+        return cache.incr(SEQUENCE_KEY)
+
+
+def touch(user_id):
+    """접속 기록 (PRESENCE_TOUCH_INTERVAL 안의 반복 호출은 무시). 캐시에 썼으면 True"""
+    now = time.monotonic()
+    last = _touched.get(user_id)
+    if last is not None and now - last < settings.PRESENCE_TOUCH_INTERVAL:
+        return False
+    if len(_touched) >= MAX_TRACKED:
+        _touched.clear()
+    _touched[user_id] = now
+
+    seen = time.time()
+    cache = presence_cache()
+    try:
+        cache.set(presence_key(user_id), seen, settings.PRESENCE_LOG_TTL)
+        cache.set(
+            log_key(next_log_number(cache)),
+            (user_id, seen),
+            settings.PRESENCE_LOG_TTL,
+        )
+    except Exception:
+        # 접속 상태 때문에 요청이 실패하지 않도록 함
+        logger.warning("접속 상태 기록 실패 (user_id=%s)", user_id, exc_info=True)
+    return True
+
+
+def reset_touches():
+    """프로세스 내 중복 기록 방지 상태 초기화 (테스트용)"""
+    _touched.clear()
+
+
+def from_timestamp(value):
+    return datetime.fromtimestamp(value, UTC)
+
+
+def last_seen_many(user_ids):
+    """활성 사용자 id별 마지막 접속 시각 (접속 기록이 없으면 None, 없는 사용자는 제외)"""
+    cached = presence_cache().get_many([presence_key(pk) for pk in user_ids])
+    result = {}
+    for pk, stored in (
+        User.objects.alive()
+        .filter(pk__in=user_ids, is_active=True)
+        .values_list("pk", "last_seen")
+    ):
+        seen = cached.get(presence_key(pk))
+        seen = from_timestamp(seen) if seen is not None else None
+        result[pk] = max(filter(None, (seen, stored)), default=None)
+    return result
+
+
+def save_last_seen(latest):
+    """
+    {user_id: 접속 시각} 중 users.last_seen보다 최근인 것만 반영하고 갱신한 행 수 반환
+    같은 시각(분 단위)끼리 조건부 UPDATE 한 번으로 처리한다
+    """
+    users_by_time = defaultdict(list)
+    for pk, seen in latest.items():
+        users_by_time[seen].append(pk)
+    updated = 0
+    for seen, pks in users_by_time.items():
+        # QuerySet.update()는 save()를 거치지 않으므로 updated_at(캐시 검증값)도 바뀌지 않는다
+        updated += (
+            User.objects.filter(pk__in=pks)
+            .filter(Q(last_seen__isnull=True) | Q(last_seen__lt=seen))
+            .update(last_seen=seen)
+        )
+    return updated
+
+
+def compact_presence(chunk_size=1000, progress=None):
+    """
+    마지막 처리 이후의 접속 기록을 users.last_seen에 반영하고 갱신한 행 수 반환
+    여러 번(동시에) 실행해도 결과가 같다 (더 최근 시각만 반영)
+    """
+    cache = presence_cache()
+    cursor = cache.get(CURSOR_KEY, 0)
+    end = cache.get(SEQUENCE_KEY, 0)
+    if end < cursor:
+        # 번호가 만료/캐시 초기화로 다시 시작됨 - 처음부터 처리
+        cursor = 0
+        cache.set(CURSOR_KEY, cursor, timeout=None)
+    updated = 0
+    for start in range(cursor + 1, end + 1, chunk_size):
+        keys = [
+            log_key(number) for number in range(start, min(start + chunk_size, end + 1))
+        ]
+        latest = {}
+        # 번호만 발급되고 아직 쓰이지 않았거나 만료된 기록은 건너뜀
+        # (사용자가 계속 접속 중이면 다음 기록에서 반영됨)
+        for user_id, seen in cache.get_many(keys).values():
+            latest[user_id] = max(latest.get(user_id, 0), seen)
+        # 마지막 접속은 분 단위로 저장 (PRESENCE_TOUCH_INTERVAL보다 정밀할 필요 없음)
+        updated += save_last_seen(
+            {pk: from_timestamp(seen - seen % 60) for pk, seen in latest.items()}
+        )
+        cache.set(CURSOR_KEY, start + len(keys) - 1, timeout=None)
+        cache.delete_many(keys)
+        if progress:
+            progress(start + len(keys) - 1, end, len(latest))
+    return updated
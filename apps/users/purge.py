@@ -0,0 +1,293 @@
+"""
+탈퇴 계정 영구 삭제
+
+delete_account는 deleted_at만 기록하고(소프트 삭제), ACCOUNT_PURGE_RETENTION_DAYS가 지난 계정은
+purge_deleted_accounts 명령(cron/워커에서 주기 실행, 웹 요청과 무관)이 영구 삭제한다.
+
+Django의 QuerySet.delete()는 연관 객체를 모두 메모리에 올린 뒤 한 트랜잭션에서 지우므로,
+여기서는 User를 참조하는 모델을 자식부터 순서대로 훑는 삭제 계획(purge_plan)을 만들고
+단계마다 ACCOUNT_PURGE_BATCH_SIZE개씩 pk를 골라 raw DELETE 문으로 지운다.
+- 묶음마다 autocommit이라 잠금이 짧고, 메모리에는 pk 한 묶음만 올라간다
+- 진행 단계/삭제 수는 AccountPurge에 묶음마다 저장되어 중단된 작업은 같은 단계부터 이어서 실행된다
+- raw DELETE는 pre/post_delete 시그널을 보내지 않으므로 프로필 이미지 참조 해제와
+  내보내기 파일 삭제(FILE_STEPS)는 직접 처리한다
+"""
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connections, models, router
+from django.utils import timezone
+
+from apps.core.storage import get_export_storage, release_file
+
+from .exports import delete_export_files
+from .models import AccountPurge, DataExport, User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PurgeStep:
+    """user_id로 찾은 model 행을 삭제(또는 set_field를 value로 변경)하는 단계"""
+
+    model: type
+    lookup: str
+    set_field: str = ""
+    value: object = None  # callable이면 실행할 때 호출한 결과 (SET(callable))
+
+    @property
+    def label(self):
+        return self.model._meta.label
+
+    def run(self, user_id, batch_size):
+        """한 묶음 처리 후 처리한 행 수 반환 (batch_size보다 작으면 단계 완료)"""
+        manager = self.model._base_manager
+        pks = list(
+            manager.filter(**{self.lookup: user_id}).values_list("pk", flat=True)[
+                :batch_size
+            ]
+        )
+        if not pks:
+            return 0
+        if self.set_field:
+            value = self.value() if callable(self.value) else self.value
+            return manager.filter(pk__in=pks).update(**{self.set_field: value})
+        return raw_delete(self.model, pks)
+
+
+class UserPurgeStep(PurgeStep):
+    """마지막 단계: 사용자 행 삭제 후 프로필 이미지 참조 해제"""
+
+    def run(self, user_id, batch_size):
+        avatar = (
+            User.objects.filter(pk=user_id).values_list("avatar", flat=True).first()
+        )
+        deleted = raw_delete(User, [user_id])
+        if deleted and avatar:
+            release_file(avatar)
+        return deleted
+
+
+class ExportPurgeStep(PurgeStep):
+    """내보내기 파일을 지운 뒤 행 삭제 (탈퇴 시 삭제하지 못하고 남은 파일 정리)"""
+
+    def run(self, user_id, batch_size):
+        exports = list(
+            self.model._base_manager.filter(**{self.lookup: user_id})[:batch_size]
+        )
+        if not exports:
+            return 0
+        storage = get_export_storage()
+        for export in exports:
+            delete_export_files(export, storage)
+        return raw_delete(self.model, [export.pk for export in exports])
+
+
+# 행과 함께 저장소 파일도 지워야 하는 모델 -> 삭제 단계 클래스
+FILE_STEPS = {DataExport: ExportPurgeStep}
+
+
+def raw_delete(model, pks):
+    """시그널/연관 객체 수집 없이 pk 목록을 DELETE 문 하나로 삭제"""
+    connection = connections[router.db_for_write(model)]
+    quote = connection.ops.quote_name
+    placeholders = ", ".join(["%s"] * len(pks))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} "
+            f"WHERE {quote(model._meta.pk.column)} IN ({placeholders})",
+            pks,
+        )
+        return cursor.rowcount
+
+
+# DB가 직접 처리하는 on_delete (raw DELETE로도 동작)
+DB_ON_DELETE = (models.DB_CASCADE, models.DB_SET_NULL, models.DB_SET_DEFAULT)
+
+
+def set_value(on_delete):
+    """on_delete=SET(value)의 value (SET이 아니면 None)"""
+    deconstruct = getattr(on_delete, "deconstruct", None)
+    if deconstruct is None:
+        return None
+    path, args, _ = deconstruct()
+    return args if path == "django.db.models.SET" else None
+
+
+def collect_steps(model, path, steps, visited):
+    """
+    model을 참조하는 모델의 삭제 단계를 자식부터 추가
+    (CASCADE는 재귀, SET_NULL/SET_DEFAULT/SET()은 갱신, 처리할 수 없는 참조는 ValueError)
+    """
+    for relation in model._meta.get_fields(include_hidden=True):
+        if relation.concrete or not (relation.one_to_many or relation.one_to_one):
+            continue
+        related_model = relation.related_model
+        field = relation.field
+        lookup = f"{field.name}__{path}" if path else field.attname
+        on_delete = relation.on_delete
+
+        if on_delete is models.CASCADE:
+            if related_model in visited:
+                continue
+            collect_steps(related_model, lookup, steps, visited | {related_model})
+            step_class = FILE_STEPS.get(related_model, PurgeStep)
+            steps.append(step_class(related_model, lookup))
+        elif on_delete is models.SET_NULL:
+            steps.append(PurgeStep(related_model, lookup, set_field=field.attname))
+        elif on_delete is models.SET_DEFAULT:
+            steps.append(
+                PurgeStep(related_model, lookup, field.attname, field.get_default)
+            )
+        elif args := set_value(on_delete):
+            steps.append(PurgeStep(related_model, lookup, field.attname, args[0]))
+        elif on_delete in DB_ON_DELETE or (
+            on_delete is models.DO_NOTHING and not field.db_constraint
+        ):
+            continue
+        else:
+            # PROTECT/RESTRICT, 제약이 있는 DO_NOTHING 등은 사용자 행 DELETE가 실패함
+            raise ValueError(
+                f"{related_model._meta.label}.{field.name}이(가) 사용자 삭제를 막습니다."
+            )
+
+
+@lru_cache(maxsize=None)
+def purge_plan():
+    """사용자 한 명을 지우는 단계 목록 (마지막 단계가 사용자 행 삭제)"""
+    steps = []
+    collect_steps(User, "", steps, frozenset({User}))
+    steps.append(UserPurgeStep(User, "pk"))
+    return tuple(steps)
+
+
+def purgeable_users(retention_days=None):
+    """보관 기간이 지난 탈퇴 계정"""
+    if retention_days is None:
+        retention_days = settings.ACCOUNT_PURGE_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    return User.objects.deleted().filter(deleted_at__lt=cutoff)
+
+
+def schedule_purges(retention_days=None):
+    """보관 기간이 지난 탈퇴 계정의 삭제 작업 생성 (이미 있으면 무시)"""
+    user_ids = purgeable_users(retention_days).values_list("pk", flat=True)
+    created = 0
+    batch = []
+    for user_id in user_ids.iterator(chunk_size=1000):
+        batch.append(AccountPurge(user_id=user_id))
+        if len(batch) >= 1000:
+            created += len(
+                AccountPurge.objects.bulk_create(batch, ignore_conflicts=True)
+            )
+            batch = []
+    created += len(AccountPurge.objects.bulk_create(batch, ignore_conflicts=True))
+    return created
+
+
+def retryable_purges():
+    """아직 실행할 수 있는 작업 (미완료, 시도 횟수 남음)"""
+    return AccountPurge.objects.exclude(status=AccountPurge.STATUS_DONE).filter(
+        attempts__lt=settings.ACCOUNT_PURGE_MAX_ATTEMPTS
+    )
+
+
+def claim_purge(job_id):
+    """다른 워커가 실행 중이 아닌 작업을 점유 (점유 만료된 작업은 이어서 실행)"""
+    now = timezone.now()
+    claimed = (
+        retryable_purges()
+        .filter(pk=job_id)
+        .filter(models.Q(locked_until__isnull=True) | models.Q(locked_until__lt=now))
+        .update(
+            status=AccountPurge.STATUS_RUNNING,
+            locked_until=now + timedelta(seconds=settings.ACCOUNT_PURGE_LEASE_SECONDS),
+            attempts=models.F("attempts") + 1,
+            updated_at=now,
+        )
+    )
+    return AccountPurge.objects.get(pk=job_id) if claimed else None
+
+
+def run_purge(job, batch_size=None):
+    """작업을 저장된 단계부터 끝까지 실행 (묶음마다 진행 상황 저장)"""
+    batch_size = batch_size or settings.ACCOUNT_PURGE_BATCH_SIZE
+    lease = timedelta(seconds=settings.ACCOUNT_PURGE_LEASE_SECONDS)
+    plan = purge_plan()
+
+    while job.step < len(plan):
+        step = plan[job.step]
+        started = time.monotonic()
+        count = step.run(job.user_id, batch_size)
+
+        job.elapsed += time.monotonic() - started
+        if count:
+            job.rows_deleted += count
+            job.deleted[step.label] = job.deleted.get(step.label, 0) + count
+        if count < batch_size:
+            job.step += 1
+        job.locked_until = timezone.now() + lease
+        job.save(
+            update_fields=[
+                "step",
+                "rows_deleted",
+                "deleted",
+                "elapsed",
+                "locked_until",
+                "updated_at",
+            ]
+        )
+
+    job.status = AccountPurge.STATUS_DONE
+    job.locked_until = None
+    job.error = ""
+    job.finished_at = timezone.now()
+    job.save(
+        update_fields=["status", "locked_until", "error", "finished_at", "updated_at"]
+    )
+    return job
+
+
+def run_pending_purges(batch_size=None, limit=None):
+    """
+    대기/중단된 작업을 순서대로 실행하고 실행한 작업 목록 반환
+    시도 횟수가 적은 작업부터 실행해 계속 실패하는 작업이 limit을 차지하지 않게 한다
+    """
+    pending = retryable_purges().order_by("attempts", "pk").values_list("pk", flat=True)
+    if limit:
+        pending = pending[:limit]
+
+    finished = []
+    for job_id in list(pending):
+        job = claim_purge(job_id)
+        if job is None:
+            continue
+        try:
+            finished.append(run_purge(job, batch_size))
+        except Exception as exc:
+            logger.exception("계정 영구 삭제 실패: user_id=%s", job.user_id)
+            # 배포로 삭제 계획이 바뀌었을 수 있으므로 재시도는 처음 단계부터
+            # (완료된 단계는 빈 SELECT 한 번으로 지나간다)
+            AccountPurge.objects.filter(pk=job.pk).update(
+                status=AccountPurge.STATUS_FAILED,
+                step=0,
+                locked_until=None,
+                error=str(exc),
+                updated_at=timezone.now(),
+            )
+    return finished
+
+
+def purge_deleted_accounts(retention_days=None, batch_size=None, limit=None):
+    """보관 기간이 지난 탈퇴 계정을 영구 삭제하고 모델별 삭제 수 반환"""
+    schedule_purges(retention_days)
+    deleted = Counter()
+    for job in run_pending_purges(batch_size, limit):
+        deleted.update(job.deleted)
+    return deleted
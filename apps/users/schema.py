@@ -0,0 +1,11 @@
+"""
+OpenAPI 스키마 확장 (ENABLE_API_DOCS일 때만 import)
+"""
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class PresenceJWTScheme(SimpleJWTScheme):
+    """PresenceJWTAuthentication도 기존 JWT 인증 스킴(jwtAuth)으로 문서화"""
+
+    target_class = "apps.users.authentication.PresenceJWTAuthentication"
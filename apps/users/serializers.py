@@ -2,7 +2,26 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from .models import User, UserProfile
+from django.urls import reverse
+
+from apps.core.serializers import compile_serializer
+
+from .analytics import record_signup
+from .avatars import schedule_avatar_processing
+from .models import AuditEvent, DataExport, User, UserProfile
+from .uploads import StoredUploadedFile
+
+
+class AvatarField(serializers.ImageField):
+    """
+    프로필 이미지 필드
+    AvatarUploadHandler가 업로드 중 이미 검증/저장한 파일은 다시 읽지 않는다
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, StoredUploadedFile):
+            return serializers.FileField.to_internal_value(self, data)
+        return super().to_internal_value(data)
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -30,7 +49,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """이메일 중복 검사"""
-        if User.objects.filter(email=value).exists():
+        if User.objects.alive().filter(email=value).exists():
             raise serializers.ValidationError("이미 사용 중인 이메일입니다.")
         return value
 
@@ -61,6 +80,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         # 프로필 생성
         UserProfile.objects.create(user=user)
 
+        record_signup(user)
         return user
 
 
@@ -103,7 +123,13 @@ class UserProfileSerializer(serializers.ModelSerializer):
     사용자 프로필 시리얼라이저 (조회/수정용)
     """
 
+    avatar = AvatarField(
+        required=False,
+        allow_null=True,
+        validators=User._meta.get_field("avatar").validators,
+    )
     avatar_url = serializers.ReadOnlyField()
+    avatar_urls = serializers.ReadOnlyField()
     full_name = serializers.SerializerMethodField()
     is_social_user = serializers.SerializerMethodField()
 
@@ -131,6 +157,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "full_name",
             "avatar",
             "avatar_url",
+            "avatar_urls",
             "bio",
             "timezone",
             "theme",
@@ -169,11 +196,23 @@ class UserProfileSerializer(serializers.ModelSerializer):
         # 프로필 관련 데이터 분리
         profile_data = validated_data.pop("profile", {})
 
+        # 새 프로필 이미지는 썸네일이 생성될 때까지 원본 URL로 노출
+        avatar_changed = "avatar" in validated_data
+        if avatar_changed:
+            instance.avatar_hash = ""
+            if isinstance(validated_data["avatar"], StoredUploadedFile):
+                # 업로드 중 이미 스토리지에 저장됨 - 경로만 연결
+                validated_data["avatar"] = validated_data["avatar"].storage_name
+
         # 사용자 기본 정보 업데이트
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
 
+        # 썸네일 생성은 요청 스레드 밖에서 처리
+        if avatar_changed and instance.avatar:
+            schedule_avatar_processing(instance)
+
         # 프로필 정보 업데이트
         if profile_data:
             profile = instance.profile
@@ -191,10 +230,19 @@ class UserBasicSerializer(serializers.ModelSerializer):
 
     full_name = serializers.SerializerMethodField()
     avatar_url = serializers.ReadOnlyField()
+    avatar_urls = serializers.ReadOnlyField()
 
     class Meta:
         model = User
-        fields = ["id", "email", "first_name", "last_name", "full_name", "avatar_url"]
+        fields = [
+            "id",
+            "email",
+            "first_name",
+            "last_name",
+            "full_name",
+            "avatar_url",
+            "avatar_urls",
+        ]
 
     def get_full_name(self, obj):
         return obj.get_full_name()
@@ -278,3 +326,55 @@ class EmailVerificationSerializer(serializers.Serializer):
         token.save()
 
         return user
+
+
+class DataExportSerializer(serializers.ModelSerializer):
+    """
+    개인 데이터 내보내기 상태 시리얼라이저
+    """
+
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = DataExport
+        fields = [
+            "id",
+            "format",
+            "status",
+            "size",
+            "download_url",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = ["id", "status", "size", "created_at", "finished_at"]
+
+    def get_download_url(self, obj):
+        if obj.status != DataExport.STATUS_DONE:
+            return None
+        url = reverse("users:data_export_download", args=[obj.pk])
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+
+class AuditEventSerializer(serializers.ModelSerializer):
+    """
+    보안 감사 로그 시리얼라이저 (관리자 조회용)
+    """
+
+    class Meta:
+        model = AuditEvent
+        fields = [
+            "id",
+            "event",
+            "user_id",
+            "email",
+            "ip",
+            "user_agent",
+            "data",
+            "created_at",
+        ]
+
+
+# 응답용 컴파일된 시리얼라이저 (출력은 .data와 동일)
+user_basic_reader = compile_serializer(UserBasicSerializer)
+user_profile_reader = compile_serializer(UserProfileSerializer)
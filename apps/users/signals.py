@@ -0,0 +1,79 @@
+"""
+사용자 관련 시그널
+
+프로필 이미지는 내용 주소 기반 저장소에 여러 사용자가 공유할 수 있으므로
+참조 수(StoredFile)를 관리한다 (참조가 0이 된 원본과 썸네일은 gc_avatars가 정리).
+소셜 로그인 설정(SocialApp/Site)이 바뀌면 어댑터가 보관한 SocialApp 조회 결과를 무효화한다.
+응답을 보낸 뒤 버퍼에 모인 감사 로그와 가입/로그인 집계를 저장한다.
+"""
+
+from django.apps import apps
+from django.core.signals import request_finished, setting_changed
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.core.storage import acquire_file, release_file
+
+from . import analytics, audit
+from .models import User
+
+
+def stored_avatar_name(instance):
+    """deferred 필드를 로드하지 않고 현재 avatar 이름 반환 (로드되지 않았으면 None)"""
+    value = instance.__dict__.get("avatar")
+    return getattr(value, "name", value)
+
+
+@receiver(post_init, sender=User)
+def remember_avatar(sender, instance, **kwargs):
+    instance._loaded_avatar = stored_avatar_name(instance)
+
+
+@receiver(post_save, sender=User)
+def track_avatar_references(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and "avatar" not in update_fields:
+        return
+    if "avatar" not in instance.__dict__:
+        return
+
+    old = getattr(instance, "_loaded_avatar", None)
+    new = stored_avatar_name(instance)
+    if old == new:
+        return
+
+    if new:
+        acquire_file(new)
+    if old:
+        release_file(old)
+    instance._loaded_avatar = new
+
+
+@receiver(post_delete, sender=User)
+def release_avatar(sender, instance, **kwargs):
+    name = stored_avatar_name(instance)
+    if name:
+        release_file(name)
+
+
+request_finished.connect(audit.flush_if_due, dispatch_uid="users.audit.flush_if_due")
+request_finished.connect(
+    analytics.flush_if_due, dispatch_uid="users.analytics.flush_if_due"
+)
+
+
+if apps.is_installed("allauth.socialaccount"):
+    from allauth.socialaccount.models import SocialApp
+    from django.contrib.sites.models import Site
+
+    from .adapters import invalidate_social_config
+
+    @receiver([post_save, post_delete], sender=SocialApp)
+    @receiver([post_save, post_delete], sender=Site)
+    @receiver(m2m_changed, sender=SocialApp.sites.through)
+    def social_config_changed(sender, **kwargs):
+        invalidate_social_config()
+
+    @receiver(setting_changed)
+    def social_settings_changed(setting, **kwargs):
+        if setting in ("SOCIALACCOUNT_PROVIDERS", "SITE_ID"):
+            invalidate_social_config()
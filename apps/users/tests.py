@@ -1,3 +1,1135 @@
-from django.test import TestCase
+import datetime
+import io
+import json
+import os
+import tempfile
+import urllib.error
+import urllib.request
+import zipfile
+from unittest import mock
 
-# Create your tests here.
+from allauth.socialaccount.models import SocialAccount, SocialApp, SocialLogin
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import (
+    DataError,
+    IntegrityError,
+    OperationalError,
+    connection,
+    models,
+    transaction,
+)
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from django.utils import timezone
+from PIL import Image
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.core.models import StoredFile
+from apps.core.storage import get_avatar_storage, get_export_storage
+
+from .adapters import SocialAccountAdapter
+from .analytics import backfill_rollups, discard_rollups, flush_rollups
+from .audit import (
+    client_ip,
+    discard_events,
+    flush_events,
+    pending_events,
+    purge_audit_events,
+    record_event,
+)
+from .avatars import (
+    PublicRedirectHandler,
+    import_failure_key,
+    is_public_url,
+    schedule_avatar_import,
+)
+from .checks import check_presence_cache
+from .exports import (
+    EXPORT_SECTIONS,
+    delete_exports,
+    part_name,
+    process_export,
+    run_pending_exports,
+)
+from .models import (
+    AccountPurge,
+    AuditEvent,
+    DailyActiveUsers,
+    DailySignup,
+    DataExport,
+    EmailVerificationToken,
+    User,
+    UserProfile,
+)
+from .presence import (
+    CURSOR_KEY,
+    SEQUENCE_KEY,
+    compact_presence,
+    presence_cache,
+    reset_touches,
+)
+from .purge import (
+    collect_steps,
+    purge_deleted_accounts,
+    purge_plan,
+    run_pending_purges,
+)
+from .serializers import (
+    UserBasicSerializer,
+    UserProfileSerializer,
+    user_basic_reader,
+    user_profile_reader,
+)
+
+
+class AvatarStorageTests(TestCase):
+    """
+    내용 주소 기반 프로필 이미지 저장소: 참조 없는 원본은 유예 시간 후 정리
+    """
+
+    def setUp(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        override = self.settings(MEDIA_ROOT=location.name, AVATAR_PROCESS_ASYNC=False)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.user = User.objects.create_user(
+            email="avatar@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def image(self, color="red"):
+        data = io.BytesIO()
+        Image.new("RGB", (8, 8), color).save(data, "PNG")
+        data.seek(0)
+        data.name = "avatar.png"
+        return data
+
+    def stored_names(self):
+        storage = get_avatar_storage()
+        directories, _ = storage.listdir("avatars")
+        return {
+            f"avatars/{directory}/{filename}"
+            for directory in directories
+            if len(directory) == 2
+            for filename in storage.listdir(f"avatars/{directory}")[1]
+        }
+
+    def gc(self, **options):
+        call_command("gc_avatars", stdout=io.StringIO(), **options)
+
+    def age(self, name, hours):
+        path = get_avatar_storage().path(name)
+        stamp = os.path.getmtime(path) - hours * 3600
+        os.utime(path, (stamp, stamp))
+
+    def upload(self, color):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(
+                "/api/auth/profile/", {"avatar": self.image(color)}, format="multipart"
+            )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        return self.user.avatar.name
+
+    def expire(self, name):
+        StoredFile.objects.filter(name=name).update(
+            updated_at=timezone.now() - datetime.timedelta(hours=25)
+        )
+
+    def test_failed_request_blob_is_collected(self):
+        response = self.client.patch(
+            "/api/auth/profile/",
+            {"avatar": self.image(), "theme": "invalid"},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        [orphan] = self.stored_names()
+        self.assertEqual(StoredFile.objects.get(name=orphan).ref_count, 0)
+        current = self.upload("blue")
+
+        # 유예 시간 안에는 남겨두고, 지나면 참조되지 않은 원본만 삭제
+        self.gc()
+        self.assertEqual(self.stored_names(), {orphan, current})
+        self.expire(orphan)
+        self.expire(current)
+        self.gc()
+        self.assertEqual(self.stored_names(), {current})
+        self.assertFalse(StoredFile.objects.filter(name=orphan).exists())
+
+    def test_released_file_is_reused_within_grace(self):
+        name = self.upload("red")
+        self.client.patch("/api/auth/profile/", {"avatar": ""}, format="multipart")
+        self.assertEqual(StoredFile.objects.get(name=name).ref_count, 0)
+        self.assertIn(name, self.stored_names())
+
+        # 유예 시간이 지난 tombstone도 같은 내용이 다시 업로드되면 되살아남
+        self.expire(name)
+        self.assertEqual(self.upload("red"), name)
+        self.gc()
+        self.assertEqual(StoredFile.objects.get(name=name).ref_count, 1)
+        self.assertIn(name, self.stored_names())
+
+    def test_untracked_file_is_collected(self):
+        storage = get_avatar_storage()
+        name = storage.save("avatars/legacy.png", self.image())
+        StoredFile.objects.filter(name=name).delete()
+        self.age(name, 25)
+
+        # 참조 기록이 없는 파일은 tombstone을 만든 뒤 유예 시간 후 삭제
+        self.gc()
+        self.assertEqual(StoredFile.objects.get(name=name).ref_count, 0)
+        self.expire(name)
+        self.gc()
+        self.assertFalse(storage.exists(name))
+
+
+class CompiledSerializerTests(TestCase):
+    """
+    컴파일된 시리얼라이저 출력이 DRF 시리얼라이저 .data와 같은 JSON인지 확인
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.plain = User.objects.create_user(
+            email="plain@example.com", password="password123"
+        )
+        cls.full = User.objects.create_user(
+            email="full@example.com",
+            password="password123",
+            first_name="길동",
+            last_name="홍",
+            bio="소개",
+            avatar="avatars/ab/" + "ab" * 32 + ".jpg",
+            avatar_hash="ab" * 16,
+            social_provider="google",
+            social_id="1234",
+            is_email_verified=True,
+        )
+        UserProfile.objects.create(
+            user=cls.full,
+            phone_number="010-1234-5678",
+            birth_date=datetime.date(1990, 1, 1),
+            push_notifications=False,
+        )
+
+    def assertSameJSON(self, expected, actual):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(expected), renderer.render(actual))
+
+    def test_basic_serializer(self):
+        for user in (self.plain, self.full):
+            with self.subTest(user=user.email):
+                self.assertSameJSON(
+                    UserBasicSerializer(user).data, user_basic_reader.serialize(user)
+                )
+
+    def test_profile_serializer(self):
+        for user in User.objects.select_related("profile"):
+            with self.subTest(user=user.email):
+                self.assertSameJSON(
+                    UserProfileSerializer(user).data,
+                    user_profile_reader.serialize(user),
+                )
+
+    def test_profile_serializer_with_request(self):
+        # avatar는 request가 있으면 절대 URL
+        request = RequestFactory().get("/api/auth/profile/")
+        context = {"request": request}
+        self.assertSameJSON(
+            UserProfileSerializer(self.full, context=context).data,
+            user_profile_reader.serialize(self.full, context=context),
+        )
+
+    def test_many(self):
+        users = list(User.objects.order_by("email"))
+        self.assertSameJSON(
+            UserBasicSerializer(users, many=True).data,
+            user_basic_reader.serialize(users, many=True),
+        )
+        self.assertSameJSON(
+            UserProfileSerializer(User.objects.all(), many=True).data,
+            user_profile_reader.serialize(User.objects.all(), many=True),
+        )
+
+
+class ConditionalRequestTests(TestCase):
+    """
+    프로필/인증 상태 API의 ETag 조건부 요청
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="etag@example.com", password="password123"
+        )
+        UserProfile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_profile_not_modified(self):
+        response = self.client.get("/api/auth/profile/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        etag = response["ETag"]
+
+        # 304는 프로필 조회 외에 직렬화/추가 쿼리 없음
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/auth/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_profile_etag_changes_on_update(self):
+        etag = self.client.get("/api/auth/profile/")["ETag"]
+        self.client.patch(
+            "/api/auth/profile/", {"phone_number": "010-0000-0000"}, format="json"
+        )
+
+        response = self.client.get("/api/auth/profile/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["data"]["phone_number"], "010-0000-0000")
+
+    def test_profile_etag_depends_on_host(self):
+        # 응답의 프로필 이미지 URL이 호스트마다 다름
+        etag = self.client.get("/api/auth/profile/")["ETag"]
+        with self.settings(ALLOWED_HOSTS=["testserver", "other.example.com"]):
+            response = self.client.get(
+                "/api/auth/profile/",
+                HTTP_IF_NONE_MATCH=etag,
+                HTTP_HOST="other.example.com",
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_auth_status_not_modified(self):
+        response = self.client.get("/api/auth/status/")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(
+            "/api/auth/status/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # 로그아웃 상태는 다른 ETag
+        self.client.force_authenticate(None)
+        response = self.client.get(
+            "/api/auth/status/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data["data"]["is_authenticated"])
+
+
+class SocialIdentityTests(TestCase):
+    """
+    (social_provider, social_id) 인덱스 조회와 allauth 어댑터 연결
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="social@example.com",
+            password="password123",
+            social_provider="kakao",
+            social_id="42",
+        )
+        UserProfile.objects.create(user=cls.user)
+
+    def test_lookup_joins_profile(self):
+        with self.assertNumQueries(1):
+            user = User.objects.get_by_social_identity("kakao", "42")
+            self.assertEqual(user.profile.user_id, self.user.pk)
+        self.assertIsNone(User.objects.get_by_social_identity("naver", "42"))
+        self.assertIsNone(User.objects.get_by_social_identity("kakao", None))
+
+    def test_identity_is_unique(self):
+        # 소셜 ID가 없는 사용자는 제약 대상이 아님
+        User.objects.create_user(email="a@example.com", password="password123")
+        User.objects.create_user(email="b@example.com", password="password123")
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(
+                email="dup@example.com",
+                password="password123",
+                social_provider="kakao",
+                social_id="42",
+            )
+
+    def test_failed_avatar_url_is_skipped(self):
+        url = "https://8.8.8.8/missing.png"
+        self.addCleanup(cache.delete, import_failure_key(url))
+        with (
+            self.settings(AVATAR_PROCESS_ASYNC=False),
+            mock.patch(
+                "apps.users.avatars.download_avatar", return_value=(None, None)
+            ) as download,
+        ):
+            # 로그인할 때마다 예약되지만 실패한 URL은 다시 받지 않음
+            for _ in range(2):
+                with self.captureOnCommitCallbacks(execute=True):
+                    schedule_avatar_import(self.user, url)
+        download.assert_called_once_with(url)
+
+    def test_avatar_downloads_stay_public(self):
+        self.assertTrue(is_public_url("https://8.8.8.8/avatar.png"))
+        for url in (
+            "file:///etc/passwd",
+            "http://127.0.0.1/avatar.png",
+            "http://10.0.0.1/avatar.png",
+            "http://[::1]/avatar.png",
+        ):
+            self.assertFalse(is_public_url(url), url)
+
+        # 공인 주소에서 내부 주소로 리다이렉트하면 따라가지 않음
+        request = urllib.request.Request("https://8.8.8.8/avatar.png")
+        with self.assertRaises(urllib.error.HTTPError):
+            PublicRedirectHandler().redirect_request(
+                request, io.BytesIO(), 302, "Found", {}, "http://169.254.169.254/"
+            )
+
+    def test_adapter_connects_existing_user(self):
+        sociallogin = SocialLogin(
+            account=SocialAccount(provider="kakao", uid="42"),
+            user=User(email="other@example.com"),
+        )
+        SocialAccountAdapter().pre_social_login(None, sociallogin)
+
+        self.assertEqual(sociallogin.user, self.user)
+        self.assertTrue(sociallogin.is_existing)
+        self.assertTrue(
+            SocialAccount.objects.filter(user=self.user, provider="kakao").exists()
+        )
+
+    def test_sync_skips_unchanged(self):
+        account = SocialAccount(provider="kakao", uid="42")
+        adapter = SocialAccountAdapter()
+        self.assertEqual(adapter.sync_user(self.user, account), [])
+        # SocialApp 조회도 보관된 결과 사용
+        with self.assertNumQueries(0):
+            self.assertEqual(adapter.sync_user(self.user, account), [])
+
+        # 다른 제공자로 로그인해도 처음 기록한 소셜 ID를 덮어쓰지 않음
+        other = SocialAccount(provider="naver", uid="7")
+        self.assertEqual(adapter.sync_user(self.user, other), [])
+        self.assertEqual(User.objects.get_by_social_identity("kakao", "42"), self.user)
+
+        # 소셜 ID가 없는 사용자는 처음 로그인한 제공자로 채움
+        plain = User.objects.create_user(email="plain@example.com", password="x")
+        self.assertEqual(
+            adapter.sync_user(plain, other), ["social_provider", "social_id"]
+        )
+        self.assertEqual(User.objects.get_by_social_identity("naver", "7"), plain)
+
+    def test_apps_are_memoized_until_config_changes(self):
+        adapter = SocialAccountAdapter()
+        request = RequestFactory().get("/api/auth/social/kakao/login/")
+        adapter.list_apps(request, provider="kakao")
+        with self.assertNumQueries(0):
+            apps = adapter.list_apps(request, provider="kakao")
+        self.assertEqual([app.provider for app in apps], ["kakao"])
+
+        app = SocialApp.objects.create(provider="kakao", name="kakao-db")
+        app.sites.add(settings.SITE_ID)
+        apps = adapter.list_apps(request, provider="kakao")
+        self.assertIn("kakao-db", [app.name for app in apps])
+
+
+class AccountDeletionTests(TestCase):
+    """
+    탈퇴(deleted_at) 계정은 이메일 유니크/로그인 대상에서 빠지고, 보관 기간 후 영구 삭제
+    """
+
+    def setUp(self):
+        self.addCleanup(discard_events)
+        self.user = User.objects.create_user(
+            email="leaving@example.com", password="password123"
+        )
+        UserProfile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def delete_account(self):
+        response = self.client.delete(
+            "/api/auth/delete-account/", {"password": "password123"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+
+    def test_email_is_reusable(self):
+        SocialAccount.objects.create(user=self.user, provider="kakao", uid="leaving")
+        self.delete_account()
+        # 소셜 계정 연결도 해제되어 같은 소셜 계정으로 다시 가입할 수 있음
+        self.assertFalse(SocialAccount.objects.filter(uid="leaving").exists())
+        self.assertEqual(self.user.email, "leaving@example.com")
+        self.assertTrue(self.user.is_deleted)
+
+        client = APIClient()
+        response = client.post(
+            "/api/auth/check-email/", {"email": "leaving@example.com"}, format="json"
+        )
+        self.assertTrue(response.data["data"]["is_available"])
+        response = client.post(
+            "/api/auth/login/",
+            {"email": "leaving@example.com", "password": "password123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+        new_user = User.objects.create_user(
+            email="leaving@example.com", password="password456"
+        )
+        self.assertEqual(
+            User.objects.get_by_natural_key("leaving@example.com"), new_user
+        )
+
+    def test_purge_after_retention(self):
+        EmailVerificationToken.objects.create(
+            user=self.user,
+            email=self.user.email,
+            expires_at=self.user.created_at,
+        )
+        self.delete_account()
+
+        # 보관 기간 안에는 유지
+        self.assertEqual(purge_deleted_accounts(retention_days=30), {})
+        User.objects.filter(pk=self.user.pk).update(
+            deleted_at=self.user.deleted_at - datetime.timedelta(days=31)
+        )
+        deleted = purge_deleted_accounts(retention_days=30, batch_size=1)
+
+        self.assertEqual(deleted["users.User"], 1)
+        self.assertEqual(deleted["users.EmailVerificationToken"], 1)
+        self.assertEqual(deleted["users.UserProfile"], 1)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_purge_resumes_in_chunks(self):
+        for _ in range(5):
+            EmailVerificationToken.objects.create(
+                user=self.user, email=self.user.email, expires_at=self.user.created_at
+            )
+        self.delete_account()
+
+        # 토큰 단계에서 한 묶음(2개)을 지운 뒤 워커가 중단된 작업 (점유 만료)
+        plan = purge_plan()
+        step = [s.label for s in plan].index("users.EmailVerificationToken")
+        for done in plan[:step]:
+            done.run(self.user.pk, 1000)
+        plan[step].run(self.user.pk, 2)
+        job = AccountPurge.objects.create(
+            user_id=self.user.pk,
+            status=AccountPurge.STATUS_RUNNING,
+            step=step,
+            rows_deleted=2,
+            deleted={"users.EmailVerificationToken": 2},
+            locked_until=self.user.deleted_at,
+        )
+
+        (finished,) = run_pending_purges(batch_size=2)
+        job.refresh_from_db()
+        self.assertEqual(finished.pk, job.pk)
+        self.assertEqual(job.status, AccountPurge.STATUS_DONE)
+        self.assertEqual(job.deleted["users.EmailVerificationToken"], 5)
+        self.assertEqual(job.deleted["users.User"], 1)
+        self.assertEqual(job.rows_deleted, 6)
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+
+    def test_failing_purges_are_capped(self):
+        other = User.objects.create_user(email="next@example.com", password="x")
+        failing = AccountPurge.objects.create(user_id=self.user.pk)
+        job = AccountPurge.objects.create(user_id=other.pk)
+
+        def run_purge(job, batch_size):
+            if job.user_id == self.user.pk:
+                raise IntegrityError("foreign key")
+            job.status = AccountPurge.STATUS_DONE
+            job.save(update_fields=["status"])
+            return job
+
+        with (
+            self.settings(ACCOUNT_PURGE_MAX_ATTEMPTS=2),
+            mock.patch("apps.users.purge.run_purge", side_effect=run_purge),
+            self.assertLogs("apps.users.purge", "ERROR"),
+        ):
+            self.assertEqual(run_pending_purges(limit=1), [])
+            # 실패한 작업이 limit을 차지하지 않고 다음 작업이 먼저 실행됨
+            self.assertEqual(run_pending_purges(limit=1), [job])
+            self.assertEqual(run_pending_purges(), [])
+            # 시도 횟수를 다 쓴 작업은 더 이상 실행하지 않음
+            with mock.patch("apps.users.purge.claim_purge") as claim:
+                self.assertEqual(run_pending_purges(), [])
+            claim.assert_not_called()
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, AccountPurge.STATUS_FAILED)
+        self.assertEqual(failing.attempts, 2)
+
+    @isolate_apps("apps.users")
+    def test_plan_handles_every_on_delete(self):
+        class Owner(models.Model):
+            pass
+
+        class Defaulted(models.Model):
+            owner = models.ForeignKey(
+                Owner, models.SET_DEFAULT, null=True, default=None
+            )
+
+        class Replaced(models.Model):
+            owner = models.ForeignKey(Owner, models.SET(lambda: 7))
+
+        class Unconstrained(models.Model):
+            owner = models.ForeignKey(Owner, models.DO_NOTHING, db_constraint=False)
+
+        steps = []
+        collect_steps(Owner, "", steps, frozenset({Owner}))
+        self.assertEqual(
+            [(step.model, step.set_field) for step in steps],
+            [(Defaulted, "owner_id"), (Replaced, "owner_id")],
+        )
+        self.assertEqual(steps[1].value(), 7)
+
+        class Blocking(models.Model):
+            owner = models.ForeignKey(Owner, models.DO_NOTHING)
+
+        with self.assertRaises(ValueError):
+            collect_steps(Owner, "", [], frozenset({Owner}))
+
+
+class DataExportTests(TestCase):
+    """
+    개인 데이터 내보내기: 섹션별 스트리밍 저장, 중단 후 이어서 실행, Range 다운로드
+    """
+
+    def setUp(self):
+        location = tempfile.TemporaryDirectory()
+        self.addCleanup(location.cleanup)
+        storages = {
+            **settings.STORAGES,
+            "exports": {
+                "BACKEND": "django.core.files.storage.FileSystemStorage",
+                "OPTIONS": {"location": location.name},
+            },
+        }
+        override = self.settings(STORAGES=storages, DATA_EXPORT_ASYNC=False)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.addCleanup(discard_events)
+
+        self.user = User.objects.create_user(
+            email="export@example.com", password="password123"
+        )
+        User.objects.filter(pk=self.user.pk).update(last_login_ip="10.0.0.1")
+        UserProfile.objects.create(user=self.user, phone_number="010-0000-0000")
+        for _ in range(3):
+            EmailVerificationToken.objects.create(
+                user=self.user, email=self.user.email, expires_at=self.user.created_at
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def request_export(self, export_format):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/api/auth/export/", {"format": export_format}, format="json"
+            )
+        self.assertEqual(response.status_code, 202)
+        return DataExport.objects.get(pk=response.json()["data"]["id"])
+
+    def download(self, export, **headers):
+        return self.client.get(f"/api/auth/export/{export.pk}/download/", **headers)
+
+    def test_zip_export(self):
+        export = self.request_export("zip")
+        self.assertEqual(export.status, DataExport.STATUS_DONE)
+
+        response = self.download(export)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(export.filename, response["Content-Disposition"])
+        content = b"".join(response.streaming_content)
+        self.assertEqual(len(content), export.size)
+
+        archive = zipfile.ZipFile(io.BytesIO(content))
+        account = json.loads(archive.read("account.json"))
+        profile = json.loads(archive.read("profile.json"))
+        verifications = json.loads(archive.read("email_verifications.json"))
+        self.assertEqual(account["email"], "export@example.com")
+        self.assertEqual(account["last_login_ip"], "10.0.0.1")
+        self.assertEqual(profile["phone_number"], "010-0000-0000")
+        self.assertEqual(len(verifications), 3)
+        self.assertNotIn("token", verifications[0])
+
+        # 다른 사용자는 받을 수 없음
+        other = User.objects.create_user(email="other@example.com", password="x")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.download(export).status_code, 404)
+
+    def test_resume_skips_completed_sections(self):
+        # account 섹션까지 저장한 뒤 워커가 중단된 작업
+        export = DataExport.objects.create(
+            user=self.user,
+            format=DataExport.FORMAT_JSON,
+            status=DataExport.STATUS_RUNNING,
+            completed_sections=["account"],
+            locked_until=self.user.created_at,
+        )
+        storage = get_export_storage()
+        storage.save(part_name(export, "account"), io.BytesIO(b'{"resumed": true}'))
+
+        process_export(export.pk)
+        export.refresh_from_db()
+        self.assertEqual(export.status, DataExport.STATUS_DONE)
+        self.assertEqual(
+            export.completed_sections, [name for name, _, _ in EXPORT_SECTIONS]
+        )
+        with storage.open(export.file, "rb") as f:
+            document = json.load(f)
+        self.assertEqual(document["account"], {"resumed": True})
+        self.assertEqual(len(document["email_verifications"]), 3)
+        self.assertFalse(storage.exists(part_name(export, "account")))
+
+    def test_range_download_and_delete(self):
+        export = self.request_export("json")
+        with get_export_storage().open(export.file, "rb") as f:
+            content = f.read()
+
+        response = self.download(export, HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 10-19/{len(content)}")
+        self.assertEqual(b"".join(response.streaming_content), content[10:20])
+
+        response = self.download(export, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        # 탈퇴하면 내보내기 파일도 바로 삭제
+        self.client.delete(
+            "/api/auth/delete-account/", {"password": "password123"}, format="json"
+        )
+        self.assertFalse(get_export_storage().exists(export.file))
+        self.assertFalse(DataExport.objects.filter(pk=export.pk).exists())
+
+    def test_account_deleted_while_running(self):
+        # 섹션을 쓰는 도중 탈퇴해서 작업 행이 삭제됨
+        export = DataExport.objects.create(user=self.user)
+
+        def delete_account(user_id):
+            User.objects.filter(pk=user_id).update(deleted_at=timezone.now())
+            delete_exports(DataExport.objects.filter(pk=export.pk))
+            return []
+
+        sections = [*EXPORT_SECTIONS[:2], ("deleted", delete_account, True)]
+        with mock.patch("apps.users.exports.EXPORT_SECTIONS", sections):
+            self.assertIsNone(process_export(export.pk))
+
+        # 이미 쓴 중간 파일도 남지 않음
+        self.assertEqual(get_export_storage().listdir("")[1], [])
+
+    def test_retries_are_capped(self):
+        export = DataExport.objects.create(user=self.user)
+        with (
+            self.settings(DATA_EXPORT_MAX_ATTEMPTS=2),
+            mock.patch("apps.users.exports.save_stream", side_effect=OSError("full")),
+        ):
+            for _ in range(3):
+                self.assertEqual(run_pending_exports(), [])
+        export.refresh_from_db()
+        self.assertEqual(export.status, DataExport.STATUS_FAILED)
+        self.assertEqual(export.attempts, 2)
+
+        # 탈퇴한 사용자의 작업은 실행하지 않음
+        pending = DataExport.objects.create(user=self.user)
+        User.objects.filter(pk=self.user.pk).update(deleted_at=timezone.now())
+        self.assertEqual(run_pending_exports(), [])
+        pending.refresh_from_db()
+        self.assertEqual(pending.attempts, 0)
+
+    def test_purge_deletes_export_files(self):
+        export = self.request_export("zip")
+        self.assertTrue(get_export_storage().exists(export.file))
+
+        # 탈퇴 시 삭제하지 못한 파일은 영구 삭제 단계에서 지움
+        User.objects.filter(pk=self.user.pk).update(
+            is_active=False, deleted_at=timezone.now() - datetime.timedelta(days=31)
+        )
+        deleted = purge_deleted_accounts(retention_days=30)
+        self.assertEqual(deleted["users.DataExport"], 1)
+        self.assertFalse(get_export_storage().exists(export.file))
+
+
+class AuditEventTests(TestCase):
+    """
+    보안 감사 로그: 요청 중에는 버퍼에만 쌓고 모아서 저장, 추가 전용, 월 단위 보관
+    """
+
+    def setUp(self):
+        discard_events()
+        self.addCleanup(discard_events)
+        self.user = User.objects.create_user(
+            email="audit@example.com", password="password123"
+        )
+        self.client = APIClient(REMOTE_ADDR="10.0.0.7")
+
+    def login(self, password):
+        return self.client.post(
+            "/api/auth/login/",
+            {"email": "audit@example.com", "password": password},
+            format="json",
+        )
+
+    def test_events_are_buffered_then_flushed(self):
+        override = self.settings(AUDIT_LOG_BATCH_SIZE=4, AUDIT_LOG_FLUSH_INTERVAL=3600)
+        override.enable()
+        self.addCleanup(override.disable)
+        flush_events()
+
+        self.assertEqual(self.login("wrong-password").status_code, 400)
+        self.assertEqual(self.login("password123").status_code, 200)
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            "/api/auth/password/change/",
+            {
+                "current_password": "password123",
+                "new_password": "newpassword456",
+                "new_password_confirm": "newpassword456",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+        # 요청 중에는 INSERT 없이 버퍼에만 쌓임
+        self.assertEqual(pending_events(), 3)
+        self.assertFalse(AuditEvent.objects.exists())
+
+        # AUDIT_LOG_BATCH_SIZE만큼 모이면 응답 후 한 번에 저장
+        response = self.client.post("/api/auth/email/resend/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(pending_events(), 0)
+
+        self.assertEqual(
+            list(AuditEvent.objects.for_user(self.user.pk).values_list("event")),
+            [
+                (AuditEvent.EMAIL_RESEND,),
+                (AuditEvent.PASSWORD_CHANGE,),
+                (AuditEvent.LOGIN,),
+            ],
+        )
+        failed = AuditEvent.objects.from_ip("10.0.0.7").last()
+        self.assertEqual(failed.event, AuditEvent.LOGIN_FAILED)
+        self.assertEqual(failed.email, "audit@example.com")
+        self.assertIsNone(failed.user_id)
+        self.assertEqual(failed.month, failed.created_at.date().replace(day=1))
+
+    def test_non_object_login_body(self):
+        response = self.client.post("/api/auth/login/", [1], format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_client_ip(self):
+        request = RequestFactory().get(
+            "/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="1.1.1.1, 2.2.2.2"
+        )
+        # 프록시를 설정하지 않으면 X-Forwarded-For를 믿지 않음
+        self.assertEqual(client_ip(request), "10.0.0.1")
+        with self.settings(TRUSTED_PROXY_COUNT=1):
+            self.assertEqual(client_ip(request), "2.2.2.2")
+        with self.settings(TRUSTED_PROXY_COUNT=2):
+            self.assertEqual(client_ip(request), "1.1.1.1")
+        with self.settings(TRUSTED_PROXY_COUNT=1):
+            request.META["HTTP_X_FORWARDED_FOR"] = "x"
+            self.assertIsNone(client_ip(request))
+
+    def test_rejected_events_are_dropped(self):
+        bulk_create = AuditEvent.objects.bulk_create
+
+        def reject_invalid(events):
+            # PostgreSQL/MySQL에서 잘못된 값이 섞인 INSERT는 실패
+            if any(event.email == "invalid" for event in events):
+                raise DataError("invalid input")
+            return bulk_create(events)
+
+        record_event(AuditEvent.LOGIN_FAILED, email="first@example.com")
+        record_event(AuditEvent.LOGIN_FAILED, email="invalid")
+        record_event(AuditEvent.LOGIN_FAILED, email="last@example.com")
+        with (
+            mock.patch.object(
+                AuditEvent.objects, "bulk_create", side_effect=reject_invalid
+            ),
+            self.assertLogs("apps.users.audit", "WARNING") as logs,
+        ):
+            self.assertEqual(flush_events(), 2)
+        self.assertEqual(pending_events(), 0)
+        self.assertIn("1건을 버렸습니다", logs.output[-1])
+        self.assertEqual(
+            sorted(AuditEvent.objects.values_list("email", flat=True)),
+            ["first@example.com", "last@example.com"],
+        )
+
+        # DB 장애는 다음 저장에서 다시 시도
+        record_event(AuditEvent.LOGIN_FAILED, email="retry@example.com")
+        with mock.patch.object(
+            AuditEvent.objects, "bulk_create", side_effect=OperationalError
+        ):
+            with self.assertRaises(OperationalError):
+                flush_events()
+        self.assertEqual(pending_events(), 1)
+
+    def test_append_only_and_retention(self):
+        now = timezone.now()
+        old = now - datetime.timedelta(days=500)
+        AuditEvent.objects.bulk_create(
+            [
+                AuditEvent(
+                    month=created_at.date().replace(day=1),
+                    created_at=created_at,
+                    event=AuditEvent.LOGIN,
+                    user_id=self.user.pk,
+                )
+                for created_at in (old, old, now)
+            ]
+        )
+        event = AuditEvent.objects.for_user(self.user.pk).first()
+        with self.assertRaises(TypeError):
+            event.save()
+        with self.assertRaises(TypeError):
+            AuditEvent.objects.all().delete()
+
+        deleted = purge_audit_events(months=12)
+        self.assertEqual(deleted, {old.date().replace(day=1): 2})
+        self.assertEqual(
+            list(AuditEvent.objects.values_list("pk", flat=True)), [event.pk]
+        )
+
+    def test_query_api_is_admin_only(self):
+        record = AuditEvent(
+            month=timezone.now().date().replace(day=1),
+            created_at=timezone.now(),
+            event=AuditEvent.LOGIN,
+            user_id=self.user.pk,
+            ip="10.0.0.7",
+        )
+        record.save()
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(
+            self.client.get("/api/auth/audit/?ip=10.0.0.7").status_code, 403
+        )
+
+        admin = User.objects.create_superuser(
+            email="admin@example.com", password="password123"
+        )
+        self.client.force_authenticate(admin)
+        response = self.client.get(f"/api/auth/audit/?user={self.user.pk}")
+        self.assertEqual(response.status_code, 200)
+        (event,) = response.json()["data"]["events"]
+        self.assertEqual(event["ip"], "10.0.0.7")
+        self.assertEqual(self.client.get("/api/auth/audit/").status_code, 400)
+
+
+class LoginRollupTests(TestCase):
+    """
+    가입/로그인 집계: 요청 중에는 프로세스 내에서만 세고, 저장/백필 결과가 같아야 함
+    """
+
+    def setUp(self):
+        discard_rollups()
+        discard_events()
+        self.addCleanup(discard_rollups)
+        self.addCleanup(discard_events)
+        override = self.settings(ANALYTICS_FLUSH_INTERVAL=3600)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.client = APIClient()
+
+    def register_and_login(self, email, language):
+        response = self.client.post(
+            "/api/auth/register/",
+            {
+                "email": email,
+                "password": "rollup-pass-9472",
+                "password_confirm": "rollup-pass-9472",
+                "first_name": "집계",
+                "last_name": "김",
+                "language": language,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        for _ in range(2):
+            response = self.client.post(
+                "/api/auth/login/",
+                {"email": email, "password": "rollup-pass-9472"},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 200)
+
+    def test_rollups_and_backfill(self):
+        self.register_and_login("ko@example.com", "ko")
+        self.register_and_login("en@example.com", "en")
+        self.assertFalse(DailySignup.objects.exists())
+        flush_rollups()
+        flush_events()
+
+        today = timezone.localdate()
+        self.assertEqual(
+            set(DailySignup.objects.values_list("date", "language", "count")),
+            {(today, "ko", 1), (today, "en", 1)},
+        )
+        dau = DailyActiveUsers.objects.get(date=today)
+        self.assertEqual(dau.logins, 4)
+        live_sketch = bytes(dau.sketch)
+
+        # 집계를 지우고 users/감사 로그로 다시 채워도 같은 결과
+        DailySignup.objects.all().delete()
+        DailyActiveUsers.objects.all().delete()
+        for _ in range(2):
+            backfill_rollups(chunk_size=1)
+        self.assertEqual(
+            set(DailySignup.objects.values_list("date", "language", "count")),
+            {(today, "ko", 1), (today, "en", 1)},
+        )
+        dau = DailyActiveUsers.objects.get(date=today)
+        self.assertEqual((bytes(dau.sketch), dau.logins), (live_sketch, 4))
+
+        admin = User.objects.create_superuser(
+            email="admin@example.com", password="password123"
+        )
+        self.client.force_authenticate(admin)
+        response = self.client.get("/api/auth/stats/?days=7")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()["data"]
+        self.assertEqual(data["active_users"], 2)
+        self.assertEqual(data["daily_active_users"][0]["users"], 2)
+        self.assertEqual(sum(row["count"] for row in data["signups"]), 2)
+
+    def test_backfill_keeps_purged_signups(self):
+        self.register_and_login("ko@example.com", "ko")
+        self.register_and_login("gone@example.com", "ko")
+        flush_rollups()
+
+        # 영구 삭제된 계정은 users에 없으므로 다시 세면 1명이지만 기존 집계는 유지
+        User.objects.filter(email="gone@example.com").delete()
+        backfill_rollups()
+        self.assertEqual(
+            DailySignup.objects.get(date=timezone.localdate(), language="ko").count, 2
+        )
+
+
+class PresenceTests(TestCase):
+    """
+    접속 상태: 요청은 캐시에만 기록(간격 내 중복 없음), 조회 API, users.last_seen 묶음 반영
+    """
+
+    def setUp(self):
+        # 운영 구성(CACHE_URL의 Redis)처럼 DB 밖의 공유 캐시 사용
+        override = self.settings(PRESENCE_CACHE="shared")
+        override.enable()
+        self.addCleanup(override.disable)
+        presence_cache().clear()
+        reset_touches()
+        self.addCleanup(presence_cache().clear)
+        self.addCleanup(reset_touches)
+        self.user = User.objects.create_user(
+            email="online@example.com", password="password123"
+        )
+        self.other = User.objects.create_user(
+            email="away@example.com", password="password123"
+        )
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}"
+        )
+        self.ids = f"{self.user.pk},{self.other.pk}"
+
+    def test_process_local_cache_check(self):
+        # CACHE_URL이 없으면 shared는 프로세스 내 캐시
+        (warning,) = check_presence_cache(None)
+        self.assertEqual(warning.id, "users.W001")
+        # 기본 설정은 DB 캐시 (프로세스 간 공유)
+        with self.settings(PRESENCE_CACHE="presence"):
+            self.assertEqual(check_presence_cache(None), [])
+
+        caches = {
+            **settings.CACHES,
+            "files": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.gettempdir(),
+            },
+        }
+        with self.settings(CACHES=caches, PRESENCE_CACHE="files"):
+            self.assertEqual(check_presence_cache(None), [])
+        with self.settings(PRESENCE_CACHE="missing"):
+            (error,) = check_presence_cache(None)
+            self.assertEqual(error.id, "users.E001")
+
+    def test_default_db_cache(self):
+        with self.settings(PRESENCE_CACHE="presence"):
+            self.assertEqual(settings.CACHES["presence"]["LOCATION"], "presence_cache")
+            response = self.client.get("/api/auth/presence/", {"ids": self.ids})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(compact_presence(), 1)
+        self.user.refresh_from_db()
+        self.assertIsNotNone(self.user.last_seen)
+
+    def test_cursor_reset_after_cache_flush(self):
+        self.client.get("/api/auth/presence/", {"ids": self.ids})
+        compact_presence()
+        # 번호만 사라지고 처리 위치는 남은 경우 (키 만료, 일부 초기화)
+        presence_cache().set(CURSOR_KEY, 1000, timeout=None)
+        presence_cache().delete(SEQUENCE_KEY)
+        User.objects.update(last_seen=None)
+        reset_touches()
+        self.client.get("/api/auth/presence/", {"ids": self.ids})
+        self.assertEqual(compact_presence(), 1)
+
+    def test_out_of_range_ids(self):
+        for ids in ("99999999999999999999999", "0", "-1", f"{self.user.pk},-5"):
+            response = self.client.get("/api/auth/presence/", {"ids": ids})
+            self.assertEqual(response.status_code, 400)
+
+    def test_presence_is_recorded_without_db_writes(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/auth/presence/", {"ids": self.ids})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            all(query["sql"].startswith("SELECT") for query in queries.captured_queries)
+        )
+        presence = {item["id"]: item for item in response.data["data"]}
+        self.assertTrue(presence[self.user.pk]["online"])
+        self.assertEqual(
+            presence[self.other.pk],
+            {"id": self.other.pk, "online": False, "last_seen": None},
+        )
+
+        # PRESENCE_TOUCH_INTERVAL 안의 요청은 캐시에도 다시 쓰지 않음
+        self.client.get("/api/auth/presence/", {"ids": self.ids})
+        self.assertEqual(presence_cache().get(SEQUENCE_KEY), 1)
+
+        # 묶음 반영은 새 기록이 있을 때만 users를 갱신
+        updated_at = self.user.updated_at
+        self.assertEqual(compact_presence(), 1)
+        self.assertEqual(compact_presence(), 0)
+        self.user.refresh_from_db()
+        self.assertEqual(
+            self.user.last_seen,
+            presence[self.user.pk]["last_seen"].replace(second=0, microsecond=0),
+        )
+        self.assertEqual(self.user.updated_at, updated_at)
+
+        # 캐시가 비어도 users.last_seen으로 조회 (오래됐으면 접속 중 아님)
+        an_hour_ago = timezone.now() - datetime.timedelta(hours=1)
+        User.objects.filter(pk=self.user.pk).update(last_seen=an_hour_ago)
+        presence_cache().clear()
+        client = APIClient()
+        client.force_authenticate(self.other)
+        response = client.get("/api/auth/presence/", {"ids": str(self.user.pk)})
+        self.assertEqual(
+            response.data["data"],
+            [{"id": self.user.pk, "online": False, "last_seen": an_hour_ago}],
+        )
+
+    def test_presence_rejects_invalid_ids(self):
+        for ids in ("", "1,a", ",".join(map(str, range(1, 202)))):
+            response = self.client.get("/api/auth/presence/", {"ids": ids})
+            self.assertEqual(response.status_code, 400, ids)
@@ -0,0 +1,212 @@
+"""
+프로필 이미지 업로드 핸들러
+
+업로드를 메모리나 임시 파일에 모으지 않고 청크 단위로 스토리지에 바로 기록한다.
+기록하면서 SHA-256을 계산해 완료 시 내용 주소 기반 경로로 옮긴다 (같은 이미지는 한 번만 저장).
+첫 청크에서 매직 바이트와 헤더에 선언된 크기를 확인해서 허용되지 않은 포맷,
+MAX_UPLOAD_SIZE 초과, 압축 폭탄(픽셀 수 과다) 업로드는 나머지를 읽기 전에 중단한다.
+해시 경로로 옮긴 뒤 요청 검증이나 저장이 실패해 참조되지 않은 원본은 gc_avatars가 정리한다.
+"""
+
+import hashlib
+import io
+import os
+import uuid
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from PIL import Image
+from rest_framework import serializers
+from rest_framework.exceptions import APIException
+
+from apps.core.storage import get_avatar_storage
+
+# 매직 바이트 -> (Pillow 포맷, 저장 확장자)
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "PNG", "png"),
+    (b"GIF87a", "GIF", "gif"),
+    (b"GIF89a", "GIF", "gif"),
+)
+
+# 헤더에서 이미지 크기를 찾을 때까지 버퍼링할 최대 bytes (EXIF 등 포함)
+HEADER_BUFFER_LIMIT = 256 * 1024
+
+
+class UploadTooLarge(APIException):
+    status_code = 413
+    default_detail = "업로드 가능한 파일 크기를 초과했습니다."
+    default_code = "upload_too_large"
+
+
+class StoredUploadedFile(UploadedFile):
+    """
+    업로드 중 이미 스토리지에 저장된 파일
+    storage_name으로 모델 필드에 바로 연결하면 다시 저장하지 않는다
+    """
+
+    def __init__(self, storage_name, **kwargs):
+        super().__init__(**kwargs)
+        self.storage_name = storage_name
+
+    def open(self, mode="rb"):
+        if self.file is None or self.file.closed:
+            self.file = get_avatar_storage().open(self.storage_name, mode)
+        else:
+            self.file.seek(0)
+        return self
+
+    def read(self, *args, **kwargs):
+        return self.open().file.read(*args, **kwargs)
+
+
+class AvatarUploadHandler(FileUploadHandler):
+    """
+    avatar 필드 전용 스트리밍 업로드 핸들러
+    다른 필드는 다음 핸들러(기본 핸들러)로 넘긴다
+    """
+
+    field_name = "avatar"
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.active = False
+        self.request_length = None
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        self.request_length = content_length
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        if field_name != self.field_name:
+            self.active = False
+            return
+
+        # 요청 전체 크기가 이미 한도를 넘으면 본문을 읽기 전에 중단
+        if self.request_length and self.request_length > self.max_request_size():
+            raise UploadTooLarge()
+        if self.content_length and self.content_length > settings.MAX_UPLOAD_SIZE:
+            raise UploadTooLarge()
+
+        self.active = True
+        self.received = 0
+        self.header = b""
+        self.image_format = None
+        self.storage_name = None
+        self.destination = None
+        self.digest = hashlib.sha256()
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.active:
+            return raw_data
+
+        self.received += len(raw_data)
+        if self.received > settings.MAX_UPLOAD_SIZE:
+            self.abort()
+            raise UploadTooLarge()
+
+        if self.destination is None:
+            self.header += raw_data
+            if self.inspect_header(final=False):
+                self.open_destination()
+                self.write(self.header)
+                self.header = b""
+        else:
+            self.write(raw_data)
+        return None
+
+    def file_complete(self, file_size):
+        if not self.active:
+            return None
+        self.active = False
+
+        # 헤더 버퍼보다 작은 파일은 여기서 검사
+        if self.destination is None:
+            self.inspect_header(final=True)
+            self.open_destination()
+            self.write(self.header)
+        self.destination.close()
+        self.destination = None
+
+        # 임시 경로 -> avatars/<해시 앞 2자리>/<해시>.<확장자>
+        self.storage_name = self.storage.promote(
+            self.storage_name,
+            f"avatars/upload.{self.extension}",
+            self.digest.hexdigest(),
+        )
+
+        return StoredUploadedFile(
+            self.storage_name,
+            name=self.storage_name.rsplit("/", 1)[-1],
+            content_type=Image.MIME[self.image_format],
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_interrupted(self):
+        if self.active:
+            self.abort()
+
+    def max_request_size(self):
+        """파일 외 폼 필드를 고려한 요청 전체 크기 한도"""
+        return settings.MAX_UPLOAD_SIZE + 64 * 1024
+
+    def inspect_header(self, final):
+        """매직 바이트와 헤더에 선언된 이미지 크기 검사 (크기를 알 수 없으면 False)"""
+        if self.image_format is None:
+            if len(self.header) < 8 and not final:
+                return False
+            for signature, image_format, extension in IMAGE_SIGNATURES:
+                if self.header.startswith(signature):
+                    self.image_format = image_format
+                    self.extension = extension
+                    break
+            else:
+                self.reject("jpg, png, gif 이미지만 업로드할 수 있습니다.")
+
+        try:
+            # Image.open은 헤더만 읽고 픽셀 버퍼는 할당하지 않는다
+            image = Image.open(io.BytesIO(self.header), formats=[self.image_format])
+            width, height = image.size
+        except Image.DecompressionBombError:
+            self.reject("이미지 해상도가 너무 큽니다.")
+        except Exception:
+            if final or len(self.header) > HEADER_BUFFER_LIMIT:
+                self.reject("이미지 파일을 읽을 수 없습니다.")
+            return False
+
+        if width * height > settings.AVATAR_MAX_PIXELS:
+            self.reject("이미지 해상도가 너무 큽니다.")
+        return True
+
+    def open_destination(self):
+        """스토리지의 임시 경로에 쓰기용 파일 열기"""
+        self.storage = get_avatar_storage()
+        self.storage_name = f"avatars/tmp/{uuid.uuid4().hex}.{self.extension}"
+        if isinstance(self.storage, FileSystemStorage):
+            # 로컬 파일시스템 스토리지는 디렉터리를 직접 만들어야 함
+            os.makedirs(self.storage.path("avatars/tmp"), exist_ok=True)
+        self.destination = self.storage.open(self.storage_name, "wb")
+
+    def write(self, data):
+        self.digest.update(data)
+        self.destination.write(data)
+
+    def reject(self, message):
+        """업로드 중단 후 검증 오류 응답"""
+        self.abort()
+        raise serializers.ValidationError({self.field_name: [message]})
+
+    def abort(self):
+        """기록 중이던 파일 정리"""
+        self.active = False
+        if self.destination is not None:
+            self.destination.close()
+            self.storage.delete(self.storage_name)
+            self.destination = None
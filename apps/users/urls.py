@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
 from . import views
 
@@ -22,9 +22,19 @@ urlpatterns = [
         views.ResendEmailVerificationView.as_view(),
         name="email_resend",
     ),
+    # 개인 데이터 내보내기
+    path("export/", views.DataExportView.as_view(), name="data_export"),
+    path(
+        "export/<int:pk>/download/",
+        views.download_data_export,
+        name="data_export_download",
+    ),
+    # 보안 감사 로그 / 통계 (관리자)
+    path("audit/", views.audit_events, name="audit_events"),
+    path("stats/", views.login_stats, name="login_stats"),
+    # 접속 상태
+    path("presence/", views.user_presence, name="presence"),
     # 유틸리티
     path("check-email/", views.check_email_availability, name="check_email"),
     path("delete-account/", views.delete_account, name="delete_account"),
-    # 소셜 로그인 (django-allauth)
-    path("social/", include("allauth.urls")),
 ]
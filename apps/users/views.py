@@ -1,25 +1,41 @@
 from rest_framework import status, generics, permissions
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
+from django.apps import apps
 from django.contrib.auth import login
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
+import ipaddress
 import uuid
 
-from .models import User, EmailVerificationToken
+from apps.core.http import make_etag, not_modified_response, set_cache_validators
+from apps.core.media import storage_file_response
+from apps.core.storage import get_export_storage
+
+from .analytics import active_users, daily_active_users, record_login, signup_counts
+from .audit import client_ip, record_event
+from .exports import delete_exports, schedule_export
+from .presence import last_seen_many
+from .models import AuditEvent, DataExport, User, UserProfile, EmailVerificationToken
 from .serializers import (
+    AuditEventSerializer,
+    DataExportSerializer,
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
-    UserBasicSerializer,
     PasswordChangeSerializer,
     EmailVerificationSerializer,
+    user_basic_reader,
+    user_profile_reader,
 )
+from .uploads import AvatarUploadHandler
 
 
 class UserRegistrationView(generics.CreateAPIView):
@@ -45,7 +61,7 @@ class UserRegistrationView(generics.CreateAPIView):
             {
                 "success": True,
                 "data": {
-                    "user": UserBasicSerializer(user).data,
+                    "user": user_basic_reader.serialize(user),
                     "message": "회원가입이 완료되었습니다. 이메일 인증을 완료해주세요.",
                 },
             },
@@ -105,7 +121,12 @@ class UserLoginView(TokenObtainPairView):
         serializer = UserLoginSerializer(
             data=request.data, context={"request": request}
         )
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            # 본문이 객체가 아니면(JSON 배열 등) 이메일 없이 기록
+            data = serializer.initial_data
+            email = data.get("email", "") if isinstance(data, dict) else ""
+            record_event(AuditEvent.LOGIN_FAILED, request, email=str(email)[:254])
+            raise ValidationError(serializer.errors)
 
         user = serializer.validated_data["user"]
 
@@ -116,14 +137,11 @@ class UserLoginView(TokenObtainPairView):
         user.last_login = timezone.now()
 
         # IP 주소 기록
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        user.last_login_ip = ip
+        user.last_login_ip = client_ip(request)
 
         user.save(update_fields=["last_login", "last_login_ip"])
+        record_event(AuditEvent.LOGIN, request, user)
+        record_login(user)
 
         return Response(
             {
@@ -131,7 +149,7 @@ class UserLoginView(TokenObtainPairView):
                 "data": {
                     "access": str(refresh.access_token),
                     "refresh": str(refresh),
-                    "user": UserBasicSerializer(user).data,
+                    "user": user_basic_reader.serialize(user),
                 },
                 "message": "로그인되었습니다.",
             },
@@ -147,16 +165,30 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     serializer_class = UserProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def initialize_request(self, request, *args, **kwargs):
+        # 프로필 이미지는 메모리/임시 파일을 거치지 않고 스토리지로 바로 스트리밍
+        if request.method in ("PUT", "PATCH"):
+            request.upload_handlers.insert(0, AvatarUploadHandler(request))
+        return super().initialize_request(request, *args, **kwargs)
+
     def get_object(self):
         return self.request.user
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-
-        return Response(
-            {"success": True, "data": serializer.data}, status=status.HTTP_200_OK
-        )
+        profile = load_profile(instance)
+
+        # 변경이 없으면 직렬화 없이 304
+        etag, last_modified = user_cache_validators(request, instance, profile)
+        response = not_modified_response(request, etag, last_modified)
+        if response is None:
+            data = user_profile_reader.serialize(
+                instance, context=self.get_serializer_context()
+            )
+            response = Response(
+                {"success": True, "data": data}, status=status.HTTP_200_OK
+            )
+        return set_cache_validators(response, etag, last_modified)
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
@@ -191,6 +223,7 @@ class PasswordChangeView(APIView):
 
         # 비밀번호 변경
         serializer.save()
+        record_event(AuditEvent.PASSWORD_CHANGE, request, request.user)
 
         return Response(
             {"success": True, "message": "비밀번호가 변경되었습니다."},
@@ -211,11 +244,12 @@ class EmailVerificationView(APIView):
 
         # 이메일 인증 처리
         user = serializer.save()
+        record_event(AuditEvent.EMAIL_VERIFIED, request, user)
 
         return Response(
             {
                 "success": True,
-                "data": {"user": UserBasicSerializer(user).data},
+                "data": {"user": user_basic_reader.serialize(user)},
                 "message": "이메일 인증이 완료되었습니다.",
             },
             status=status.HTTP_200_OK,
@@ -241,6 +275,7 @@ class ResendEmailVerificationView(APIView):
         # 이메일 인증 재발송
         registration_view = UserRegistrationView()
         registration_view.send_email_verification(user)
+        record_event(AuditEvent.EMAIL_RESEND, request, user)
 
         return Response(
             {"success": True, "message": "인증 이메일이 재발송되었습니다."},
@@ -248,6 +283,192 @@ class ResendEmailVerificationView(APIView):
         )
 
 
+class DataExportView(APIView):
+    """
+    개인 데이터 내보내기 API
+    GET: 최근 내보내기 상태 / POST: 내보내기 요청 (백그라운드에서 생성)
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        export = request.user.data_exports.order_by("-created_at").first()
+        data = (
+            DataExportSerializer(export, context={"request": request}).data
+            if export
+            else None
+        )
+        return Response({"success": True, "data": data}, status=status.HTTP_200_OK)
+
+    def post(self, request):
+        serializer = DataExportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # 진행 중인 내보내기가 있으면 새로 만들지 않음
+        export = (
+            request.user.data_exports.filter(
+                status__in=[DataExport.STATUS_PENDING, DataExport.STATUS_RUNNING]
+            )
+            .order_by("-created_at")
+            .first()
+        )
+        if export is None:
+            export = serializer.save(user=request.user)
+            schedule_export(export)
+
+        return Response(
+            {
+                "success": True,
+                "data": DataExportSerializer(export, context={"request": request}).data,
+                "message": "데이터 내보내기를 준비하고 있습니다.",
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def download_data_export(request, pk):
+    """
+    개인 데이터 내보내기 파일 다운로드 (Range 요청으로 이어받기 지원)
+    """
+    export = request.user.data_exports.filter(
+        pk=pk, status=DataExport.STATUS_DONE
+    ).first()
+    if export is None:
+        return Response(
+            {"success": False, "message": "내보내기 파일을 찾을 수 없습니다."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    content_type = (
+        "application/zip"
+        if export.format == DataExport.FORMAT_ZIP
+        else "application/json"
+    )
+    return storage_file_response(
+        request, get_export_storage(), export.file, content_type, export.filename
+    )
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAdminUser])
+def audit_events(request):
+    """
+    보안 감사 로그 조회 API (관리자)
+    ?user=<사용자 ID> 또는 ?ip=<IP 주소>, 최신순. 다음 페이지는 ?before=<마지막 id>
+    """
+    user_id = request.query_params.get("user")
+    ip = request.query_params.get("ip")
+    try:
+        if user_id:
+            events = AuditEvent.objects.for_user(int(user_id))
+        elif ip:
+            events = AuditEvent.objects.from_ip(str(ipaddress.ip_address(ip)))
+        else:
+            raise ValueError
+        limit = min(int(request.query_params.get("limit", 100)), 1000)
+        before = request.query_params.get("before")
+        if before:
+            events = events.filter(pk__lt=int(before))
+    except ValueError:
+        return Response(
+            {"success": False, "message": "user 또는 ip 조건을 올바르게 입력해주세요."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    data = AuditEventSerializer(events[:limit], many=True).data
+    return Response(
+        {
+            "success": True,
+            "data": {
+                "events": data,
+                "next_before": data[-1]["id"] if len(data) == limit else None,
+            },
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAdminUser])
+def login_stats(request):
+    """
+    가입/로그인 통계 API (관리자)
+    ?days=<기간, 기본 30일> 동안의 일별 가입자 수(제공자/언어별), 일별 활성 사용자, 기간 내 고유 활성 사용자
+    """
+    try:
+        days = min(max(int(request.query_params.get("days", 30)), 1), 366)
+    except ValueError:
+        return Response(
+            {"success": False, "message": "days는 숫자로 입력해주세요."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    end = timezone.localdate()
+    start = end - timedelta(days=days - 1)
+
+    return Response(
+        {
+            "success": True,
+            "data": {
+                "start": start,
+                "end": end,
+                "signups": list(signup_counts(start, end)),
+                "daily_active_users": [
+                    {"date": date, "users": users, "logins": logins}
+                    for date, users, logins in daily_active_users(start, end)
+                ],
+                "active_users": active_users(start, end),
+            },
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
+# users.id(BigAutoField)의 최댓값 - 넘는 값은 DB에서 오류가 나므로 요청 검증에서 거름
+MAX_USER_ID = 2**63 - 1
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def user_presence(request):
+    """
+    접속 상태 조회 API
+    ?ids=1,2,3 (최대 PRESENCE_MAX_IDS명)의 접속 여부와 마지막 접속 시각. 없는 사용자는 결과에서 제외
+    """
+    try:
+        ids = {int(pk) for pk in request.query_params.get("ids", "").split(",") if pk}
+    except ValueError:
+        ids = None
+    if ids and not all(0 < pk <= MAX_USER_ID for pk in ids):
+        ids = None
+    if not ids or len(ids) > settings.PRESENCE_MAX_IDS:
+        return Response(
+            {
+                "success": False,
+                "message": f"ids에 사용자 ID를 {settings.PRESENCE_MAX_IDS}개까지 "
+                "쉼표로 구분해 입력해주세요.",
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    online_since = timezone.now() - timedelta(seconds=settings.PRESENCE_ONLINE_SECONDS)
+    return Response(
+        {
+            "success": True,
+            "data": [
+                {
+                    "id": pk,
+                    "online": last_seen is not None and last_seen >= online_since,
+                    "last_seen": last_seen,
+                }
+                for pk, last_seen in sorted(last_seen_many(ids).items())
+            ],
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
 @api_view(["POST"])
 @permission_classes([permissions.AllowAny])
 def check_email_availability(request):
@@ -262,7 +483,7 @@ def check_email_availability(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    is_available = not User.objects.filter(email=email).exists()
+    is_available = not User.objects.alive().filter(email=email).exists()
 
     return Response(
         {
@@ -302,10 +523,19 @@ def delete_account(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # 계정 삭제 (소프트 삭제 방식)
-    user.is_active = False
-    user.email = f"deleted_{user.id}_{user.email}"
-    user.save()
+    # 계정 삭제 (소프트 삭제 - 보관 기간 후 purge_deleted_accounts가 영구 삭제)
+    with transaction.atomic():
+        user.is_active = False
+        user.deleted_at = timezone.now()
+        user.save(update_fields=["is_active", "deleted_at", "updated_at"])
+        # 소셜 계정 연결 해제 - allauth가 탈퇴 계정을 찾지 않고 같은 소셜 계정으로 다시 가입됨
+        if apps.is_installed("allauth.socialaccount"):
+            from allauth.socialaccount.models import SocialAccount
+
+            SocialAccount.objects.filter(user=user).delete()
+    record_event(AuditEvent.ACCOUNT_DELETED, request, user)
+    # 내보내기 파일은 보관 기간과 관계없이 바로 삭제
+    delete_exports(user.data_exports.all())
 
     return Response(
         {"success": True, "message": "계정이 삭제되었습니다."},
@@ -313,25 +543,59 @@ def delete_account(request):
     )
 
 
+def load_profile(user):
+    """프로필을 한 번 조회해 user.profile에 캐시 (없으면 None)"""
+    profile = UserProfile.objects.filter(user=user).first()
+    User._meta.get_field("profile").set_cached_value(user, profile)
+    return profile
+
+
+def user_cache_validators(request, user, profile=None):
+    """
+    응답을 만들지 않고 ETag / Last-Modified(timestamp) 계산
+    last_login은 updated_at을 갱신하지 않는 update_fields 저장으로 바뀌므로 함께 포함
+    프로필 이미지 URL은 build_absolute_uri로 만들므로 요청 스킴/호스트도 포함
+    """
+    timestamps = [user.updated_at, user.last_login]
+    if profile is not None:
+        timestamps.append(profile.updated_at)
+    etag = make_etag(
+        request.accepted_renderer.format,
+        request.build_absolute_uri("/"),
+        user.pk,
+        *timestamps,
+    )
+    last_modified = max(value for value in timestamps if value is not None)
+    return etag, last_modified.timestamp()
+
+
 @api_view(["GET"])
 @permission_classes([permissions.AllowAny])
 def auth_status(request):
     """
     인증 상태 확인 API
     """
-    if request.user.is_authenticated:
-        return Response(
+    user = request.user
+    if not user.is_authenticated:
+        etag = make_etag(request.accepted_renderer.format, None)
+        response = not_modified_response(request, etag) or Response(
+            {"success": True, "data": {"is_authenticated": False, "user": None}},
+            status=status.HTTP_200_OK,
+        )
+        return set_cache_validators(response, etag)
+
+    # 기본 사용자 정보만 응답하므로 프로필은 조회하지 않음
+    etag, last_modified = user_cache_validators(request, user)
+    response = not_modified_response(request, etag, last_modified)
+    if response is None:
+        response = Response(
             {
                 "success": True,
                 "data": {
                     "is_authenticated": True,
-                    "user": UserBasicSerializer(request.user).data,
+                    "user": user_basic_reader.serialize(user),
                 },
             },
             status=status.HTTP_200_OK,
         )
-    else:
-        return Response(
-            {"success": True, "data": {"is_authenticated": False, "user": None}},
-            status=status.HTTP_200_OK,
-        )
+    return set_cache_validators(response, etag, last_modified)
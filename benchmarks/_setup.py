@@ -0,0 +1,26 @@
+"""
+벤치마크 공통 설정
+
+각 벤치마크는 `uv run python -m benchmarks.<이름>` 으로 실행한다.
+"""
+
+import os
+import time
+
+import django
+
+
+def setup_django():
+    """Django 설정 로딩"""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    django.setup()
+
+
+def timeit(func, repeat=5):
+    """func를 repeat번 실행해 가장 빠른 실행 시간(초) 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
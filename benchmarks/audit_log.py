@@ -0,0 +1,74 @@
+"""
+보안 감사 로그 기록 비용 벤치마크
+
+로그인 요청 경로에서 이벤트 하나를 기록하는 시간을 동기 INSERT(AuditEvent.objects.create)와
+apps.users.audit.record_event(링 버퍼에 추가)로 비교하고, 버퍼를 bulk_create로 저장하는
+비용(응답 후 실행)을 이벤트당 시간으로 함께 출력한다.
+
+    uv run python -m benchmarks.audit_log
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+from django.test import RequestFactory  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from apps.users.audit import (  # noqa: E402
+    client_ip,
+    discard_events,
+    flush_events,
+    record_event,
+)
+from apps.users.models import AuditEvent, User  # noqa: E402
+
+EVENTS = 5000  # AUDIT_LOG_BUFFER_SIZE(기본 10000) 이하
+
+
+def main():
+    setup_test_environment()
+    DiscoverRunner(verbosity=0).setup_databases()
+    user = User.objects.create_user(
+        email="bench-audit@example.com", password="password123"
+    )
+    request = RequestFactory().post(
+        "/api/auth/login/", HTTP_USER_AGENT="bench", REMOTE_ADDR="10.0.0.1"
+    )
+
+    def insert():
+        for _ in range(EVENTS):
+            now = timezone.now()
+            AuditEvent.objects.create(
+                month=now.date().replace(day=1),
+                created_at=now,
+                event=AuditEvent.LOGIN,
+                user_id=user.pk,
+                ip=client_ip(request),
+                user_agent=request.META["HTTP_USER_AGENT"],
+            )
+
+    def record():
+        discard_events()
+        for _ in range(EVENTS):
+            record_event(AuditEvent.LOGIN, request, user)
+
+    def record_and_flush():
+        record()
+        flush_events()
+
+    sync = timeit(insert, repeat=3) / EVENTS
+    buffered = timeit(record) / EVENTS
+    flushed = timeit(record_and_flush, repeat=3) / EVENTS - buffered
+    discard_events()
+
+    print(f"{'방식':<28} {'us/이벤트':>10}")
+    print(f"{'동기 INSERT (요청 경로)':<28} {sync * 1e6:>10.1f}")
+    print(f"{'record_event (요청 경로)':<28} {buffered * 1e6:>10.1f}")
+    print(f"{'bulk_create 저장 (응답 후)':<28} {flushed * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
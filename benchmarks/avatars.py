@@ -0,0 +1,77 @@
+"""
+프로필 이미지 파이프라인 벤치마크
+
+휴대폰 사진 크기(4032x3024)의 JPEG 원본과 썸네일별 전송 bytes,
+draft 모드 디코딩 유무에 따른 처리 시간을 비교한다.
+
+    uv run python -m benchmarks.avatars
+"""
+
+import io
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from apps.users.avatars import (  # noqa: E402
+    AVATAR_FORMATS,
+    decode_avatar,
+    render_avatar_variants,
+)
+
+
+def make_photo(width=4032, height=3024):
+    """노이즈와 그라데이션을 섞은 사진 유사 JPEG 생성"""
+    noise = Image.effect_noise((width, height), 40)
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge("RGB", (noise, gradient, Image.blend(noise, gradient, 0.5)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=92)
+    return buffer.getvalue()
+
+
+def decode_without_draft(data, max_size):
+    """draft 없이 전체 해상도로 디코딩 후 축소 (비교용)"""
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    side = min(image.size)
+    image = image.crop((0, 0, side, side))
+    return image.resize((max_size, max_size), Image.Resampling.LANCZOS)
+
+
+def main():
+    data = make_photo()
+    max_size = max(settings.AVATAR_SIZES)
+
+    print(f"원본: {len(data):,} bytes")
+    print()
+
+    full = timeit(lambda: decode_without_draft(data, max_size), repeat=3)
+    draft = timeit(lambda: decode_avatar(data, max_size), repeat=3)
+    pipeline = timeit(lambda: render_avatar_variants(data), repeat=3)
+    print(f"전체 해상도 디코딩 + 축소: {full * 1000:8.1f} ms")
+    print(f"draft 디코딩 + 축소:       {draft * 1000:8.1f} ms ({full / draft:.1f}x)")
+    print(f"전체 썸네일 생성:          {pipeline * 1000:8.1f} ms")
+    print()
+
+    variants = render_avatar_variants(data)
+    print(f"{'size':>6} {'format':>6} {'bytes':>10} {'원본 대비':>10}")
+    for size in settings.AVATAR_SIZES:
+        for fmt in AVATAR_FORMATS:
+            content = variants[(size, fmt)]
+            print(
+                f"{size:>6} {fmt:>6} {len(content):>10,} {len(data) / len(content):>9.0f}x"
+            )
+
+    default = variants[(settings.AVATAR_DEFAULT_SIZE, "jpeg")]
+    print()
+    print(
+        f"avatar_url 1회 렌더링당 전송량: {len(data):,} -> {len(default):,} bytes "
+        f"({len(data) / len(default):.0f}x 감소)"
+    )
+
+
+if __name__ == "__main__":
+    main()
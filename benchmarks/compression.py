@@ -0,0 +1,67 @@
+"""
+응답 압축 수준별 벤치마크
+
+API 응답(프로필 단건, 100건 목록)과 OpenAPI 스키마를 gzip/brotli 수준별로 압축해
+압축 후 bytes와 CPU 시간을 비교한다. CompressionMiddleware 기본값은 brotli 4 / gzip 6.
+
+    uv run python -m benchmarks.compression
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+import gzip  # noqa: E402
+
+from django.conf import settings  # noqa: E402
+
+from apps.core.http import brotli  # noqa: E402
+from apps.core.renderers import FastJSONRenderer  # noqa: E402
+from apps.users.serializers import user_profile_reader  # noqa: E402
+from benchmarks.json_rendering import make_user  # noqa: E402
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+
+
+def payloads():
+    renderer = FastJSONRenderer()
+    users = [make_user(i) for i in range(100)]
+    yield "프로필 단건", renderer.render(
+        {"success": True, "data": user_profile_reader.serialize(users[0])}
+    )
+    yield "프로필 100건", renderer.render(
+        {"success": True, "data": user_profile_reader.serialize(users, many=True)}
+    )
+    if settings.ENABLE_API_DOCS:
+        from apps.core.schema import generate_schema_documents
+
+        yield "OpenAPI 스키마", generate_schema_documents()["json"]
+
+
+def main():
+    codecs = [
+        (f"gzip {level}", lambda data, level=level: gzip.compress(data, level, mtime=0))
+        for level in GZIP_LEVELS
+    ]
+    if brotli is not None:
+        codecs += [
+            (f"br {quality}", lambda data, q=quality: brotli.compress(data, quality=q))
+            for quality in BROTLI_QUALITIES
+        ]
+
+    for label, data in payloads():
+        print(f"[{label}] {len(data):,} bytes")
+        print(f"{'codec':<8} {'bytes':>9} {'ratio':>7} {'time':>12} {'MB/s':>8}")
+        for name, codec in codecs:
+            size = len(codec(data))
+            seconds = timeit(lambda: codec(data), repeat=20)
+            print(
+                f"{name:<8} {size:>9,} {len(data) / size:>6.1f}x "
+                f"{seconds * 1e6:>9.1f} us {len(data) / seconds / 1e6:>8.1f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
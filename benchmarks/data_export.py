@@ -0,0 +1,109 @@
+"""
+개인 데이터 내보내기 메모리 벤치마크
+
+이메일 인증 이력이 1천/1만/10만 건인 계정을 ZIP으로 내보낼 때의 최대 메모리(tracemalloc)와 시간을
+뷰에서 전체를 메모리에 만드는 방식(list + json.dumps + BytesIO ZIP)과
+apps.users.exports(iterator + JSON 청크 + 스트리밍 ZIP 저장)로 비교한다.
+
+    uv run python -m benchmarks.data_export
+"""
+
+from benchmarks._setup import setup_django
+
+setup_django()
+
+import io  # noqa: E402
+import json  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+import zipfile  # noqa: E402
+
+from django.conf import settings  # noqa: E402
+from django.core.serializers.json import DjangoJSONEncoder  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from apps.users.exports import EXPORT_SECTIONS, process_export  # noqa: E402
+from apps.users.models import DataExport, EmailVerificationToken, User  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def add_tokens(user, count):
+    expires_at = timezone.now()
+    EmailVerificationToken.objects.bulk_create(
+        (
+            EmailVerificationToken(user=user, email=user.email, expires_at=expires_at)
+            for _ in range(count)
+        ),
+        batch_size=5000,
+    )
+
+
+def export_in_memory(user):
+    """비교 대상: 모든 섹션을 리스트로 읽고 메모리에서 ZIP 생성"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, rows, many in EXPORT_SECTIONS:
+            data = list(rows(user.pk))
+            document = data if many else (data[0] if data else None)
+            archive.writestr(
+                f"{name}.json", json.dumps(document, cls=DjangoJSONEncoder)
+            )
+    return buffer.getbuffer().nbytes
+
+
+def export_streaming(user):
+    export = DataExport.objects.create(user=user)
+    return process_export(export.pk).size
+
+
+def measure(func, user):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = func(user)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, peak
+
+
+def main():
+    setup_test_environment()
+    DiscoverRunner(verbosity=0).setup_databases()
+    user = User.objects.create_user(
+        email="bench-export@example.com", password="password123"
+    )
+
+    location = tempfile.TemporaryDirectory()
+    storages = {
+        **settings.STORAGES,
+        "exports": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": location.name},
+        },
+    }
+    print(
+        f"{'인증 이력':>10} {'방식':<10} {'ZIP bytes':>12} {'초':>7} {'최대 메모리':>12}"
+    )
+    with override_settings(STORAGES=storages), location:
+        total = 0
+        for count in SIZES:
+            add_tokens(user, count - total)
+            total = count
+            for label, func in (
+                ("메모리", export_in_memory),
+                ("스트리밍", export_streaming),
+            ):
+                size, elapsed, peak = measure(func, user)
+                print(
+                    f"{count:>10,} {label:<10} {size:>12,} {elapsed:>7.2f} "
+                    f"{peak / 2**20:>10.1f}MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+API 응답 렌더링 벤치마크
+
+UserProfileSerializer 응답 (단건 / 100건 목록)을 DRF 기본 JSONRenderer(stdlib json),
+FastJSONRenderer(orjson), MessagePackRenderer로 렌더링하는 시간과 bytes를 비교한다.
+시리얼라이저 실행 시간은 제외하고 렌더링/파싱만 측정한다.
+
+    uv run python -m benchmarks.json_rendering
+"""
+
+import datetime
+import io
+import uuid
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.core.parsers import FastJSONParser, MessagePackParser  # noqa: E402
+from apps.core.renderers import FastJSONRenderer, MessagePackRenderer  # noqa: E402
+from apps.users.models import User, UserProfile  # noqa: E402
+from apps.users.serializers import UserProfileSerializer  # noqa: E402
+
+
+def make_user(index, avatar=True):
+    """DB 없이 프로필까지 채운 사용자 인스턴스 생성"""
+    now = timezone.now()
+    user = User(
+        id=index + 1,
+        email=f"user{index}@example.com",
+        first_name="길동",
+        last_name="홍",
+        bio="노션 스타일 협업 도구를 사용하는 팀의 프로젝트 매니저입니다. " * 2,
+        avatar=(
+            f"avatars/{index % 256:02x}/{uuid.uuid4().hex * 2}.jpg" if avatar else ""
+        ),
+        avatar_hash=uuid.uuid4().hex if avatar else "",
+        is_email_verified=True,
+        social_provider="google" if index % 2 else None,
+        date_joined=now,
+        created_at=now,
+        updated_at=now,
+    )
+    user.profile = UserProfile(
+        user=user,
+        phone_number="010-1234-5678",
+        birth_date=datetime.date(1990, 1, 1),
+    )
+    return user
+
+
+def main():
+    single = {"success": True, "data": UserProfileSerializer(make_user(0)).data}
+    many = {
+        "success": True,
+        "data": UserProfileSerializer(
+            [make_user(i) for i in range(100)], many=True
+        ).data,
+    }
+
+    renderers = [
+        ("JSONRenderer (json)", JSONRenderer(), JSONParser()),
+        ("FastJSONRenderer (orjson)", FastJSONRenderer(), FastJSONParser()),
+        ("MessagePackRenderer", MessagePackRenderer(), MessagePackParser()),
+    ]
+    context = {"encoding": "utf-8"}
+
+    for label, payload in (("단건", single), ("100건 목록", many)):
+        print(f"[{label}]")
+        print(f"{'renderer':<28} {'bytes':>9} {'render':>12} {'parse':>12}")
+        baseline = None
+        for name, renderer, parser in renderers:
+            body = renderer.render(payload, renderer.media_type, {})
+            render = timeit(lambda: renderer.render(payload, renderer.media_type, {}))
+            parse = timeit(lambda: parser.parse(io.BytesIO(body), None, context))
+            baseline = baseline or render
+            print(
+                f"{name:<28} {len(body):>9,} {render * 1e6:>9.1f} us "
+                f"{parse * 1e6:>9.1f} us  ({baseline / render:.1f}x)"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+가입/로그인 대시보드 쿼리 벤치마크
+
+사용자 수(1만/10만)를 늘려 가며 최근 30일 가입자 수(날짜/제공자/언어별), 일별 활성 사용자, MAU를
+users 테이블 스캔(created_at/last_login GROUP BY)과 apps.users.analytics 집계 테이블로 비교한다.
+집계 테이블은 backfill_rollups로 채우며, 로그인 1건을 집계에 넣는 비용(record_login)도 출력한다.
+
+    uv run python -m benchmarks.login_rollups
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+import random  # noqa: E402
+from datetime import timedelta  # noqa: E402
+
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db.models import Count, F  # noqa: E402
+from django.db.models.functions import TruncDate  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from apps.users.analytics import (  # noqa: E402
+    active_users,
+    backfill_rollups,
+    daily_active_users,
+    discard_rollups,
+    record_login,
+    signup_counts,
+)
+from apps.users.models import User  # noqa: E402
+
+SIZES = (10_000, 100_000)
+DAYS = 365
+PROVIDERS = ("", "", "google", "kakao", "naver")
+
+
+def add_users(start, count):
+    random.seed(start)
+    now = timezone.now()
+    password = make_password("password123")
+    users = []
+    for index in range(start, start + count):
+        created_at = now - timedelta(seconds=random.randrange(DAYS * 86400))
+        users.append(
+            User(
+                email=f"bench-rollup-{index}@example.com",
+                password=password,
+                social_provider=random.choice(PROVIDERS),
+                language=random.choice(("ko", "en")),
+                date_joined=created_at,
+                last_login=created_at + (now - created_at) * random.random(),
+            )
+        )
+    User.objects.bulk_create(users, batch_size=5000)
+    # created_at은 auto_now_add라 bulk_create로 지정할 수 없음
+    User.objects.filter(pk__in=[user.pk for user in users]).update(
+        created_at=F("date_joined")
+    )
+
+
+def scan_queries(start, end):
+    users = User.objects.all()
+    list(
+        users.filter(created_at__date__range=(start, end))
+        .annotate(day=TruncDate("created_at"))
+        .values("day", "social_provider", "language")
+        .annotate(count=Count("id"))
+    )
+    list(
+        users.filter(last_login__date__range=(start, end))
+        .annotate(day=TruncDate("last_login"))
+        .values("day")
+        .annotate(count=Count("id"))
+    )
+    users.filter(last_login__date__range=(start, end)).count()
+
+
+def rollup_queries(start, end):
+    list(signup_counts(start, end))
+    daily_active_users(start, end)
+    active_users(start, end)
+
+
+def main():
+    setup_test_environment()
+    DiscoverRunner(verbosity=0).setup_databases()
+    end = timezone.localdate()
+    start = end - timedelta(days=29)
+
+    print(f"{'사용자':>8} {'users 스캔 ms':>14} {'집계 테이블 ms':>15}")
+    total = 0
+    for size in SIZES:
+        add_users(total, size - total)
+        total = size
+        backfill_rollups(chunk_size=5000)
+        scan = timeit(lambda: scan_queries(start, end))
+        rollup = timeit(lambda: rollup_queries(start, end))
+        print(f"{size:>8,} {scan * 1e3:>14.1f} {rollup * 1e3:>15.1f}")
+
+    user = User.objects.first()
+    per_login = timeit(lambda: [record_login(user) for _ in range(10000)]) / 10000
+    discard_rollups()
+    print(f"record_login: {per_login * 1e6:.1f} us/로그인")
+
+
+if __name__ == "__main__":
+    main()
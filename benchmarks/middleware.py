@@ -0,0 +1,100 @@
+"""
+미들웨어 체인 요청당 오버헤드 벤치마크
+
+settings.MIDDLEWARE 전체 체인을 빈 뷰 앞에 두고 /api/ 요청 한 건의 처리 시간을 잰다.
+SESSION_FREE_API=False(기존: 세션/CSRF/인증/메시지 처리)와 True(세션 없는 API 경로)를
+세션 쿠키 없는 요청(JWT 클라이언트)과 세션 쿠키가 있는 요청(브라우저)으로 비교한다.
+쿠키가 있는 요청은 기존 SessionAuthentication처럼 뷰에서 request.user를 확인한다.
+
+    uv run python -m benchmarks.middleware
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.sessions.backends.db import SessionStore  # noqa: E402
+from django.core.handlers.base import BaseHandler  # noqa: E402
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory, override_settings  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from apps.users.models import User  # noqa: E402
+
+REQUESTS = 2000
+PATH = "/api/auth/status/"
+
+
+def view(request):
+    user = getattr(request, "user", None)
+    if user is not None and request.COOKIES:
+        user.is_authenticated
+    return HttpResponse(b"{}", content_type="application/json")
+
+
+class BenchHandler(BaseHandler):
+    """URL 해석 없이 view를 호출하는 핸들러 (process_view 훅은 실행)"""
+
+    def _get_response(self, request):
+        for middleware_method in self._view_middleware:
+            response = middleware_method(request, view, (), {})
+            if response:
+                return response
+        return view(request)
+
+
+def make_handler(middleware):
+    with override_settings(MIDDLEWARE=middleware):
+        handler = BenchHandler()
+        handler.load_middleware()
+    return handler
+
+
+def session_cookie():
+    user = User.objects.create_user(
+        email="bench-middleware@example.com", password="password123"
+    )
+    session = SessionStore()
+    session["_auth_user_id"] = str(user.pk)
+    session["_auth_user_backend"] = "django.contrib.auth.backends.ModelBackend"
+    session["_auth_user_hash"] = user.get_session_auth_hash()
+    session.create()
+    return {settings.SESSION_COOKIE_NAME: session.session_key}
+
+
+def per_request(handler, cookies):
+    factory = RequestFactory()
+
+    def run():
+        for _ in range(REQUESTS):
+            request = factory.get(PATH)
+            request.COOKIES.update(cookies)
+            handler.get_response(request)
+
+    return timeit(run) / REQUESTS
+
+
+def main():
+    setup_test_environment()
+    DiscoverRunner(verbosity=0).setup_databases()
+    cookies = session_cookie()
+
+    baseline = per_request(make_handler([]), {})
+    print(f"미들웨어 없음: {baseline * 1e6:.1f} us/req")
+    print(f"{'체인':<18} {'쿠키':<6} {'us/req':>8} {'미들웨어':>10}")
+    for session_free in (False, True):
+        label = "세션 없는 API" if session_free else "전체 (기존)"
+        with override_settings(SESSION_FREE_API=session_free):
+            handler = make_handler(settings.MIDDLEWARE)
+            for cookie_label, request_cookies in (("없음", {}), ("세션", cookies)):
+                seconds = per_request(handler, request_cookies)
+                print(
+                    f"{label:<18} {cookie_label:<6} {seconds * 1e6:>8.1f} "
+                    f"{(seconds - baseline) * 1e6:>7.1f} us"
+                )
+
+
+if __name__ == "__main__":
+    main()
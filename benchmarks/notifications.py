@@ -0,0 +1,134 @@
+"""
+공지 알림 fan-out 벤치마크
+
+활성 사용자 1만/10만 명에게 공지를 보낼 때의 시간, 쿼리 수, 최대 메모리(tracemalloc)를
+사용자마다 프로필을 읽고 템플릿을 렌더링해 알림/발송함을 한 건씩 저장하는 방식과
+apps.notifications.dispatch(pk 순서 묶음 + JOIN 한 번 + 언어/시간대별 렌더링 1회 + bulk_create)로 비교한다.
+
+    uv run python -m benchmarks.notifications
+"""
+
+from benchmarks._setup import setup_django
+
+setup_django()
+
+import random  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from apps.notifications.dispatch import dispatch, render_message  # noqa: E402
+from apps.notifications.models import Delivery, Notification  # noqa: E402
+from apps.users.models import User, UserProfile  # noqa: E402
+
+SIZES = (10_000, 100_000)
+TIMEZONES = ("Asia/Seoul", "Asia/Seoul", "UTC", "America/New_York")
+
+
+def add_users(start, count):
+    random.seed(start)
+    password = make_password("password123")
+    users = User.objects.bulk_create(
+        (
+            User(
+                email=f"bench-notify-{index}@example.com",
+                password=password,
+                language=random.choice(("ko", "ko", "en")),
+                timezone=random.choice(TIMEZONES),
+            )
+            for index in range(start, start + count)
+        ),
+        batch_size=5000,
+    )
+    UserProfile.objects.bulk_create(
+        (
+            UserProfile(user=user, email_notifications=random.random() > 0.2)
+            for user in users
+        ),
+        batch_size=5000,
+    )
+
+
+def dispatch_per_user(context, dedup_key):
+    """비교 대상: 사용자마다 프로필 조회, 렌더링, 알림/발송함 저장"""
+    for user in User.objects.alive().filter(is_active=True):
+        message = render_message("announcement", context, user.language, user.timezone)
+        Notification.objects.create(
+            user=user,
+            event="announcement",
+            title=message.subject,
+            body=message.body,
+            dedup_key=dedup_key,
+        )
+        profile = UserProfile.objects.filter(user=user).first()
+        if profile is None or profile.email_notifications:
+            Delivery.objects.create(
+                channel="email",
+                user=user,
+                dedup_key=dedup_key,
+                payload={
+                    "to": user.email,
+                    "subject": message.subject,
+                    "body": message.body,
+                },
+            )
+
+
+def measure(fn):
+    queries = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    with connection.execute_wrapper(count):
+        fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, queries, peak
+
+
+def main():
+    # DEBUG면 bulk INSERT SQL이 connection.queries에 쌓여 메모리 측정을 가림
+    setup_test_environment(debug=False)
+    DiscoverRunner(verbosity=0).setup_databases()
+    context = {"title": "점검 안내", "message": "오늘 밤 점검이 있습니다."}
+
+    print(
+        f"{'사용자':>8} {'방식':<10} {'시간 s':>8} {'쿼리':>8} {'최대 메모리 MB':>15}"
+    )
+    total = 0
+    for size in SIZES:
+        add_users(total, size - total)
+        total = size
+        context["sent_at"] = timezone.now()
+        for name, fn in (
+            ("사용자별", lambda: dispatch_per_user(context, f"per-user-{size}")),
+            (
+                "fan-out",
+                lambda: dispatch(
+                    "announcement",
+                    context=context,
+                    dedup_key=f"fanout-{size}",
+                    channels=["in_app", "email"],
+                ),
+            ),
+        ):
+            elapsed, queries, peak = measure(fn)
+            print(
+                f"{size:>8,} {name:<10} {elapsed:>8.2f} {queries:>8,} "
+                f"{peak / 2**20:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+접속 상태(presence) 벤치마크
+
+- 요청당 비용: 인증된 요청마다 users.last_seen을 UPDATE하는 방식과
+  apps.users.presence.touch(간격 내 반복은 dict 조회만, 간격마다 캐시 쓰기 2번)를 비교
+- 묶음 반영: 사용자 1만/10만 명의 접속 기록을 compact_presence로 users에 반영하는 시간
+- 조회: 사용자 200명의 접속 상태를 한 번에 조회하는 시간 (캐시 get_many + 쿼리 1번)
+
+    uv run python -m benchmarks.presence
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+import time  # noqa: E402
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from apps.users.presence import (  # noqa: E402
+    compact_presence,
+    last_seen_many,
+    presence_cache,
+    reset_touches,
+    touch,
+)
+from apps.users.models import User  # noqa: E402
+
+SIZES = (10_000, 100_000)
+REQUESTS = 10_000
+
+
+def main():
+    setup_test_environment(debug=False)
+    # Redis처럼 항목 수 제한이 없는 공유 캐시 (기본 LocalSharedCache는 300개에서 정리함)
+    override_settings(
+        CACHES={
+            **settings.CACHES,
+            "presence": {
+                "BACKEND": "apps.core.cache.LocalSharedCache",
+                "LOCATION": "presence",
+                "OPTIONS": {"MAX_ENTRIES": 10**7},
+            },
+        },
+        PRESENCE_CACHE="presence",
+    ).enable()
+    DiscoverRunner(verbosity=0).setup_databases()
+    password = make_password("password123")
+    User.objects.bulk_create(
+        (
+            User(email=f"bench-presence-{index}@example.com", password=password)
+            for index in range(max(SIZES))
+        ),
+        batch_size=5000,
+    )
+    pks = list(User.objects.order_by("pk").values_list("pk", flat=True))
+    user_id = pks[0]
+
+    def update_per_request():
+        for _ in range(REQUESTS):
+            User.objects.filter(pk=user_id).update(last_seen=timezone.now())
+
+    def touch_per_request():
+        for _ in range(REQUESTS):
+            touch(user_id)
+
+    def touch_every_time():
+        for _ in range(REQUESTS):
+            reset_touches()
+            touch(user_id)
+
+    print(f"{'요청당 비용':<24} {'us':>8}")
+    for name, fn in (
+        ("users UPDATE", update_per_request),
+        ("touch (간격 내)", touch_per_request),
+        ("touch (캐시 쓰기)", touch_every_time),
+    ):
+        print(f"{name:<24} {timeit(fn, repeat=3) / REQUESTS * 1e6:>8.2f}")
+
+    print(f"\n{'접속 사용자':>10} {'compact_presence s':>19} {'행/초':>10}")
+    for size in SIZES:
+        presence_cache().clear()
+        reset_touches()
+        for pk in pks[:size]:
+            touch(pk)
+        started = time.perf_counter()
+        updated = compact_presence(chunk_size=1000)
+        elapsed = time.perf_counter() - started
+        print(f"{size:>10,} {elapsed:>19.2f} {updated / elapsed:>10,.0f}")
+
+    batch = pks[:200]
+    print(
+        f"\n접속 상태 200명 조회: {timeit(lambda: last_seen_many(batch)) * 1e3:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+컴파일된 시리얼라이저 벤치마크
+
+UserBasicSerializer / UserProfileSerializer의 .data와 컴파일된 시리얼라이저의
+객체당 직렬화 시간을 단건, many=True(1,000건) 목록으로 비교한다.
+avatar_url/avatar_urls 프로퍼티의 URL 생성 비용은 양쪽이 같으므로 프로필 이미지가 없는
+사용자로 측정한다 (시리얼라이저 자체 비용만 비교).
+
+    uv run python -m benchmarks.serializers
+"""
+
+from benchmarks._setup import setup_django, timeit
+
+setup_django()
+
+from benchmarks.json_rendering import make_user  # noqa: E402
+from apps.users.serializers import (  # noqa: E402
+    UserBasicSerializer,
+    UserProfileSerializer,
+    user_basic_reader,
+    user_profile_reader,
+)
+
+
+def main():
+    user = make_user(0, avatar=False)
+    users = [make_user(i, avatar=False) for i in range(1000)]
+
+    cases = [
+        ("UserBasicSerializer", UserBasicSerializer, user_basic_reader),
+        ("UserProfileSerializer", UserProfileSerializer, user_profile_reader),
+    ]
+    print(f"{'serializer':<24} {'':>8} {'DRF':>12} {'compiled':>12} {'':>7}")
+    for name, serializer_class, reader in cases:
+        single_drf = timeit(lambda: serializer_class(user).data, repeat=200)
+        single = timeit(lambda: reader.serialize(user), repeat=200)
+        many_drf = timeit(lambda: serializer_class(users, many=True).data) / len(users)
+        many = timeit(lambda: reader.serialize(users, many=True)) / len(users)
+        print(
+            f"{name:<24} {'단건':>8} {single_drf * 1e6:>9.1f} us {single * 1e6:>9.1f} us "
+            f"({single_drf / single:.0f}x)"
+        )
+        print(
+            f"{'':<24} {'객체당*':>8} {many_drf * 1e6:>9.1f} us {many * 1e6:>9.1f} us "
+            f"({many_drf / many:.0f}x)"
+        )
+    print()
+    print(f"* many=True {len(users):,}건 목록 직렬화 시간 / {len(users):,}")
+
+
+if __name__ == "__main__":
+    main()
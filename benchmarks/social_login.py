@@ -0,0 +1,128 @@
+"""
+소셜 로그인 콜백 경로 벤치마크
+
+로컬 HTTP 서버로 카카오 OAuth(토큰/프로필 API)를 흉내내고, 기존 소셜 사용자의
+/api/auth/social/kakao/login/callback/ 요청 처리 시간과 쿼리 수를 allauth 기본 어댑터와
+apps.users.adapters.SocialAccountAdapter(SocialApp 조회 보관, 바뀐 값만 저장)로 비교한다.
+
+    uv run python -m benchmarks.social_login
+"""
+
+from benchmarks._setup import setup_django
+
+setup_django()
+
+import json  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+from urllib.parse import parse_qs, urlparse  # noqa: E402
+
+from allauth.socialaccount.models import SocialAccount  # noqa: E402
+from allauth.socialaccount.providers.kakao.views import (  # noqa: E402
+    KakaoOAuth2Adapter,
+)
+from django.db import connection  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from apps.users.models import User  # noqa: E402
+
+LOGINS = 200
+KAKAO_ID = 4242
+ADAPTERS = {
+    "allauth 기본": "allauth.socialaccount.adapter.DefaultSocialAccountAdapter",
+    "SocialAccountAdapter": "apps.users.adapters.SocialAccountAdapter",
+}
+
+
+class MockKakaoHandler(BaseHTTPRequestHandler):
+    """카카오 토큰/사용자 정보 API 대역"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_json({"access_token": "token", "token_type": "bearer"})
+
+    def do_GET(self):
+        self.send_json(
+            {
+                "id": KAKAO_ID,
+                "kakao_account": {
+                    "email": "kakao@example.com",
+                    "profile": {"nickname": "카카오"},
+                },
+            }
+        )
+
+    def send_json(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_mock_provider():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockKakaoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    KakaoOAuth2Adapter.authorize_url = f"{base}/oauth/authorize"
+    KakaoOAuth2Adapter.access_token_url = f"{base}/oauth/token"
+    KakaoOAuth2Adapter.profile_url = f"{base}/v2/user/me"
+    return server
+
+
+def create_social_user():
+    user = User.objects.create_user(
+        email="kakao@example.com",
+        password="password123",
+        first_name="카카오",
+        last_name="김",
+        social_provider="kakao",
+        social_id=str(KAKAO_ID),
+        is_email_verified=True,
+    )
+    SocialAccount.objects.create(user=user, provider="kakao", uid=str(KAKAO_ID))
+
+
+def login_once(client):
+    """로그인 시작 후 콜백 처리 (콜백 시간, 쿼리 수) 반환"""
+    response = client.post("/api/auth/social/kakao/login/")
+    state = parse_qs(urlparse(response["Location"]).query)["state"][0]
+
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        response = client.get(
+            "/api/auth/social/kakao/login/callback/", {"code": "code", "state": state}
+        )
+        elapsed = time.perf_counter() - started
+    assert response.status_code == 302, response.status_code
+    client.logout()
+    return elapsed, len(queries)
+
+
+def main():
+    setup_test_environment()
+    DiscoverRunner(verbosity=0).setup_databases()
+    start_mock_provider()
+    create_social_user()
+
+    print(f"{'어댑터':<22} {'ms/콜백':>8} {'쿼리':>5}")
+    for label, adapter in ADAPTERS.items():
+        with override_settings(SOCIALACCOUNT_ADAPTER=adapter):
+            client = Client()
+            login_once(client)  # 워밍업
+            results = [login_once(client) for _ in range(LOGINS)]
+        best = min(elapsed for elapsed, _ in results)
+        queries = results[-1][1]
+        print(f"{label:<22} {best * 1e3:>8.2f} {queries:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+실시간 알림 스트림(SSE) 동시 연결 부하 테스트
+
+ASGI 워커 하나(이벤트 루프 하나)에 사용자 1만 명이 /api/notifications/stream/ 으로 연결한 상태에서
+- 연결을 여는 시간과 연결당 메모리(RSS 증가분)
+- 유휴 상태(기본 SSE_HEARTBEAT_SECONDS)의 CPU 사용률과 하트비트 수
+- 1만 명 전체에 알림 하나씩 발행해 모두 받기까지의 시간
+- 연결을 모두 끊은 뒤 구독이 남지 않는지
+를 출력한다. 소켓/ASGI 서버 비용을 빼고 Django 미들웨어 + 뷰 + pub/sub 비용만 보도록
+config.asgi.application을 직접 호출한다.
+
+    uv run python -m benchmarks.sse_connections
+"""
+
+from benchmarks._setup import setup_django
+
+setup_django()
+
+import asyncio  # noqa: E402
+import time  # noqa: E402
+
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.test.runner import DiscoverRunner  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from rest_framework_simplejwt.tokens import AccessToken  # noqa: E402
+
+from apps.core.pubsub import get_pubsub  # noqa: E402
+from apps.notifications.channels import stream_channel  # noqa: E402
+from apps.users.models import User  # noqa: E402
+from config.asgi import application  # noqa: E402
+
+CONNECTIONS = 10_000
+IDLE_SECONDS = 30
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * 4096 / 2**20
+
+
+class Client:
+    """ASGI 서버 대신 연결 하나를 흉내 냄 (요청 본문 전송 후 끊을 때까지 대기)"""
+
+    def __init__(self, token, stats):
+        self.token = token
+        self.stats = stats
+        self.requested = False
+        self.disconnected = asyncio.Event()
+
+    def scope(self):
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/notifications/stream/",
+            "raw_path": b"/api/notifications/stream/",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", f"Bearer {self.token}".encode()),
+            ],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+
+    async def receive(self):
+        if not self.requested:
+            self.requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        body = message.get("body", b"")
+        if body.startswith(b"retry:"):
+            self.stats.count("opened")
+        elif body.startswith(b"data:"):
+            self.stats.count("events")
+        elif body.startswith(b":"):
+            self.stats.count("pings")
+
+    async def run(self):
+        await application(self.scope(), self.receive, self.send)
+
+
+class Stats:
+    def __init__(self):
+        self.counts = {"opened": 0, "events": 0, "pings": 0}
+        self.waiting = None
+
+    def count(self, name):
+        self.counts[name] += 1
+        if self.waiting and self.counts[self.waiting[0]] >= self.waiting[1]:
+            self.waiting[2].set()
+
+    async def wait_for(self, name, target):
+        if self.counts[name] < target:
+            done = asyncio.Event()
+            self.waiting = (name, target, done)
+            await done.wait()
+            self.waiting = None
+
+
+async def load_test(users):
+    stats = Stats()
+    clients = [Client(str(AccessToken.for_user(user)), stats) for user in users]
+
+    before = rss_mb()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(client.run()) for client in clients]
+    await stats.wait_for("opened", len(clients))
+    opened = time.perf_counter() - started
+    per_connection = (rss_mb() - before) * 1024 / len(clients)
+    print(
+        f"연결 {len(clients):,}개 열기: {opened:.1f}s, 연결당 {per_connection:.1f} KB"
+    )
+
+    cpu = time.process_time()
+    await asyncio.sleep(IDLE_SECONDS)
+    cpu = time.process_time() - cpu
+    print(
+        f"유휴 {IDLE_SECONDS}s: CPU {cpu / IDLE_SECONDS:.1%}, "
+        f"하트비트 {stats.counts['pings']:,}건"
+    )
+
+    started = time.perf_counter()
+    get_pubsub().publish_many(
+        (stream_channel(user.pk), {"id": "bench", "title": "공지"}) for user in users
+    )
+    await stats.wait_for("events", len(clients))
+    print(
+        f"알림 {len(clients):,}건 전달: {(time.perf_counter() - started) * 1e3:.0f} ms"
+    )
+
+    for client in clients:
+        client.disconnected.set()
+    await asyncio.gather(*tasks)
+    print(f"연결 종료 후 남은 구독: {get_pubsub().subscriber_count()}")
+
+
+def main():
+    setup_test_environment(debug=False)
+    DiscoverRunner(verbosity=0).setup_databases()
+    password = make_password("password123")
+    users = User.objects.bulk_create(
+        User(email=f"bench-sse-{index}@example.com", password=password)
+        for index in range(CONNECTIONS)
+    )
+    asyncio.run(load_test(users))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+정적 파일 서빙 벤치마크
+
+admin 로그인 페이지와 Swagger UI가 불러오는 에셋을 임시 STATIC_ROOT에 collectstatic하고,
+원본/gzip/brotli 전송 bytes와 django.views.static.serve 대비 whitenoise의 요청 처리량을 비교한다.
+(Swagger 에셋은 drf-spectacular[sidecar]가 설치된 경우에만 포함)
+
+    uv run python -m benchmarks.static_assets
+"""
+
+import os
+import tempfile
+import time
+
+os.environ["DEBUG"] = "False"  # 해시 URL 사용, whitenoise autorefresh 끔
+os.environ["SERVE_STATIC"] = "True"
+os.environ["API_DOCS_SELF_HOSTED"] = "True"
+
+from benchmarks._setup import setup_django  # noqa: E402
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+
+settings.STATIC_ROOT = tempfile.mkdtemp(prefix="staticfiles-")
+
+from django.contrib.staticfiles.storage import staticfiles_storage  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.http import HttpResponse  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.views.static import serve  # noqa: E402
+from whitenoise.middleware import WhiteNoiseMiddleware  # noqa: E402
+
+ADMIN_ASSETS = [
+    "admin/css/base.css",
+    "admin/css/dark_mode.css",
+    "admin/css/login.css",
+    "admin/css/nav_sidebar.css",
+    "admin/css/responsive.css",
+    "admin/js/theme.js",
+]
+SWAGGER_ASSETS = [
+    "drf_spectacular_sidecar/swagger-ui-dist/swagger-ui.css",
+    "drf_spectacular_sidecar/swagger-ui-dist/swagger-ui-bundle.js",
+    "drf_spectacular_sidecar/swagger-ui-dist/swagger-ui-standalone-preset.js",
+]
+
+
+def file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else None
+
+
+def requests_per_second(handler, requests, seconds=1.0):
+    """seconds 동안 requests를 번갈아 처리해 초당 요청 수 반환 (응답 본문까지 소비)"""
+    count = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for request in requests:
+            response = handler(request)
+            b"".join(response)
+            response.close()
+            count += 1
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    call_command("collectstatic", interactive=False, verbosity=0)
+
+    assets = [
+        name
+        for name in ADMIN_ASSETS + SWAGGER_ASSETS
+        if os.path.exists(os.path.join(settings.STATIC_ROOT, name))
+    ]
+
+    print(f"{'asset':<48} {'원본':>10} {'gzip':>10} {'br':>10}")
+    totals = [0, 0, 0]
+    for name in assets:
+        hashed = os.path.join(
+            settings.STATIC_ROOT, staticfiles_storage.stored_name(name)
+        )
+        sizes = [
+            file_size(hashed),
+            file_size(hashed + ".gz"),
+            file_size(hashed + ".br"),
+        ]
+        sizes = [size if size is not None else sizes[0] for size in sizes]
+        totals = [total + size for total, size in zip(totals, sizes)]
+        print(f"{name[-48:]:<48} {sizes[0]:>10,} {sizes[1]:>10,} {sizes[2]:>10,}")
+    print(f"{'합계':<48} {totals[0]:>10,} {totals[1]:>10,} {totals[2]:>10,}")
+    print()
+
+    factory = RequestFactory()
+    django_requests = [factory.get(settings.STATIC_URL + name) for name in assets]
+    whitenoise_requests = [
+        factory.get(
+            staticfiles_storage.url(name), HTTP_ACCEPT_ENCODING="gzip, deflate, br"
+        )
+        for name in assets
+    ]
+    whitenoise = WhiteNoiseMiddleware(lambda request: HttpResponse(status=404))
+
+    baseline = requests_per_second(
+        lambda request: serve(
+            request,
+            request.path.removeprefix(settings.STATIC_URL),
+            document_root=settings.STATIC_ROOT,
+        ),
+        django_requests,
+    )
+    optimized = requests_per_second(whitenoise, whitenoise_requests)
+    print(f"django.views.static.serve: {baseline:10,.0f} req/s (원본 전송)")
+    print(
+        f"whitenoise:                {optimized:10,.0f} req/s "
+        f"(brotli 사전 압축본, {optimized / baseline:.1f}x)"
+    )
+
+    response = whitenoise(whitenoise_requests[0])
+    print(f"해시 파일 Cache-Control: {response['Cache-Control']}")
+    response.close()
+
+
+if __name__ == "__main__":
+    main()
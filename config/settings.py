@@ -14,6 +14,16 @@ DEBUG = config("DEBUG", default=True, cast=bool)
 
 ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="localhost,127.0.0.1").split(",")
 
+# 프로세스 역할별 기능 스위치
+# API 전용 워커는 문서화/소셜 로그인 앱을 빼서 콜드 스타트 시 import 비용을 줄인다
+ENABLE_API_DOCS = config("ENABLE_API_DOCS", default=True, cast=bool)
+ENABLE_SOCIAL_LOGIN = config("ENABLE_SOCIAL_LOGIN", default=True, cast=bool)
+
+# 정적 파일을 whitenoise로 서빙 (해시 파일명 + 사전 압축, production 그룹)
+SERVE_STATIC = config("SERVE_STATIC", default=not DEBUG, cast=bool)
+# Swagger/ReDoc UI 에셋을 CDN 대신 정적 파일로 서빙 (drf-spectacular[sidecar])
+API_DOCS_SELF_HOSTED = config("API_DOCS_SELF_HOSTED", default=False, cast=bool)
+
 # Application definition
 DJANGO_APPS = [
     "django.contrib.admin",
@@ -29,34 +39,63 @@ THIRD_PARTY_APPS = [
     "rest_framework",
     "rest_framework_simplejwt",  # JWT 인증
     "corsheaders",
-    "drf_spectacular",  # API 문서화
     # allauth 관련
     "allauth",
     "allauth.account",
-    "allauth.socialaccount",
-    "allauth.socialaccount.providers.google",
-    "allauth.socialaccount.providers.kakao",
-    "allauth.socialaccount.providers.naver",
 ]
 
+if ENABLE_API_DOCS:
+    THIRD_PARTY_APPS += [
+        "drf_spectacular",  # API 문서화
+    ]
+    if API_DOCS_SELF_HOSTED:
+        THIRD_PARTY_APPS += ["drf_spectacular_sidecar"]
+
+if ENABLE_SOCIAL_LOGIN:
+    THIRD_PARTY_APPS += [
+        "allauth.socialaccount",
+        "allauth.socialaccount.providers.google",
+        "allauth.socialaccount.providers.kakao",
+        "allauth.socialaccount.providers.naver",
+    ]
+
 LOCAL_APPS = [
+    "apps.core",  # 공통 인프라 (미들웨어, 관리 명령 등)
     "apps.users",  # 사용자 관리 앱
+    "apps.notifications",  # 알림 (앱 내 알림함/이메일/웹 푸시)
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
+    "apps.core.health.HealthCheckMiddleware",  # 헬스 체크는 나머지 미들웨어를 거치지 않음
+    "apps.core.perf.PerformanceMetricsMiddleware",  # 요청 단위 성능 계측
+    "apps.core.compression.CompressionMiddleware",  # brotli/gzip 응답 압축
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # 세션/CSRF/인증/메시지 미들웨어는 /api/ 요청에서 생략 (apps.core.routing)
+    "apps.core.routing.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "apps.core.routing.CsrfViewMiddleware",
+    "apps.core.routing.AuthenticationMiddleware",
+    "apps.core.routing.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",  # allauth 필요
+    "apps.core.profiling.SamplingProfilerMiddleware",  # 샘플링 프로파일러 (PROFILER_ENABLED)
 ]
 
+if SERVE_STATIC:
+    # SecurityMiddleware 바로 뒤 - 정적 파일 요청은 이후 미들웨어/URL 라우팅을 거치지 않음
+    MIDDLEWARE.insert(
+        MIDDLEWARE.index("django.middleware.security.SecurityMiddleware") + 1,
+        "whitenoise.middleware.WhiteNoiseMiddleware",
+    )
+
+# 세션 없는 API 경로 - JWT만 사용, 소셜 로그인(allauth) 흐름은 세션 필요
+SESSION_FREE_API = config("SESSION_FREE_API", default=True, cast=bool)
+SESSION_FREE_PATH_PREFIX = "/api/"
+SESSION_REQUIRED_PATH_PREFIXES = ["/api/auth/social/"]
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -121,22 +160,147 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 미디어 파일 서빙 (apps.core.media.serve_media)
+# MEDIA_ACCEL_REDIRECT: nginx internal location 접두사 (예: /_protected_media/)
+#   설정하면 파일 전송을 X-Accel-Redirect로 nginx(sendfile)에 넘긴다
+SERVE_MEDIA = config("SERVE_MEDIA", default=True, cast=bool)
+MEDIA_ACCEL_REDIRECT = config("MEDIA_ACCEL_REDIRECT", default="")
+MEDIA_CACHE_MAX_AGE = config("MEDIA_CACHE_MAX_AGE", default=3600, cast=int)
+
+# 파일 저장소
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    # SERVE_STATIC이면 collectstatic 시 해시 파일명 + gzip/brotli 압축본 생성
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if SERVE_STATIC
+            else "django.contrib.staticfiles.storage.StaticFilesStorage"
+        )
+    },
+    # 프로필 이미지 - 내용 해시 기반 파일명/중복 제거
+    # 운영 환경에서는 apps.core.storage.ContentAddressedS3Storage 사용
+    "avatars": {
+        "BACKEND": config(
+            "AVATAR_STORAGE_BACKEND",
+            default="apps.core.storage.ContentAddressedFileSystemStorage",
+        )
+    },
+    # 개인 데이터 내보내기 - MEDIA_ROOT 밖 비공개 경로 (다운로드는 인증된 API로만)
+    "exports": {
+        "BACKEND": config(
+            "DATA_EXPORT_STORAGE_BACKEND",
+            default="django.core.files.storage.FileSystemStorage",
+        ),
+        "OPTIONS": {
+            "location": config("DATA_EXPORT_ROOT", default=str(BASE_DIR / "exports"))
+        },
+    },
+}
+
+# 캐시 - 프로세스 내 LRU(L1) + 공유 캐시(L2)
+# CACHE_URL이 없으면 L2로 프로세스 내 대체 구현(LocalSharedCache) 사용
+CACHE_URL = config("CACHE_URL", default="")
+CACHE_VERSION = config("CACHE_VERSION", default=1, cast=int)  # 올리면 전체 키 무효화
+CACHES = {
+    "default": {
+        "BACKEND": "apps.core.cache.TieredCache",
+        "LOCATION": "default",
+        "VERSION": CACHE_VERSION,
+        "OPTIONS": {
+            "L2": "shared",
+            "L1_MAX_ENTRIES": config("CACHE_L1_MAX_ENTRIES", default=1000, cast=int),
+            "L1_TIMEOUT": config("CACHE_L1_TIMEOUT", default=5, cast=int),
+        },
+    },
+    "shared": (
+        {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": CACHE_URL,
+            "KEY_PREFIX": "taskflow",
+            "VERSION": CACHE_VERSION,
+        }
+        if CACHE_URL
+        else {
+            "BACKEND": "apps.core.cache.LocalSharedCache",
+            "LOCATION": "shared",
+            "VERSION": CACHE_VERSION,
+        }
+    ),
+}
+if not CACHE_URL:
+    # 접속 상태는 워커/관리 명령 프로세스가 함께 봐야 하므로 DB 캐시 사용
+    # (테이블은 users 마이그레이션이 만듦. 운영에서는 CACHE_URL의 Redis 사용)
+    CACHES["presence"] = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "presence_cache",
+        "VERSION": CACHE_VERSION,
+        "OPTIONS": {"MAX_ENTRIES": 1_000_000},
+    }
+
+# 실시간 pub/sub (apps.core.pubsub) - PUBSUB_URL이 없으면 프로세스 내 구현 사용
+# 알림을 발행하는 프로세스(관리 명령/WSGI 워커)와 SSE 연결을 가진 ASGI 워커가 다르면 Redis 필요
+PUBSUB_URL = config("PUBSUB_URL", default=CACHE_URL)
+PUBSUB = {
+    "BACKEND": (
+        "apps.core.pubsub.RedisPubSub" if PUBSUB_URL else "apps.core.pubsub.LocalPubSub"
+    ),
+    "OPTIONS": {"url": PUBSUB_URL} if PUBSUB_URL else {},
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# User.email은 탈퇴하지 않은 사용자끼리만 유니크 (부분 유니크 인덱스, MySQL은 생성 컬럼 유니크 인덱스)
+# 컬럼 단위 unique가 아니라서 나오는 경고 - 로그인 조회(UserManager.get_by_natural_key)도
+# 탈퇴 계정을 제외하므로 끈다
+SILENCED_SYSTEM_CHECKS = ["auth.W004"]
+
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-        "rest_framework.authentication.SessionAuthentication",
+        # JWT 인증 + 접속 상태 기록 (apps.users.presence)
+        "apps.users.authentication.PresenceJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",  # API 문서화
 }
+# SESSION_FREE_API=False면 이전처럼 API에서도 세션 인증 허용 (브라우저블 API/admin 로그인 세션)
+if not SESSION_FREE_API:
+    REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"].append(
+        "rest_framework.authentication.SessionAuthentication"
+    )
+
+# API 응답 포맷
+# FAST_JSON=False면 DRF 기본 (stdlib json) 렌더러/파서 사용
+# API_MSGPACK=True면 Accept/Content-Type: application/msgpack 요청/응답 지원 (msgpack 필요)
+if not config("FAST_JSON", default=True, cast=bool):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"][
+        0
+    ] = "rest_framework.renderers.JSONRenderer"
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"][0] = "rest_framework.parsers.JSONParser"
+if config("API_MSGPACK", default=False, cast=bool):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].insert(
+        1, "apps.core.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].insert(
+        1, "apps.core.parsers.MessagePackParser"
+    )
+
+if ENABLE_API_DOCS:
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"
 
 # JWT Settings
 SIMPLE_JWT = {
@@ -191,6 +355,7 @@ ACCOUNT_LOGIN_ON_EMAIL_CONFIRMATION = True
 # 소셜 계정 설정
 SOCIALACCOUNT_EMAIL_REQUIRED = True
 SOCIALACCOUNT_EMAIL_VERIFICATION = "none"  # 소셜 로그인은 이메일 인증 스킵
+SOCIALACCOUNT_ADAPTER = "apps.users.adapters.SocialAccountAdapter"
 
 # 소셜 로그인 제공자 설정
 SOCIALACCOUNT_PROVIDERS = {
@@ -230,6 +395,23 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
 }
 
+if API_DOCS_SELF_HOSTED:
+    SPECTACULAR_SETTINGS.update(
+        {
+            "SWAGGER_UI_DIST": "SIDECAR",
+            "SWAGGER_UI_FAVICON_HREF": "SIDECAR",
+            "REDOC_DIST": "SIDECAR",
+        }
+    )
+
+# whitenoise - 해시 파일명 파일은 1년 immutable, 그 외 파일의 캐시 시간
+WHITENOISE_MAX_AGE = config("WHITENOISE_MAX_AGE", default=3600, cast=int)
+
+# 사전 생성된 OpenAPI 스키마 저장 위치 (manage.py build_schema)
+OPENAPI_SCHEMA_DIR = config(
+    "OPENAPI_SCHEMA_DIR", default=str(BASE_DIR / "build" / "openapi")
+)
+
 # 프론트엔드 URL (이메일 인증 등에서 사용)
 FRONTEND_URL = config("FRONTEND_URL", default="http://localhost:3000")
 
@@ -246,5 +428,170 @@ EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=True, cast=bool)
 EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
 
+# 헬스 체크 설정
+HEALTH_CHECK_LIVENESS_PATH = "/api/health/"
+HEALTH_CHECK_READINESS_PATH = "/api/health/ready/"
+HEALTH_CHECK_TIMEOUT = config(
+    "HEALTH_CHECK_TIMEOUT", default=2.0, cast=float
+)  # 프로브 타임아웃 (초)
+HEALTH_CHECK_CACHE_SECONDS = config(
+    "HEALTH_CHECK_CACHE_SECONDS", default=5.0, cast=float
+)
+
+# 성능 계측 설정
+PERF_METRICS_ENABLED = config("PERF_METRICS_ENABLED", default=True, cast=bool)
+PERF_SERVER_TIMING = config(
+    "PERF_SERVER_TIMING", default=DEBUG, cast=bool
+)  # 운영 환경에서는 끔
+PERF_QUERY_BUDGET = config(
+    "PERF_QUERY_BUDGET", default=20, cast=int
+)  # 요청당 쿼리 수 경고 기준
+PERF_METRICS_TOKEN = config("PERF_METRICS_TOKEN", default="")  # /api/metrics/ 접근 토큰
+# 토큰 없이 /api/metrics/ 에 접근할 수 있는 대역 (쉼표 구분 CIDR, 예: 10.0.0.0/8)
+# 토큰과 대역이 모두 비어 있으면 DEBUG에서만 공개
+PERF_METRICS_ALLOWED_NETWORKS = [
+    network
+    for network in config("PERF_METRICS_ALLOWED_NETWORKS", default="").split(",")
+    if network
+]
+
+# 응답 압축 (apps.core.compression.CompressionMiddleware)
+COMPRESSION_ENABLED = config("COMPRESSION_ENABLED", default=True, cast=bool)
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+COMPRESSION_BROTLI_QUALITY = config("COMPRESSION_BROTLI_QUALITY", default=4, cast=int)
+COMPRESSION_GZIP_LEVEL = config("COMPRESSION_GZIP_LEVEL", default=6, cast=int)
+COMPRESSION_CONTENT_TYPES = [
+    "application/json",
+    "application/vnd.oai.openapi",
+    "application/vnd.oai.openapi+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+]
+# BREACH 대응 - 토큰을 응답 본문에 담는 뷰는 압축하지 않음
+COMPRESSION_EXEMPT_VIEWS = [
+    "users:login",
+    "users:token_refresh",
+]
+
+# 샘플링 프로파일러 설정 (manage.py profile_flamegraph로 집계)
+PROFILER_ENABLED = config("PROFILER_ENABLED", default=False, cast=bool)
+PROFILER_SAMPLE_RATE = config(
+    "PROFILER_SAMPLE_RATE", default=1000, cast=int
+)  # N개 중 1개, 0이면 끔
+PROFILER_TRIGGER_HEADER = (
+    "X-Profile-Request"  # 스태프 사용자가 보내면 해당 요청을 프로파일링
+)
+PROFILER_INTERVAL_MS = config("PROFILER_INTERVAL_MS", default=5.0, cast=float)
+PROFILER_OUTPUT_DIR = config("PROFILER_OUTPUT_DIR", default=str(BASE_DIR / "profiles"))
+PROFILER_MAX_FILES = config("PROFILER_MAX_FILES", default=500, cast=int)
+
 # 파일 업로드 설정
 MAX_UPLOAD_SIZE = config("MAX_UPLOAD_SIZE", default=10485760, cast=int)  # 10MB
+AVATAR_MAX_PIXELS = config(
+    "AVATAR_MAX_PIXELS", default=40_000_000, cast=int
+)  # 압축 폭탄 방지
+
+# 탈퇴 계정 영구 삭제 (purge_deleted_accounts)
+ACCOUNT_PURGE_RETENTION_DAYS = config(
+    "ACCOUNT_PURGE_RETENTION_DAYS", default=30, cast=int
+)
+ACCOUNT_PURGE_BATCH_SIZE = config(
+    "ACCOUNT_PURGE_BATCH_SIZE", default=1000, cast=int
+)  # DELETE 문 하나에서 삭제할 행 수
+ACCOUNT_PURGE_LEASE_SECONDS = (
+    300  # 워커가 이 시간 동안 진행이 없으면 다른 워커가 이어서 실행
+)
+ACCOUNT_PURGE_MAX_ATTEMPTS = config(
+    "ACCOUNT_PURGE_MAX_ATTEMPTS", default=5, cast=int
+)  # 실패/중단된 작업을 다시 실행하는 최대 횟수 (첫 실행 포함)
+
+# 보안 감사 로그 (apps.users.audit)
+AUDIT_LOG_BUFFER_SIZE = config(
+    "AUDIT_LOG_BUFFER_SIZE", default=10000, cast=int
+)  # 저장 전 보관할 최대 이벤트 수 (넘으면 오래된 것부터 버림)
+AUDIT_LOG_BATCH_SIZE = config(
+    "AUDIT_LOG_BATCH_SIZE", default=500, cast=int
+)  # 이만큼 모이면 저장 (bulk_create 한 번의 행 수)
+AUDIT_LOG_FLUSH_INTERVAL = config(
+    "AUDIT_LOG_FLUSH_INTERVAL", default=5, cast=int
+)  # 마지막 저장 후 이 시간(초)이 지나면 저장
+AUDIT_LOG_RETENTION_MONTHS = config("AUDIT_LOG_RETENTION_MONTHS", default=12, cast=int)
+TRUSTED_PROXY_COUNT = config(
+    "TRUSTED_PROXY_COUNT", default=0, cast=int
+)  # X-Forwarded-For를 붙이는 앞단 프록시 수 (0이면 헤더를 무시하고 REMOTE_ADDR 사용)
+
+# 가입/로그인 집계 (apps.users.analytics)
+ANALYTICS_FLUSH_INTERVAL = config(
+    "ANALYTICS_FLUSH_INTERVAL", default=10, cast=int
+)  # 마지막 저장 후 이 시간(초)이 지나면 집계 테이블에 합침
+
+# 접속 상태 (apps.users.presence) - 요청마다 DB에 쓰지 않고 공유 캐시에 기록
+PRESENCE_CACHE = "shared" if CACHE_URL else "presence"
+PRESENCE_TOUCH_INTERVAL = (
+    60  # 같은 사용자의 접속 기록은 프로세스당 이 간격(초)에 한 번만
+)
+PRESENCE_ONLINE_SECONDS = 300  # 마지막 접속이 이 시간(초) 안이면 접속 중
+PRESENCE_LOG_TTL = (
+    86400  # 캐시의 접속 기록 보관 시간 - compact_presence는 이보다 자주 실행
+)
+PRESENCE_MAX_IDS = 200  # 접속 상태 조회 API 한 번에 조회할 수 있는 사용자 수
+
+# 알림 (apps.notifications)
+# BATCH_SIZE: bulk_create/발송 한 묶음의 건수, CONCURRENCY: 채널별 동시 발송 스레드 수
+NOTIFICATION_CHANNELS = {
+    "in_app": {
+        "BACKEND": "apps.notifications.channels.InAppChannel",
+        "BATCH_SIZE": 1000,
+    },
+    "email": {
+        "BACKEND": "apps.notifications.channels.EmailChannel",
+        "BATCH_SIZE": 100,
+        "CONCURRENCY": config("NOTIFICATION_EMAIL_CONCURRENCY", default=4, cast=int),
+    },
+    "push": {
+        "BACKEND": "apps.notifications.channels.WebPushChannel",
+        "BATCH_SIZE": 200,
+        "CONCURRENCY": config("NOTIFICATION_PUSH_CONCURRENCY", default=16, cast=int),
+    },
+}
+NOTIFICATION_FANOUT_CHUNK_SIZE = config(
+    "NOTIFICATION_FANOUT_CHUNK_SIZE", default=2000, cast=int
+)  # fan-out 시 한 번에 읽을 받는 사람 수
+NOTIFICATION_MAX_ATTEMPTS = 5
+NOTIFICATION_SEND_LEASE_SECONDS = (
+    300  # 발송 워커가 이 시간 안에 끝내지 못하면 다른 워커가 다시 발송
+)
+WEBPUSH_VAPID_PRIVATE_KEY = config("WEBPUSH_VAPID_PRIVATE_KEY", default="")
+# 실시간 알림 스트림 (SSE, ASGI 전용)
+SSE_HEARTBEAT_SECONDS = (
+    15  # 이벤트가 없을 때 주석(: ping)을 보내는 간격 (프록시 유휴 타임아웃 방지)
+)
+SSE_QUEUE_SIZE = 64  # 연결별 밀린 이벤트 한도 (넘치면 overflow 이벤트 후 연결 종료)
+SSE_RETRY_MS = 3000  # 연결이 끊긴 브라우저가 다시 연결하기까지의 대기 시간
+SSE_TICKET_TTL = 30  # 스트림 연결용 일회용 티켓 유효 시간(초)
+SSE_TICKET_CACHE = PRESENCE_CACHE  # 티켓 저장소 (발급/연결 워커가 함께 보는 캐시)
+
+# 개인 데이터 내보내기 (apps.users.exports)
+DATA_EXPORT_ASYNC = config("DATA_EXPORT_ASYNC", default=True, cast=bool)
+DATA_EXPORT_TTL_DAYS = config(
+    "DATA_EXPORT_TTL_DAYS", default=7, cast=int
+)  # 완료된 파일 보관 기간
+DATA_EXPORT_LEASE_SECONDS = (
+    300  # 워커가 이 시간 동안 진행이 없으면 다른 워커가 이어서 실행
+)
+DATA_EXPORT_MAX_ATTEMPTS = config(
+    "DATA_EXPORT_MAX_ATTEMPTS", default=5, cast=int
+)  # 실패/중단된 작업을 다시 실행하는 최대 횟수 (첫 실행 포함)
+
+# 프로필 이미지 썸네일 설정
+AVATAR_SIZES = (64, 128, 256)
+AVATAR_DEFAULT_SIZE = 256  # avatar_url이 반환하는 크기
+AVATAR_PROCESS_ASYNC = config("AVATAR_PROCESS_ASYNC", default=True, cast=bool)
+AVATAR_IMPORT_RETRY_SECONDS = (
+    86400  # 가져오지 못한 소셜 프로필 이미지 URL은 이 시간 동안 다시 받지 않음
+)
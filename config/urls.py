@@ -1,12 +1,7 @@
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 
 urlpatterns = [
     # 관리자 페이지
@@ -14,17 +9,47 @@ urlpatterns = [
     # API 경로들
     path("api/", include("api.urls")),  # 기존 API
     path("api/auth/", include("apps.users.urls")),  # 사용자 인증 API
-    # API 문서화
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
-        name="swagger-ui",
-    ),
-    path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path("api/notifications/", include("apps.notifications.urls")),  # 알림 API
 ]
 
-# 개발 환경에서 미디어 파일 서빙
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# 소셜 로그인 (django-allauth) - 비활성화된 워커에서는 URLConf를 import하지 않음
+# allauth는 이름공간 없는 URL 이름(kakao_callback 등)을 reverse하므로 users 이름공간 밖에 둔다
+if settings.ENABLE_SOCIAL_LOGIN:
+    urlpatterns += [
+        path("api/auth/social/", include("allauth.urls")),
+    ]
+
+# API 문서화 (API 전용 워커에서는 drf_spectacular를 import하지 않음)
+if settings.ENABLE_API_DOCS:
+    from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+
+    from apps.core.views import schema_view
+
+    urlpatterns += [
+        # 사전 생성된 스키마 (manage.py build_schema)
+        path("api/schema/", schema_view, name="schema"),
+        path(
+            "api/docs/",
+            SpectacularSwaggerView.as_view(url_name="schema"),
+            name="swagger-ui",
+        ),
+        path(
+            "api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"
+        ),
+    ]
+
+# 미디어 파일 서빙 (Range, 캐시 헤더, MEDIA_ACCEL_REDIRECT 지원)
+if settings.SERVE_MEDIA and settings.MEDIA_URL.startswith("/"):
+    from apps.core.media import serve_media
+
+    urlpatterns += [
+        re_path(
+            rf"^{settings.MEDIA_URL.lstrip('/')}(?P<path>.+)$",
+            serve_media,
+            name="media",
+        ),
+    ]
+
+# 개발 환경에서 정적 파일 서빙 (SERVE_STATIC이면 whitenoise가 처리)
+if settings.DEBUG and not settings.SERVE_STATIC:
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)